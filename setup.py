@@ -9,6 +9,8 @@ setup(
     install_requires=[
         "aiohttp>=3.8.0,<4.0.0",
         "beautifulsoup4>=4.14.0,<5.0.0", 
+        "lxml>=4.9.0,<6.0.0",
+        "orjson>=3.9.0,<4.0.0",
         "playwright>=1.56.0,<2.0.0",
         "SQLAlchemy>=2.0.0,<3.0.0",
         "pytest>=7.0.0,<8.0.0",
@@ -20,6 +22,9 @@ setup(
             "bandit>=1.7.0", 
             "safety>=3.0.0",
             "pytest-cov>=4.0.0",
-        ]
+        ],
+        "speedups": [
+            "uvloop>=0.18.0; sys_platform != 'win32'",
+        ],
     }
 )
@@ -3,41 +3,41 @@ import logging
 import re
 from bs4 import BeautifulSoup, Tag
 from src.application.services.html_parsing.i_html_block_parser import IHTMLBlockParser
+from src.domain.html_processing.pure_html_transforms import DOCUMENT_PARSER, decode_html
 
 logger = logging.getLogger(__name__)
 
+_PAGE_PARAM_RE = re.compile(r'page=(\d+)')
+
 
 class FIPIPageBlockParser(IHTMLBlockParser):
     def parse_blocks(self, page_content: str) -> List[List[Tag]]:
         logger.debug("Starting HTML block parsing.")
-        page_soup = BeautifulSoup(page_content, 'html.parser')
-
-        task_elements_by_id = {}
-
-        question_forms = page_soup.find_all('form', attrs={'name': True})
-        for form in question_forms:
-            form_name = form.get('name', '')
-            if form_name and form_name.startswith('qform'):
-                if form_name not in task_elements_by_id:
-                    task_elements_by_id[form_name] = []
-                task_elements_by_id[form_name].append(form)
-
-        if not task_elements_by_id:
-            all_divs = page_soup.find_all('div')
-            for div in all_divs:
-                div_id = div.get('id', '')
+        page_soup = BeautifulSoup(decode_html(page_content), DOCUMENT_PARSER)
+
+        # Один проход по дереву: формы qform* и div-ы q*/i* собираются одновременно,
+        # в порядке документа. Формы имеют приоритет, div-ы — запасной вариант.
+        forms_by_name = {}
+        divs_by_identifier = {}
+
+        for element in page_soup.find_all(('form', 'div')):
+            if element.name == 'form':
+                form_name = element.get('name') or ''
+                if form_name.startswith('qform'):
+                    forms_by_name.setdefault(form_name, []).append(element)
+            else:
+                div_id = element.get('id') or ''
                 if div_id.startswith('q') or div_id.startswith('i'):
-                    identifier = div_id[1:]
-                    if identifier not in task_elements_by_id:
-                        task_elements_by_id[identifier] = []
-                    task_elements_by_id[identifier].append(div)
+                    divs_by_identifier.setdefault(div_id[1:], []).append(element)
+
+        task_elements_by_id = forms_by_name or divs_by_identifier
 
         result_blocks = list(task_elements_by_id.values())
         logger.info(f"Found {len(result_blocks)} task blocks.")
         return result_blocks
 
     def get_total_pages(self, page_content: str) -> int:
-        soup = BeautifulSoup(page_content, 'html.parser')
+        soup = BeautifulSoup(decode_html(page_content), DOCUMENT_PARSER)
         pager = soup.find('div', class_='pager')
         if pager:
             page_links = pager.find_all('a')
@@ -45,7 +45,7 @@ class FIPIPageBlockParser(IHTMLBlockParser):
                 last_page = 1
                 for link in page_links:
                     href = link.get('href', '')
-                    page_match = re.search(r'page=(\d+)', href)
+                    page_match = _PAGE_PARAM_RE.search(href)
                     if page_match:
                         page_num = int(page_match.group(1)) + 1
                         if page_num > last_page:
@@ -33,7 +33,8 @@ class PageScrapingOrchestrator:
         base_url: str,
         timeout: int = 30,
         run_folder_page: Optional[Path] = None,
-        files_location_prefix: str = ""
+        files_location_prefix: str = "",
+        use_cache: bool = True
     ) -> PageScrapingResult:
         """
         Orchestrate page scraping with application-level concerns.
@@ -45,6 +46,7 @@ class PageScrapingOrchestrator:
             timeout: Timeout for operations in seconds.
             run_folder_page: Optional path for storing page assets.
             files_location_prefix: Prefix for file paths in problem entities.
+            use_cache: Whether a previously scraped result of an unchanged page may be reused.
 
         Returns:
             PageScrapingResult from domain service.
@@ -58,7 +60,8 @@ class PageScrapingOrchestrator:
                 base_url=base_url,
                 timeout=timeout,
                 run_folder_page=run_folder_page,
-                files_location_prefix=files_location_prefix
+                files_location_prefix=files_location_prefix,
+                use_cache=use_cache
             )
 
             logger.info(f"Page scraping completed: {len(result.problems)} problems, "
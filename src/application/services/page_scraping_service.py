@@ -1,26 +1,47 @@
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 """
 Application service for page scraping operations.
 
 Refactored to use dedicated components for each responsibility.
 """
+import asyncio
 import logging
+import random
+import sys
+from concurrent.futures import Executor
 from pathlib import Path
 
 from src.domain.interfaces.external_services.i_browser_service import IBrowserService
-from src.domain.interfaces.external_services.i_asset_downloader import IAssetDownloader
+from src.domain.interfaces.external_services.i_asset_downloader import IAssetDownloader, AssetSavedCallback
 from src.application.interfaces.factories.i_problem_factory import IProblemFactory
 from src.domain.value_objects.scraping.subject_info import SubjectInfo
-from src.application.services.html_block_processing_service import HTMLBlockProcessingService
-from src.application.services.html_parsing.i_html_block_parser import IHTMLBlockParser
 
-# Import components
-from src.infrastructure.services.page_scraping.components.iframe_handler import IframeHandler
-from src.infrastructure.services.page_scraping.components.content_fetcher import ContentFetcher
-from src.infrastructure.services.page_scraping.components.block_parser import BlockParser
+# Type-only imports: these modules pull in bs4 and the HTML processor chain,
+# which should not be loaded just to import this module.
+if TYPE_CHECKING:
+    from src.application.services.html_block_processing_service import HTMLBlockProcessingService
+    from src.application.services.html_parsing.i_html_block_parser import IHTMLBlockParser
+    from src.domain.interfaces.scraping.i_iframe_handler import IframeContent
 
 logger = logging.getLogger(__name__)
 
+# Resolve defaults from centralized configuration once, with graceful degradation
+try:
+    from src.core.config import config as _config
+    _DEFAULT_BASE_URL = getattr(_config.scraping, 'base_url', 'https://fipi.ru')
+    _DEFAULT_TIMEOUT = getattr(_config.browser, 'timeout_seconds', 30)
+except ImportError:
+    _DEFAULT_BASE_URL = 'https://fipi.ru'
+    _DEFAULT_TIMEOUT = 30
+
+# Fetch errors worth another attempt: timeouts and browser/network failures. Anything else
+# (e.g. a missing browser manager) will not go away on retry and is raised at once.
+try:
+    from playwright.async_api import Error as _PlaywrightError
+    _TRANSIENT_FETCH_ERRORS: Tuple[type, ...] = (asyncio.TimeoutError, _PlaywrightError)
+except ImportError:
+    _TRANSIENT_FETCH_ERRORS = (asyncio.TimeoutError,)
+
 
 class PageScrapingService:
     def __init__(
@@ -28,44 +49,113 @@ class PageScrapingService:
         browser_service: IBrowserService,
         asset_downloader_impl: IAssetDownloader,
         problem_factory: IProblemFactory,
-        html_block_processing_service: HTMLBlockProcessingService,
-        html_block_parser: Optional[IHTMLBlockParser] = None,
-        timeout: int = None
+        html_block_processing_service: 'HTMLBlockProcessingService',
+        html_block_parser: Optional['IHTMLBlockParser'] = None,
+        timeout: int = None,
+        max_concurrent_blocks: int = 8,
+        document_cache: Optional[Any] = None,
+        parse_executor: Optional[Executor] = None,
+        page_result_cache: Optional[Any] = None,
+        retry_attempts: int = 3,
+        retry_delay_seconds: float = 1
     ):
         """
         Initialize with dependencies and setup components.
+
+        document_cache, if given, is installed on the browser page so that page and
+        iframe documents are revalidated with conditional GET instead of refetched.
+
+        Page HTML is parsed into blocks on parse_executor (the loop's default thread pool
+        if None) so that parsing one page does not stall fetches and downloads of others.
+
+        page_result_cache, if given (a PageResultCache), short-circuits pages whose HTML is
+        unchanged since they were last scraped completely: their cached problems are
+        returned without parsing the page or downloading its assets again.
+
+        A page fetch that times out or fails with a browser/network error is tried up to
+        retry_attempts times in total, with exponential backoff between attempts
+        (retry_delay_seconds, doubled per attempt, plus jitter); other errors are not retried.
         """
         self.browser_service = browser_service
         self.asset_downloader_impl = asset_downloader_impl
         self.problem_factory = problem_factory
         self.html_block_processing_service = html_block_processing_service
         self.html_block_parser = html_block_parser
+        self.parse_executor = parse_executor
+        self.page_result_cache = page_result_cache
 
-        # Setup components
-        self.content_fetcher = ContentFetcher(browser_service)
+        # Setup components (imported here so that loading this module does not load bs4)
+        from src.infrastructure.services.page_scraping.components.iframe_handler import IframeHandler
+        from src.infrastructure.services.page_scraping.components.content_fetcher import ContentFetcher
+        from src.infrastructure.services.page_scraping.components.block_parser import BlockParser
+
+        self.content_fetcher = ContentFetcher(browser_service, response_cache=document_cache)
         self.iframe_handler = IframeHandler()
         self.block_parser = BlockParser(html_block_parser)
 
+        # Number of open start()/stop() sessions; while > 0 the browser page is kept alive
+        self._active_sessions = 0
+        # Guards content_fetcher's single page when several pages are scraped at once.
+        # Created on first use: on Python 3.9 asyncio primitives bind to the loop current at
+        # construction, and the service is built before asyncio.run() starts the real one.
+        self._navigation_lock: Optional[asyncio.Lock] = None
+        # Exception types already logged with a traceback in this session (see _should_trace)
+        self._traced_exception_types: Set[type] = set()
+
         # Use centralized configuration for timeout with graceful degradation
-        if timeout is not None:
-            self.timeout = timeout
-        else:
-            try:
-                from src.core.config import config
-                self.timeout = getattr(config.browser, 'timeout_seconds', 30)
-            except ImportError:
-                self.timeout = 30
+        self.timeout = timeout if timeout is not None else _DEFAULT_TIMEOUT
+
+        if max_concurrent_blocks <= 0:
+            raise ValueError("max_concurrent_blocks must be positive")
+        self.max_concurrent_blocks = max_concurrent_blocks
+
+        if retry_attempts <= 0:
+            raise ValueError("retry_attempts must be positive")
+        if retry_delay_seconds < 0:
+            raise ValueError("retry_delay_seconds cannot be negative")
+        self.retry_attempts = retry_attempts
+        self.retry_delay_seconds = retry_delay_seconds
+
+    async def start(self) -> None:
+        """Keep the browser and its page alive across scrape_page calls until stop()."""
+        if self._active_sessions == 0:
+            # A new session (one subject) reports the first traceback of each error type again
+            self._traced_exception_types.clear()
+        self._active_sessions += 1
+
+    async def stop(self) -> None:
+        """Close the session opened by start(); the last one releases the browser."""
+        self._active_sessions = max(self._active_sessions - 1, 0)
+        if self._active_sessions == 0:
+            await self.content_fetcher.cleanup_browser()
+
+    async def __aenter__(self) -> 'PageScrapingService':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+
+    def _should_trace(self, error: BaseException) -> bool:
+        """
+        Whether to log error with its traceback: only the first error of each type per
+        session is, repeats log the message alone, so error storms stay cheap and readable.
+        """
+        error_type = type(error)
+        if error_type in self._traced_exception_types:
+            return False
+        self._traced_exception_types.add(error_type)
+        return True
+
+    def _get_navigation_lock(self) -> asyncio.Lock:
+        """Lock serializing use of content_fetcher's browser page."""
+        if self._navigation_lock is None:
+            self._navigation_lock = asyncio.Lock()
+        return self._navigation_lock
 
     def _get_base_url(self, base_url: Optional[str]) -> str:
         """Get base URL from parameter or config with fallback."""
-        if base_url is not None:
-            return base_url
-
-        try:
-            from src.core.config import config
-            return getattr(config.scraping, 'base_url', 'https://fipi.ru')
-        except ImportError:
-            return 'https://fipi.ru'
+        return base_url if base_url is not None else _DEFAULT_BASE_URL
 
     def _create_processing_context(
         self, 
@@ -73,49 +163,102 @@ class PageScrapingService:
         url: str,
         run_folder_page: Path,
         files_location_prefix: str,
-        base_url: str
+        base_url: str,
+        on_asset_saved: AssetSavedCallback
     ) -> Dict[str, Any]:
-        """Create processing context for block processing."""
+        """
+        Create processing context for block processing.
+
+        Built once per page and shared by every block on it; only block_index varies
+        per block and is passed to process_block separately. Strings repeated across
+        pages are interned so every page context references the same objects.
+        """
         return {
             'run_folder_page': run_folder_page,
             'asset_downloader': self.asset_downloader_impl,
-            'base_url': base_url,
-            'files_location_prefix': files_location_prefix,
+            'base_url': sys.intern(base_url),
+            'files_location_prefix': sys.intern(files_location_prefix),
             'subject_info': subject_info,
             'source_url': url,
+            'on_asset_saved': on_asset_saved,
         }
 
+    async def _process_single_block(
+        self,
+        block_elements: List,
+        block_index: int,
+        context: Dict[str, Any],
+        url: str
+    ) -> Optional[Any]:
+        """Process one block; errors are logged and reported as None."""
+        try:
+            return await self.html_block_processing_service.process_block(
+                block_elements=block_elements,
+                block_index=block_index,
+                context=context
+            )
+        except Exception as e_block:
+            logger.error("Error processing grouped block %d on page %s: %s", block_index, url, e_block, exc_info=self._should_trace(e_block))
+            return None
+
     async def _process_blocks(
         self, 
         grouped_blocks: List, 
         context: Dict[str, Any],
-        url: str
-    ) -> List[Any]:
-        """Process all blocks and return problems."""
-        problems = []
+        url: str,
+        results: List[Optional[Any]]
+    ) -> None:
+        """
+        Process blocks concurrently, storing each result in its preallocated slot.
+
+        At most max_concurrent_blocks blocks are in flight, so their asset downloads
+        overlap instead of running back to back. The slots are owned by the caller:
+        results stay in block order, and problems collected before a timeout cancels
+        this coroutine are not lost.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_blocks)
+
+        async def process_into_slot(i: int, block_elements: List) -> None:
+            async with semaphore:
+                results[i] = await self._process_single_block(block_elements, i, context, url)
+
+        await asyncio.gather(*(
+            process_into_slot(i, block_elements) for i, block_elements in enumerate(grouped_blocks)
+        ))
+
+    async def _fetch_content(self, url: str, timeout: int) -> "IframeContent":
+        """Fetch page content and resolve the questions iframe if present."""
+        page_content, source_url = await self.content_fetcher.fetch_page_content(url, timeout)
 
-        for i, block_elements in enumerate(grouped_blocks):
+        page = await self.content_fetcher.get_page()
+        return await self.iframe_handler.handle_iframe_content(
+            page, url, timeout, page_content
+        )
+
+    async def _fetch_with_retry(self, url: str, timeout: int) -> "IframeContent":
+        """
+        Fetch the page, retrying transient failures with exponential backoff and jitter.
+
+        Each attempt gets its own budget for both navigations. Concurrent scrape_page calls
+        share one browser page, so only navigation is serialized; waiting for the page and
+        backing off do not hold the lock or count against the budget.
+        """
+        for attempt in range(1, self.retry_attempts + 1):
             try:
-                problem = await self.html_block_processing_service.process_block(
-                    block_elements=block_elements,
-                    block_index=i,
-                    context=context
+                async with self._get_navigation_lock():
+                    return await asyncio.wait_for(
+                        self._fetch_content(url, timeout),
+                        timeout=timeout * 2
+                    )
+            except _TRANSIENT_FETCH_ERRORS as e:
+                if attempt == self.retry_attempts:
+                    raise
+                delay = self.retry_delay_seconds * 2 ** (attempt - 1) + random.uniform(0, self.retry_delay_seconds)
+                logger.warning(
+                    "Fetching %s failed (attempt %d/%d): %r; retrying in %.1fs",
+                    url, attempt, self.retry_attempts, e, delay
                 )
-                if problem is not None:
-                    problems.append(problem)
-            except Exception as e_block:
-                logger.error(f"Error processing grouped block {i} on page {url}: {e_block}", exc_info=True)
-                continue
-
-        return problems
-
-    def _count_assets(self, run_folder_page: Path) -> int:
-        """Count assets in the page assets directory."""
-        page_assets_dir = run_folder_page / "assets"
-        if page_assets_dir.exists():
-            # Мы подсчитываем именно количество файлов в папке, чтобы получить 1 ассет, а не 10.
-            return sum(1 for _ in page_assets_dir.iterdir() if _.is_file())
-        return 0
+                await asyncio.sleep(delay)
 
     async def scrape_page(
         self,
@@ -124,53 +267,83 @@ class PageScrapingService:
         base_url: str = None,
         timeout: int = None,
         run_folder_page: Optional[Path] = None,
-        files_location_prefix: str = ""
+        files_location_prefix: str = "",
+        use_cache: bool = True
     ) -> Tuple[List[Any], int]:
         """
-        Scrape a single page and return Problem entities and the count of downloaded assets 
-        (counted via filesystem due to asset_downloader caching logic).
+        Scrape a single page and return Problem entities and the count of downloaded assets.
+
+        Assets are counted as processors report them through context['on_asset_saved'];
+        paths are deduplicated so an asset saved by several blocks counts once.
+
+        With use_cache=False (a forced re-scrape) page_result_cache is not consulted: the
+        page is parsed and its assets downloaded again, and the fresh result is cached.
         """
         # Resolve configuration
         actual_base_url = self._get_base_url(base_url)
         actual_timeout = timeout or self.timeout
         actual_run_folder = run_folder_page or Path(".")
 
-        assets_count = 0
+        saved_assets: Set[Path] = set()
 
-        logger.info(f"Scraping page: {url} for subject: {subject_info.official_name}")
+        logger.info("Scraping page: %s for subject: %s", url, subject_info.official_name)
 
         try:
-            # 1. Fetch page content using ContentFetcher
-            page_content, source_url = await self.content_fetcher.fetch_page_content(url, actual_timeout)
+            # 1-2. Fetch page content and iframe content, retrying transient failures
+            fetched = await self._fetch_with_retry(url, actual_timeout)
+            page_content, source_url = fetched.content, fetched.source_url
 
-            # 2. Handle iframe content using IframeHandler
-            page = await self.content_fetcher.get_page()
-            page_content, source_url = await self.iframe_handler.handle_iframe_content(
-                page, url, actual_timeout, page_content
-            )
+            content_hash = None
+            if self.page_result_cache is not None:
+                content_hash = self.page_result_cache.content_hash(page_content)
+                cached_problems = self.page_result_cache.load(url, content_hash) if use_cache else None
+                if cached_problems is not None:
+                    logger.info("Page %s is unchanged; reusing %d cached problems.", url, len(cached_problems))
+                    # Nothing was downloaded for this page in this run
+                    return cached_problems, 0
 
             # 3. Parse HTML blocks using BlockParser
-            grouped_blocks = self.block_parser.parse_html_blocks(page_content)
-            logger.debug(f"Found {len(grouped_blocks)} grouped blocks on page {url} (source {source_url}).")
+            grouped_blocks = await asyncio.get_running_loop().run_in_executor(
+                self.parse_executor, self.block_parser.parse_html_blocks, page_content
+            )
+            logger.debug("Found %d grouped blocks on page %s (source %s).", len(grouped_blocks), url, source_url)
 
-            # 4. Process blocks through HTMLBlockProcessingService
+            # 4. Process blocks through HTMLBlockProcessingService.
+            # Asset downloads have no timeout of their own, so the whole stage is bounded
+            # and a stuck block returns the problems collected so far instead of hanging.
             context = self._create_processing_context(
-                subject_info, url, actual_run_folder, files_location_prefix, actual_base_url
+                subject_info, url, actual_run_folder, files_location_prefix, actual_base_url,
+                on_asset_saved=saved_assets.add
             )
 
-            problems = await self._process_blocks(grouped_blocks, context, url)
+            results: List[Optional[Any]] = [None] * len(grouped_blocks)
+            try:
+                await asyncio.wait_for(
+                    self._process_blocks(grouped_blocks, context, url, results),
+                    timeout=actual_timeout * max(len(grouped_blocks), 1)
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Block processing timed out on page %s; returning partial results.", url)
+
+            problems = [problem for problem in results if problem is not None]
+
+            # Only a page whose every block produced a problem is cached, never partial results
+            if content_hash is not None and len(problems) == len(grouped_blocks):
+                self.page_result_cache.store(url, content_hash, problems)
 
-            # 5. Count assets (Filesystem counting restores functional reporting)
-            assets_count = self._count_assets(actual_run_folder)
-            logger.debug(f"Assets saved to {actual_run_folder / 'assets'}: {assets_count}")
+            # 5. Count assets reported by the processors
+            assets_count = len(saved_assets)
+            logger.debug("Assets saved to %s: %d", actual_run_folder / 'assets', assets_count)
 
             # Возвращаем проблемы И количество ассетов (кортеж из двух)
             return problems, assets_count
 
         except Exception as e:
-            logger.error(f"Failed to scrape page {url}: {e}", exc_info=True)
+            logger.error("Failed to scrape page %s: %s", url, e, exc_info=self._should_trace(e))
             # ВОЗВРАЩАЕМ КОРТЕЖ ИЗ ДВУХ ЭЛЕМЕНТОВ, чтобы избежать ValueError в адаптере
             return [], 0
         finally:
-            # Ensure browser resources are cleaned up
-            await self.content_fetcher.cleanup_browser()
+            # Outside of a start()/stop() session browser resources are released per page
+            if not self._active_sessions:
+                async with self._get_navigation_lock():
+                    await self.content_fetcher.cleanup_browser()
@@ -1,24 +1,23 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 """
 Functional core for scraping progress logic.
 
 This module contains pure functions that determine scraping progress based on
 existing problems and configuration, without any external dependencies or side effects.
 """
+import functools
+import re
+
 from src.domain.models.problem import Problem
 from src.application.value_objects.scraping.scraping_config import ScrapingConfig
 
 
-def extract_page_number_from_url(url: str) -> Optional[int]:
-    """
-    Extract page number from FIPI URL.
+_PAGE_PARAM_RE = re.compile(r'[?&]page=(\d+)(?=&|$)')
 
-    FIPI URLs use 0-based page numbering in query parameters like:
-    https://ege.fipi.ru/...&page=0 (page 1)
-    https://ege.fipi.ru/...&page=1 (page 2)
 
-    Returns 1-based page number or None if not found.
-    """
+@functools.lru_cache(maxsize=1)
+def _known_base_urls() -> Tuple[str, str]:
+    """Base URLs of FIPI pages, read from configuration once."""
     # Use centralized configuration for base URL detection
     try:
         from src.core.config import config
@@ -28,43 +27,65 @@ def extract_page_number_from_url(url: str) -> Optional[int]:
         # Fallback to hardcoded values if config is not available
         base_url = 'https://fipi.ru'
         browser_base_url = 'https://ege.fipi.ru'
+    return base_url, browser_base_url
 
-    if not url or ("&page=" not in url and "page=" not in url):
-        return None
 
-    # Check both base URLs
-    if not (url.startswith(base_url) or url.startswith(browser_base_url)):
+def extract_page_number_from_url(url: str) -> Optional[int]:
+    """
+    Extract page number from FIPI URL.
+
+    FIPI URLs use 0-based page numbering in query parameters like:
+    https://ege.fipi.ru/...&page=0 (page 1)
+    https://ege.fipi.ru/...&page=1 (page 2)
+
+    Returns 1-based page number or None if not found.
+    """
+    if not url:
         return None
 
-    try:
-        # Try different URL parameter patterns
-        if "&page=" in url:
-            page_param = url.split("&page=")[1].split("&")[0]
-        elif "?page=" in url:
-            page_param = url.split("?page=")[1].split("&")[0]
-        else:
-            return None
-
-        page_num = int(page_param)
-        return page_num + 1  # Convert 0-based to 1-based
-    except (ValueError, IndexError):
+    page_match = _PAGE_PARAM_RE.search(url)
+    if page_match is None or not url.startswith(_known_base_urls()):
         return None
 
+    return int(page_match.group(1)) + 1  # Convert 0-based to 1-based
+
+
+def get_highest_page_from_urls(source_urls: Iterable[str]) -> Optional[int]:
+    """
+    Return the highest 1-based page number referenced by the given source URLs,
+    or None if none of them is a FIPI page URL.
+    """
+    page_numbers = (extract_page_number_from_url(url) for url in source_urls if url)
+    return max((page_num for page_num in page_numbers if page_num is not None), default=None)
+
 
 def _get_highest_scraped_page(existing_problems: List[Problem]) -> Optional[int]:
     """
     Чистая функция для извлечения максимального 1-based номера страницы
     из списка существующих проблем.
     """
-    page_numbers = []
-    for problem in existing_problems:
-        # Проверяем наличие атрибута и его значение перед вызовом extract_page_number_from_url
-        if hasattr(problem, 'source_url') and problem.source_url:
-            page_num = extract_page_number_from_url(problem.source_url)
-            if page_num is not None:
-                page_numbers.append(page_num)
+    return get_highest_page_from_urls(problem.source_url for problem in existing_problems)
+
+
+def _explicit_start_page(config: ScrapingConfig) -> Optional[int]:
+    """Start page requested explicitly in config, or None to continue from stored progress."""
+    if config.start_page is None or config.start_page == "init":
+        return None
+    try:
+        return int(config.start_page)
+    except (ValueError, TypeError):
+        # Если невалидное значение, игнорируем его и продолжаем
+        return None
+
+
+def needs_scraping_history(config: ScrapingConfig) -> bool:
+    """
+    Whether the next page depends on what is already stored for the subject.
 
-    return max(page_numbers) if page_numbers else None
+    A forced restart or an explicit start page decides the next page on its own,
+    so the stored source URLs do not have to be queried at all.
+    """
+    return not config.force_restart and _explicit_start_page(config) is None
 
 
 def determine_next_page(
@@ -75,6 +96,26 @@ def determine_next_page(
     """
     Determine the next page to scrape based on existing problems and configuration.
 
+    Returns:
+        Page number to start scraping from (1-based)
+    """
+    highest_scraped_page = _get_highest_scraped_page(existing_problems) if existing_problems else None
+    return determine_next_page_from_highest(highest_scraped_page, config, highest_known_page)
+
+
+def determine_next_page_from_highest(
+    highest_scraped_page: Optional[int],
+    config: ScrapingConfig,
+    highest_known_page: Optional[int] = None
+) -> int:
+    """
+    Determine the next page to scrape from the highest page already scraped.
+
+    Args:
+        highest_scraped_page: Highest 1-based page found among stored problems, or None.
+        config: Scraping configuration (force_restart, start_page).
+        highest_known_page: Last page of the subject, if known.
+
     Returns:
         Page number to start scraping from (1-based)
     """
@@ -83,20 +124,11 @@ def determine_next_page(
         return 1
 
     # 2. СТРАТЕГИЯ: Явно заданная страница начала
-    if config.start_page is not None and config.start_page != "init":
-        try:
-            return int(config.start_page)
-        except (ValueError, TypeError):
-            # Если невалидное значение, игнорируем его и продолжаем
-            pass
-
-    # 3. СТРАТЕГИЯ: Нет существующих проблем
-    if not existing_problems:
-        return 1
-
-    # 4. СТРАТЕГИЯ: Продолжение скрейпинга (основной поток)
-    highest_scraped_page = _get_highest_scraped_page(existing_problems)
+    explicit_start_page = _explicit_start_page(config)
+    if explicit_start_page is not None:
+        return explicit_start_page
 
+    # 3. СТРАТЕГИЯ: Продолжение скрейпинга (основной поток)
     if highest_scraped_page is not None:
         next_page = highest_scraped_page + 1
 
@@ -106,5 +138,6 @@ def determine_next_page(
 
         return next_page
 
-    # 5. СТРАТЕГИЯ: Не удалось найти страницы (нет source_url или ошибка парсинга)
+    # 4. СТРАТЕГИЯ: Нет существующих проблем или не удалось найти страницы
+    # (нет source_url или ошибка парсинга)
     return 1  # Fallback, если не смогли найти номер страницы ни в одной проблеме
@@ -1,4 +1,4 @@
-from typing import Optional, TextIO
+from typing import List, Optional, TextIO
 """
 Service for reporting scraping progress to different outputs.
 
@@ -35,13 +35,16 @@ class ScrapingProgressReporter(IProgressReporter):
         """
         Report the start of scraping process.
         """
-        print(f"Starting scraping for subject: {subject_info.official_name}", file=self._output)
-        print(f"Configuration: force_restart={force_restart}", file=self._output)
+        lines = [
+            f"Starting scraping for subject: {subject_info.official_name}",
+            f"Configuration: force_restart={force_restart}",
+        ]
         if start_page and start_page != "init":
-            print(f"Starting from page: {start_page}", file=self._output)
+            lines.append(f"Starting from page: {start_page}")
         if max_pages:
-            print(f"Maximum pages: {max_pages}", file=self._output)
-        print("-" * 50, file=self._output)
+            lines.append(f"Maximum pages: {max_pages}")
+        lines.append("-" * 50)
+        self._write_lines(lines)
 
     def report_page_progress(
         self,
@@ -76,27 +79,33 @@ class ScrapingProgressReporter(IProgressReporter):
         """
         Report the final summary of the scraping process.
         """
-        print("\n" + "=" * 50, file=self._output)
-        print(f"Scraping Summary for {result.subject_name}", file=self._output)
-        print(f"Total pages processed: {result.total_pages}", file=self._output)
-        print(f"Total problems found: {result.total_problems_found}", file=self._output)
-        print(f"Total problems saved: {result.total_problems_saved}", file=self._output)
-
-        # Calculate assets total from page results
-        total_assets = sum(
-            page.get('assets_downloaded', 0) 
-            for page in result.page_results
-        )
-        print(f"Total assets downloaded: {total_assets}", file=self._output)
-
-        duration = result.end_time - result.start_time
-        print(f"Total duration: {duration.total_seconds():.2f}s", file=self._output)
+        lines = [
+            "\n" + "=" * 50,
+            f"Scraping Summary for {result.subject_name}",
+            f"Total pages processed: {result.total_pages}",
+            f"Total problems found: {result.total_problems_found}",
+            f"Total problems saved: {result.total_problems_saved}",
+            f"Total assets downloaded: {result.assets_downloaded}",
+            f"Total duration: {result.duration_seconds:.2f}s",
+        ]
 
         if result.errors:
-            print(f"Errors encountered: {len(result.errors)}", file=self._output)
-            for i, error in enumerate(result.errors[:3], 1):  # Show first 3 errors
-                print(f"  {i}. {error}", file=self._output)
+            lines.append(f"Errors encountered: {len(result.errors)}")
+            # Show first 3 errors
+            lines.extend(f"  {i}. {error}" for i, error in enumerate(result.errors[:3], 1))
             if len(result.errors) > 3:
-                print(f"  ... and {len(result.errors) - 3} more", file=self._output)
+                lines.append(f"  ... and {len(result.errors) - 3} more")
 
-        print("=" * 50, file=self._output)
+        lines.append("=" * 50)
+        self._write_lines(lines)
+
+    def _write_lines(self, lines: List[str]) -> None:
+        """
+        Write a whole report with a single write() call instead of one print() per line.
+        """
+        self._output.write("\n".join(lines) + "\n")
+        try:
+            self._output.flush()
+        except (AttributeError, ValueError):
+            # Stream without flush() or already closed; the text has been written anyway
+            pass
@@ -0,0 +1,64 @@
+from typing import Any, Dict, Optional
+"""On-disk checkpoint of the last page processed for a subject"""
+import json
+import logging
+import os
+from pathlib import Path
+
+from src.domain.value_objects.scraping.subject_info import SubjectInfo
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapingCheckpoint:
+    """
+    Remembers the last page the scraping loop finished for one subject.
+
+    The loop saves the checkpoint after every processed page and clears it when
+    the subject is scraped to the end. If a run dies midway, the progress service
+    reads the checkpoint and resumes after the last processed page, including
+    trailing pages that yielded no problems and so left nothing in the repository.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    @classmethod
+    def for_subject(cls, checkpoint_dir: Path, subject_info: SubjectInfo) -> "ScrapingCheckpoint":
+        """Checkpoint of a subject inside a shared checkpoint directory"""
+        return cls(Path(checkpoint_dir) / f"{subject_info.alias}.json")
+
+    def load_last_processed_page(self) -> Optional[int]:
+        """Last processed page recorded by an interrupted run, or None"""
+        try:
+            entry = json.loads(self.path.read_text(encoding='utf-8'))
+            return int(entry['last_processed_page'])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable scraping checkpoint %s: %s", self.path, e)
+            return None
+
+    def save(self, subject_name: str, last_processed_page: int, totals: Dict[str, Any]) -> None:
+        """Atomically record the last processed page (write to a temp file, then rename)"""
+        entry = {
+            'subject': subject_name,
+            'last_processed_page': last_processed_page,
+            'totals': totals,
+        }
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(entry, ensure_ascii=False), encoding='utf-8')
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("Could not write scraping checkpoint %s: %s", self.path, e)
+
+    def clear(self) -> None:
+        """Forget the checkpoint once the subject has been scraped to the end"""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Could not remove scraping checkpoint %s: %s", self.path, e)
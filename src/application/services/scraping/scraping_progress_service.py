@@ -5,11 +5,19 @@ This service handles the interaction with external dependencies (repository, bro
 while delegating the core business logic to pure functions in progress_logic.py.
 """
 import logging
+from pathlib import Path
+from typing import Optional
+
 from src.domain.interfaces.repositories.i_problem_repository import IProblemRepository
 from src.domain.interfaces.scraping.i_progress_service import IProgressService
 from src.application.value_objects.scraping.scraping_config import ScrapingConfig
 from src.domain.value_objects.scraping.subject_info import SubjectInfo
-from src.application.services.scraping.progress_logic import determine_next_page
+from src.application.services.scraping.scraping_checkpoint import ScrapingCheckpoint
+from src.application.services.scraping.progress_logic import (
+    determine_next_page_from_highest,
+    get_highest_page_from_urls,
+    needs_scraping_history,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,14 +27,16 @@ class ScrapingProgressService(IProgressService):
     Service responsible for determining scraping progress and next actions.
     """
 
-    def __init__(self, problem_repository: IProblemRepository):
+    def __init__(self, problem_repository: IProblemRepository, checkpoint_dir: Optional[Path] = None):
         """
         Initialize the progress service.
 
         Args:
             problem_repository: Repository to access existing problems
+            checkpoint_dir: Directory of per-subject checkpoints left by interrupted runs
         """
         self._repository = problem_repository
+        self._checkpoint_dir = checkpoint_dir
 
     async def get_next_page_to_scrape(
         self,
@@ -37,10 +47,7 @@ class ScrapingProgressService(IProgressService):
         """
         Get the next page number to scrape for a subject.
         """
-        logger.debug(f"Getting next page to scrape for subject: {subject_info.official_name}")
-
-        # Get existing problems for this subject
-        existing_problems = await self._repository.get_by_subject(subject_info.official_name)
+        logger.debug("Getting next page to scrape for subject: %s", subject_info.official_name)
 
         # Reconstruct ScrapingConfig to satisfy the functional core (determine_next_page)
         # We rely on default values for other fields not affecting page calculation.
@@ -49,8 +56,22 @@ class ScrapingProgressService(IProgressService):
             force_restart=force_restart,
         )
 
+        highest_scraped_page = None
+        if needs_scraping_history(config):
+            # Only the source URLs of stored problems are needed to find the last scraped page
+            source_urls = await self._repository.get_source_urls_by_subject(subject_info.official_name)
+            highest_scraped_page = get_highest_page_from_urls(source_urls)
+
+            if self._checkpoint_dir is not None:
+                # An interrupted run may have got further than the stored problems show
+                checkpoint_page = ScrapingCheckpoint.for_subject(
+                    self._checkpoint_dir, subject_info
+                ).load_last_processed_page()
+                if checkpoint_page is not None:
+                    highest_scraped_page = max(highest_scraped_page or 0, checkpoint_page)
+
         # Use functional core to determine next page
-        next_page = determine_next_page(existing_problems, config)
+        next_page = determine_next_page_from_highest(highest_scraped_page, config)
 
-        logger.info(f"Next page to scrape for {subject_info.official_name}: {next_page}")
+        logger.info("Next page to scrape for %s: %d", subject_info.official_name, next_page)
         return next_page
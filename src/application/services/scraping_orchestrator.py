@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple, Union
 """
 Application service for orchestrating parallel scraping of multiple subjects.
 This service takes a list of subjects and their configurations,
@@ -20,19 +20,25 @@ class ScrapingOrchestrator:
     Application service for orchestrating parallel scraping of multiple subjects.
     Business Rules:
     - Accepts a list of subject aliases and configurations
-    - Executes ScrapeSubjectUseCase for each subject concurrently using asyncio.gather
+    - Executes ScrapeSubjectUseCase for each subject concurrently, at most
+      max_parallel_subjects at a time
+    - Reports each subject as soon as it finishes (asyncio.as_completed)
     - Aggregates results from all subjects
     - Handles errors gracefully at the subject level
     - Provides overall progress and summary
     """
 
-    def __init__(self, scrape_use_case: ScrapeSubjectUseCase):
+    def __init__(self, scrape_use_case: ScrapeSubjectUseCase, max_parallel_subjects: int = 4):
         """
         Initialize the orchestrator with the use case it will execute.
         Args:
             scrape_use_case: The use case for scraping a single subject.
+            max_parallel_subjects: Maximum number of subjects scraped at the same time.
         """
+        if max_parallel_subjects <= 0:
+            raise ValueError("max_parallel_subjects must be positive")
         self.scrape_use_case = scrape_use_case
+        self._max_parallel_subjects = max_parallel_subjects
 
     async def run_parallel_scraping(
         self,
@@ -45,34 +51,50 @@ class ScrapingOrchestrator:
                              - "subject_alias": The alias of the subject (e.g., "math", "informatics")
                              - "config": An instance of ScrapingConfig for that subject
                              - Optional: Any other parameters ScrapeSubjectUseCase.execute() needs
+                             A subject listed more than once is scraped once, with its first config.
         Returns:
             A dictionary mapping subject aliases to their individual ScrapingResult.
         """
-        logger.info(f"Starting parallel scraping for {len(subject_configs)} subjects.")
-
-        # Prepare tasks for asyncio.gather
-        tasks = []
+        configs_by_alias: Dict[str, ScrapingConfig] = {}
+        duplicates = set()
         for item in subject_configs:
-            subject_alias = item["subject_alias"]
-            config = item["config"]
-            # Create an async task for each subject's scraping
-            task = asyncio.create_task(
-                self._scrape_single_subject(subject_alias, config),
-                name=f"Scrape_{subject_alias}"
-            )
-            tasks.append(task)
+            if item["subject_alias"] in configs_by_alias:
+                duplicates.add(item["subject_alias"])
+            else:
+                configs_by_alias[item["subject_alias"]] = item["config"]
+        if duplicates:
+            logger.warning("Subjects listed more than once are scraped once, with their first config: %s",
+                           ", ".join(sorted(duplicates)))
+
+        logger.info("Starting parallel scraping for %d subjects.", len(configs_by_alias))
+
+        semaphore = asyncio.BoundedSemaphore(self._max_parallel_subjects)
+
+        async def guarded(subject_alias: str, config: ScrapingConfig) -> Tuple[str, Union[ScrapingResult, Exception]]:
+            # Exceptions are returned with the alias so each result can be mapped back on arrival
+            try:
+                # Resolved before taking a slot: an unknown alias fails without occupying one
+                subject_info = SubjectInfo.from_alias(subject_alias)
+                async with semaphore:
+                    return subject_alias, await self._scrape_single_subject(subject_info, config)
+            except Exception as e:
+                return subject_alias, e
 
-        # Execute all tasks concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        tasks = [
+            asyncio.create_task(guarded(subject_alias, config), name=f"Scrape_{subject_alias}")
+            for subject_alias, config in configs_by_alias.items()
+        ]
 
-        # Process results and map them back to subject aliases
-        final_results = {}
-        for i, item in enumerate(subject_configs):
-            subject_alias = item["subject_alias"]
-            result_or_exception = results[i]
+        # Slots are created in input order and filled as subjects finish, so the returned
+        # mapping keeps the order of subject_configs without a second pass
+        final_results: Dict[str, Optional[ScrapingResult]] = dict.fromkeys(configs_by_alias)
+        for next_completed in asyncio.as_completed(tasks):
+            subject_alias, result_or_exception = await next_completed
 
             if isinstance(result_or_exception, Exception):
-                logger.error(f"Scraping failed for subject '{subject_alias}' with exception: {result_or_exception}", exc_info=True)
+                logger.error("Scraping failed for subject '%s' with exception: %s", subject_alias, result_or_exception,
+                             exc_info=result_or_exception)
+                failed_at = datetime.now()
                 # Create an error result using the correct ScrapingResult constructor
                 final_results[subject_alias] = ScrapingResult(
                     subject_name=subject_alias,  # Use alias or a placeholder
@@ -82,30 +104,30 @@ class ScrapingOrchestrator:
                     total_problems_saved=0,
                     page_results=[],
                     errors=[str(result_or_exception)],
-                    start_time=datetime.now(),  # Use current time
-                    end_time=datetime.now()  # Use current time
+                    start_time=failed_at,
+                    end_time=failed_at
                 )
             else:
                 # It's a ScrapingResult
+                logger.info("Subject '%s' finished.", subject_alias)
                 final_results[subject_alias] = result_or_exception
 
-        logger.info(f"Completed parallel scraping for {len(subject_configs)} subjects.")
+        logger.info("Completed parallel scraping for %d subjects.", len(final_results))
         return final_results
 
-    async def _scrape_single_subject(self, subject_alias: str, config: ScrapingConfig) -> ScrapingResult:
+    async def _scrape_single_subject(self, subject_info: SubjectInfo, config: ScrapingConfig) -> ScrapingResult:
         """
         Helper method to scrape a single subject and return its result.
         This is wrapped in a task by run_parallel_scraping.
         """
+        subject_alias = subject_info.alias
         logger.debug(f"Orchestrator starting scrape task for subject '{subject_alias}' with config {config}.")
         try:
-            # Get subject info based on alias
-            subject_info = SubjectInfo.from_alias(subject_alias)
             # Execute the use case
             result = await self.scrape_use_case.execute(subject_info, config)
             logger.debug(f"Orchestrator completed scrape task for subject '{subject_alias}'. Result: {result}")
             return result
         except Exception as e:
             logger.error(f"Orchestrator error in _scrape_single_subject for '{subject_alias}': {e}", exc_info=True)
-            # Re-raise to be caught by asyncio.gather as an exception result
+            # Re-raise to be reported as this subject's error result
             raise
@@ -1,8 +1,8 @@
-from typing import List, Optional
+from typing import Any, List, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class PageResult:
     page_number: int
     problems_found: int
@@ -12,7 +12,18 @@ class PageResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True)
+class FetchedPage:
+    """A scraped page whose problems are not saved yet"""
+    page_number: int
+    problems: List[Any]
+    assets_downloaded: int
+    # time.perf_counter() at the start of the page, so the duration includes saving
+    started_at: float
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
 class LoopResult:
     page_results: List[PageResult]
     total_problems_found: int
@@ -1,7 +1,8 @@
 from typing import List
-from datetime import datetime
 from pathlib import Path
+import asyncio
 import logging
+import time
 
 from src.domain.value_objects.scraping.subject_info import SubjectInfo
 from src.application.value_objects.scraping.scraping_config import ScrapingConfig
@@ -9,7 +10,7 @@ from src.domain.interfaces.repositories.i_problem_repository import IProblemRepo
 from src.domain.interfaces.services.i_page_scraping_service import IPageScrapingService
 from src.domain.interfaces.scraping.i_progress_reporter import IProgressReporter
 
-from .data_structures import PageResult
+from .data_structures import FetchedPage, PageResult
 
 logger = logging.getLogger(__name__)
 
@@ -19,11 +20,19 @@ class PageProcessor:
         self,
         page_scraping_service: IPageScrapingService,
         problem_repository: IProblemRepository,
-        progress_reporter: IProgressReporter
+        progress_reporter: IProgressReporter,
+        save_concurrency: int = 16
     ):
+        if save_concurrency <= 0:
+            raise ValueError("save_concurrency must be positive")
         self._page_scraping_service = page_scraping_service
         self._problem_repository = problem_repository
         self._progress_reporter = progress_reporter
+        # Максимум одновременных save() в репозиторий (ограничивает нагрузку на пул соединений)
+        self._save_concurrency = save_concurrency
+        # Один семафор на весь прогон: в режиме PARALLEL он ограничивает save() всех страниц вместе.
+        # Создается лениво, внутри работающего цикла событий
+        self._save_semaphore = None
 
     async def process_page(
         self,
@@ -32,49 +41,93 @@ class PageProcessor:
         config: ScrapingConfig,
         base_run_folder: Path
     ) -> PageResult:
-        start_time = datetime.now()
+        """Scrape a page and save its problems"""
+        fetched = await self.fetch_page(page_num, subject_info, config, base_run_folder)
+        return await self.save_page(fetched, config)
+
+    async def fetch_page(
+        self,
+        page_num: int,
+        subject_info: SubjectInfo,
+        config: ScrapingConfig,
+        base_run_folder: Path
+    ) -> FetchedPage:
+        """
+        Scrape a page without saving anything, so that pages can be fetched ahead
+        of time and saved (save_page) strictly in page order.
+        """
+        # Монотонные часы: длительность страницы не искажается переводом системного времени
+        start = time.perf_counter()
 
         try:
-            page_url = self._build_page_url(subject_info.base_url, page_num)
+            # SubjectInfo.base_url валидирует proj_id при каждом обращении, поэтому читается один раз
+            base_url = subject_info.base_url
+            page_url = self._build_page_url(base_url, page_num)
 
             # Используем доменный сервис для скрапинга страницы
             scraping_result = await self._page_scraping_service.scrape_page(
                 url=page_url,
                 subject_info=subject_info,
-                base_url=subject_info.base_url,
-                timeout=getattr(config, 'timeout', 30),
+                base_url=base_url,
+                timeout=config.timeout_seconds,
                 run_folder_page=base_run_folder / f"page_{page_num}",
-                files_location_prefix=f"data/{subject_info.alias}/page_{page_num}"
+                files_location_prefix=f"data/{subject_info.alias}/page_{page_num}",
+                # Принудительный перезапуск не должен отдавать закешированные результаты страниц
+                use_cache=not config.force_restart
             )
 
             problems_list = scraping_result.problems
             assets_downloaded = scraping_result.assets_downloaded
 
-            logger.info(f"Page {page_num}: получено {len(problems_list)} проблем, ассетов: {assets_downloaded}")
+            logger.info("Page %d: получено %d проблем, ассетов: %d", page_num, len(problems_list), assets_downloaded)
+
+            return FetchedPage(
+                page_number=page_num,
+                problems=problems_list,
+                assets_downloaded=assets_downloaded,
+                started_at=start
+            )
+
+        except Exception as e:
+            return FetchedPage(
+                page_number=page_num,
+                problems=[],
+                assets_downloaded=0,
+                started_at=start,
+                error=f"Page {page_num} error: {str(e)}"
+            )
+
+    async def save_page(self, fetched: FetchedPage, config: ScrapingConfig) -> PageResult:
+        """Save the problems of a fetched page and report its progress"""
+        page_num = fetched.page_number
+        if fetched.error:
+            return self._error_result(fetched, fetched.error)
 
+        try:
+            problems_list = fetched.problems
             if not problems_list:
                 return PageResult(
                     page_number=page_num,
                     problems_found=0,
                     problems_saved=0,
                     assets_downloaded=0,
-                    page_duration_seconds=(datetime.now() - start_time).total_seconds()
+                    page_duration_seconds=time.perf_counter() - fetched.started_at
                 )
 
             # Сохраняем готовые Problem объекты
-            saved_count = await self._save_problems(problems_list, page_num)
+            saved_count = await self._save_problems(problems_list, page_num, force_update=config.force_restart)
 
-            logger.info(f"Page {page_num}: сохранено {saved_count} проблем")
+            logger.info("Page %d: сохранено %d проблем", page_num, saved_count)
 
             # Вычисляем длительность выполнения страницы
-            page_duration = (datetime.now() - start_time).total_seconds()
+            page_duration = time.perf_counter() - fetched.started_at
 
             self._progress_reporter.report_page_progress(
                 page_num, 
                 None,  # total_pages
                 len(problems_list), 
                 saved_count, 
-                assets_downloaded,
+                fetched.assets_downloaded,
                 page_duration
             )
 
@@ -82,33 +135,52 @@ class PageProcessor:
                 page_number=page_num,
                 problems_found=len(problems_list),
                 problems_saved=saved_count,
-                assets_downloaded=assets_downloaded,
+                assets_downloaded=fetched.assets_downloaded,
                 page_duration_seconds=page_duration
             )
 
         except Exception as e:
-            error_msg = f"Page {page_num} error: {str(e)}"
-            logger.error(error_msg)
-            self._progress_reporter.report_page_error(page_num, error_msg)
-            return PageResult(
-                page_number=page_num,
-                problems_found=0,
-                problems_saved=0,
-                assets_downloaded=0,
-                page_duration_seconds=(datetime.now() - start_time).total_seconds(),
-                error=error_msg
-            )
+            return self._error_result(fetched, f"Page {page_num} error: {str(e)}")
+
+    def _error_result(self, fetched: FetchedPage, error_msg: str) -> PageResult:
+        logger.error(error_msg)
+        self._progress_reporter.report_page_error(fetched.page_number, error_msg)
+        return PageResult(
+            page_number=fetched.page_number,
+            problems_found=0,
+            problems_saved=0,
+            assets_downloaded=0,
+            page_duration_seconds=time.perf_counter() - fetched.started_at,
+            error=error_msg
+        )
 
     def _build_page_url(self, base_url: str, page_num: int) -> str:
         return f"{base_url}?page={page_num}" if page_num > 1 else base_url
 
-    async def _save_problems(self, problems: List, page_num: int) -> int:
-        saved_count = 0
-        for problem in problems:
-            try:
-                await self._problem_repository.save(problem)
-                saved_count += 1
-                logger.debug(f"Page {page_num}: сохранена проблема {getattr(problem, 'problem_id', 'unknown')}")
-            except Exception as e:
-                logger.error(f"Page {page_num}: ошибка сохранения проблемы: {e}")
-        return saved_count
+    async def _save_problems(self, problems: List, page_num: int, force_update: bool = False) -> int:
+        # Вся страница сохраняется одной транзакцией; при ошибке — поштучно,
+        # чтобы одна проблемная запись не лишала страницу остальных
+        try:
+            return await self._problem_repository.save_many(problems, force_update=force_update)
+        except Exception as e:
+            logger.warning("Page %d: пакетное сохранение не удалось (%s), сохраняем поштучно", page_num, e)
+            return await self._save_problems_individually(problems, page_num, force_update)
+
+    def _get_save_semaphore(self) -> asyncio.Semaphore:
+        if self._save_semaphore is None:
+            self._save_semaphore = asyncio.Semaphore(self._save_concurrency)
+        return self._save_semaphore
+
+    async def _save_problems_individually(self, problems: List, page_num: int, force_update: bool = False) -> int:
+        async def save_one(problem) -> int:
+            async with self._get_save_semaphore():
+                try:
+                    await self._problem_repository.save(problem, force_update=force_update)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Page %d: сохранена проблема %s", page_num, getattr(problem, 'problem_id', 'unknown'))
+                    return 1
+                except Exception as e:
+                    logger.error("Page %d: ошибка сохранения проблемы: %s", page_num, e)
+                    return 0
+
+        return sum(await asyncio.gather(*(save_one(problem) for problem in problems)))
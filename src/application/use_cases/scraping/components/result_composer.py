@@ -1,3 +1,4 @@
+from typing import Optional
 from datetime import datetime
 
 from src.domain.value_objects.scraping.subject_info import SubjectInfo
@@ -12,7 +13,8 @@ class ResultComposer:
         subject_info: SubjectInfo,
         loop_result: LoopResult,
         start_time: datetime,
-        end_time: datetime
+        end_time: datetime,
+        elapsed_seconds: Optional[float] = None
     ) -> ScrapingResult:
         page_results_dict = [
             {
@@ -41,5 +43,28 @@ class ResultComposer:
             metadata={
                 "assets_downloaded": loop_result.total_assets_downloaded,
                 "last_processed_page": loop_result.last_processed_page
-            }
+            },
+            total_assets_downloaded=loop_result.total_assets_downloaded,
+            elapsed_seconds=elapsed_seconds
+        )
+
+    def compose_error_result(
+        self,
+        subject_info: SubjectInfo,
+        error_msg: str,
+        start_time: datetime,
+        end_time: datetime,
+        elapsed_seconds: Optional[float] = None
+    ) -> ScrapingResult:
+        return ScrapingResult(
+            subject_name=subject_info.official_name,
+            success=False,
+            total_pages=0,
+            total_problems_found=0,
+            total_problems_saved=0,
+            page_results=[],
+            errors=[error_msg],
+            start_time=start_time,
+            end_time=end_time,
+            elapsed_seconds=elapsed_seconds
         )
@@ -1,16 +1,19 @@
-from typing import List
+from typing import Dict, List, Optional
+import asyncio
 from pathlib import Path
 
 from src.domain.value_objects.scraping.subject_info import SubjectInfo
-from src.application.value_objects.scraping.scraping_config import ScrapingConfig
+from src.application.value_objects.scraping.scraping_config import ScrapingConfig, ScrapingMode
+from src.application.services.scraping.scraping_checkpoint import ScrapingCheckpoint
 
 from .page_processor import PageProcessor
 from .data_structures import PageResult, LoopResult
 
 
 class ScrapingLoopController:
-    def __init__(self, max_empty_pages: int = 3):
+    def __init__(self, max_empty_pages: int = 3, checkpoint: Optional[ScrapingCheckpoint] = None):
         self._max_empty_pages = max_empty_pages
+        self._checkpoint = checkpoint
 
     async def run_loop(
         self,
@@ -23,35 +26,98 @@ class ScrapingLoopController:
         page_results: List[PageResult] = []
         errors: List[str] = []
         empty_pages_count = 0
+        # Цикл дошел до конца предмета (порог пустых страниц), а не остановился на max_pages или ошибке
+        reached_end = False
         current_page = start_page
+        next_page = start_page
         total_problems_found = 0
         total_problems_saved = 0
         total_assets_downloaded = 0
 
-        # Исправляем условие: учитываем, что config.max_pages может быть None
-        while (empty_pages_count < self._max_empty_pages and 
-               (config.max_pages is None or current_page <= config.max_pages)):
+        # В режиме PARALLEL следующие страницы запрашиваются заранее (скользящее окно);
+        # результаты разбираются и сохраняются строго по порядку страниц, поэтому правило
+        # остановки не меняется.
+        # Слот окна освобождается, как только завершается любая страница, а не только самая ранняя;
+        # готовые, но еще не разобранные страницы ограничены заглядыванием на 2 окна вперед
+        window_size = self._window_size(config)
+        max_lookahead = 2 * window_size
+        # Пределы цикла читаются один раз, а не на каждой странице
+        max_empty_pages = self._max_empty_pages
+        max_pages = config.max_pages
+        inflight: Dict[int, asyncio.Task] = {}
 
-            page_result = await page_processor.process_page(
-                current_page, subject_info, config, base_run_folder
-            )
+        try:
+            while True:
+                stop = False
+                # Разбираем завершенные страницы по порядку, начиная с текущей
+                while current_page in inflight and inflight[current_page].done():
+                    # Сохранение идет здесь, строго по порядку страниц: заранее запрошенные
+                    # страницы за точкой остановки ничего не успевают записать в репозиторий
+                    page_result = await page_processor.save_page(inflight.pop(current_page).result(), config)
 
-            page_results.append(page_result)
-            total_problems_found += page_result.problems_found
-            total_problems_saved += page_result.problems_saved
-            total_assets_downloaded += page_result.assets_downloaded
+                    page_results.append(page_result)
+                    total_problems_found += page_result.problems_found
+                    total_problems_saved += page_result.problems_saved
+                    total_assets_downloaded += page_result.assets_downloaded
 
-            if page_result.error:
-                errors.append(page_result.error)
-                # При ошибке прерываем цикл
-                break
+                    if page_result.error:
+                        errors.append(page_result.error)
+                        # При ошибке прерываем цикл
+                        stop = True
+                        break
 
-            if page_result.problems_found == 0:
-                empty_pages_count += 1
-            else:
-                empty_pages_count = 0
+                    if page_result.problems_found == 0:
+                        empty_pages_count += 1
+                    else:
+                        empty_pages_count = 0
 
-            current_page += 1
+                    current_page += 1
+
+                    if self._checkpoint is not None:
+                        # Прогресс фиксируется после каждой страницы, чтобы упавший запуск продолжился с нее
+                        self._checkpoint.save(subject_info.official_name, current_page - 1, {
+                            'problems_found': total_problems_found,
+                            'problems_saved': total_problems_saved,
+                            'assets_downloaded': total_assets_downloaded,
+                        })
+
+                    if empty_pages_count >= max_empty_pages:
+                        reached_end = True
+                        stop = True
+                        break
+
+                if stop:
+                    break
+
+                # Исправляем условие: учитываем, что max_pages может быть None
+                running = sum(1 for task in inflight.values() if not task.done())
+                while (running < window_size and
+                       next_page - current_page < max_lookahead and
+                       (max_pages is None or next_page <= max_pages)):
+                    inflight[next_page] = asyncio.ensure_future(page_processor.fetch_page(
+                        next_page, subject_info, config, base_run_folder
+                    ))
+                    next_page += 1
+                    running += 1
+
+                if not inflight:
+                    break
+
+                await asyncio.wait(
+                    [task for task in inflight.values() if not task.done()],
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            # Страницы, запрошенные после точки остановки, только скачаны, но не сохранены:
+            # их можно отбросить, не расходясь с репозиторием
+            for task in inflight.values():
+                task.cancel()
+            await asyncio.gather(*inflight.values(), return_exceptions=True)
+
+        if self._checkpoint is not None and reached_end:
+            # Предмет пройден до конца — продолжать больше нечего. После остановки на max_pages
+            # точка продолжения сохраняется для следующего запуска
+            self._checkpoint.clear()
 
         return LoopResult(
             page_results=page_results,
@@ -61,3 +127,10 @@ class ScrapingLoopController:
             errors=errors,
             last_processed_page=current_page - 1
         )
+
+    @staticmethod
+    def _window_size(config: ScrapingConfig) -> int:
+        """Number of pages processed at once: parallel_workers in PARALLEL mode, otherwise 1"""
+        # config.mode may also be the central config's ScrapingMode, so compare by value
+        mode = getattr(config.mode, 'value', config.mode)
+        return config.parallel_workers if mode == ScrapingMode.PARALLEL.value else 1
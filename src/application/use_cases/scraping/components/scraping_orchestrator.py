@@ -63,22 +63,4 @@ class ScrapingOrchestrator:
         except Exception as e:
             error_msg = f"Critical error: {str(e)}"
             self._progress_reporter.report_page_error(0, error_msg)
-            return self._create_error_result(subject_info, start_time, error_msg)
-
-    def _create_error_result(
-        self, 
-        subject_info: SubjectInfo, 
-        start_time: datetime, 
-        error_msg: str
-    ) -> ScrapingResult:
-        return ScrapingResult(
-            subject_name=subject_info.official_name,
-            success=False,
-            total_pages=0,
-            total_problems_found=0,
-            total_problems_saved=0,
-            page_results=[],
-            errors=[error_msg],
-            start_time=start_time,
-            end_time=datetime.now()
-        )
+            return ResultComposer().compose_error_result(subject_info, error_msg, start_time, datetime.now())
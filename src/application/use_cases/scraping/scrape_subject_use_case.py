@@ -1,5 +1,6 @@
 from typing import Optional
 import logging
+import time
 from pathlib import Path
 from datetime import datetime
 
@@ -12,6 +13,7 @@ from src.domain.interfaces.scraping.i_progress_service import IProgressService
 from src.domain.interfaces.scraping.i_progress_reporter import IProgressReporter
 
 from src.application.value_objects.scraping.scraping_config import ScrapingConfig
+from src.application.services.scraping.scraping_checkpoint import ScrapingCheckpoint
 from src.domain.value_objects.scraping.subject_info import SubjectInfo
 from src.domain.value_objects.scraping.scraping_result import ScrapingResult
 
@@ -61,7 +63,8 @@ class ScrapeSubjectUseCase:
         browser_service: IBrowserService,
         asset_downloader_impl: IAssetDownloader,
         progress_service: Optional[IProgressService] = None,
-        progress_reporter: Optional[IProgressReporter] = None
+        progress_reporter: Optional[IProgressReporter] = None,
+        checkpoint_dir: Optional[Path] = None
     ):
         self.page_scraping_service = page_scraping_service
         self.problem_repository = problem_repository
@@ -70,9 +73,12 @@ class ScrapeSubjectUseCase:
         self.asset_downloader_impl = asset_downloader_impl
         self.progress_service = progress_service or _NoopProgressService()
         self.progress_reporter = progress_reporter or _NoopProgressReporter()
+        self.checkpoint_dir = checkpoint_dir
 
     async def execute(self, subject_info: SubjectInfo, config: ScrapingConfig) -> ScrapingResult:
         start_time = datetime.now()
+        # Длительность считается по монотонным часам; datetime нужен только для отметок времени
+        started = time.perf_counter()
 
         # Разворачиваем параметры конфига в примитивы для вызова Domain Interface
         self.progress_reporter.report_start(
@@ -82,7 +88,7 @@ class ScrapeSubjectUseCase:
             config.force_restart
         )
 
-        logger.info(f"Starting scraping for subject: {subject_info.official_name}")
+        logger.info("Starting scraping for subject: %s", subject_info.official_name)
 
         if config.force_restart:
             await self._clear_existing_problems(subject_info)
@@ -104,16 +110,24 @@ class ScrapeSubjectUseCase:
                 self.progress_reporter
             )
 
-            loop_result = await ScrapingLoopController().run_loop(
-                start_page, subject_info, config, base_run_folder, page_processor
+            checkpoint = (
+                ScrapingCheckpoint.for_subject(self.checkpoint_dir, subject_info)
+                if self.checkpoint_dir is not None else None
             )
 
+            # Keep the browser page alive for the whole subject instead of per page
+            async with self.page_scraping_service:
+                loop_result = await ScrapingLoopController(checkpoint=checkpoint).run_loop(
+                    start_page, subject_info, config, base_run_folder, page_processor
+                )
+
             final_result = ResultComposer().compose_final_result(
-                subject_info, loop_result, start_time, datetime.now()
+                subject_info, loop_result, start_time, datetime.now(),
+                elapsed_seconds=time.perf_counter() - started
             )
 
             self.progress_reporter.report_summary(final_result)
-            logger.info(f"Scraping completed: {final_result.total_problems_saved} problems saved")
+            logger.info("Scraping completed: %d problems saved", final_result.total_problems_saved)
             return final_result
 
         except Exception as e:
@@ -121,21 +135,14 @@ class ScrapeSubjectUseCase:
             logger.error(error_msg, exc_info=True)
             self.progress_reporter.report_page_error(0, error_msg)
 
-            return ScrapingResult(
-                subject_name=subject_info.official_name,
-                success=False,
-                total_pages=0,
-                total_problems_found=0,
-                total_problems_saved=0,
-                page_results=[],
-                errors=[error_msg],
-                start_time=start_time,
-                end_time=datetime.now()
+            return ResultComposer().compose_error_result(
+                subject_info, error_msg, start_time, datetime.now(),
+                elapsed_seconds=time.perf_counter() - started
             )
 
     async def _clear_existing_problems(self, subject_info: SubjectInfo) -> None:
         """Clear existing problems for the subject before scraping."""
-        logger.info(f"Clearing existing problems for subject: {subject_info.official_name}")
+        logger.info("Clearing existing problems for subject: %s", subject_info.official_name)
         problems = await self.problem_repository.get_by_subject(subject_info.official_name)
         # TODO: Реализовать фактическое удаление через репозиторий, если потребуется
-        logger.warning(f"Force restart requested. Found {len(problems)} existing problems (deletion not implemented).")
+        logger.warning("Force restart requested. Found %d existing problems (deletion not implemented).", len(problems))
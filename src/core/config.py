@@ -96,6 +96,9 @@ class ScrapingConfig(BaseSettings):
     retry_attempts: int = Field(default=3, env="SCRAPING_RETRY_ATTEMPTS")
     retry_delay_seconds: int = Field(default=1, env="SCRAPING_RETRY_DELAY")
     asset_download_timeout: int = Field(default=60, env="ASSET_DOWNLOAD_TIMEOUT")
+    max_concurrent_blocks: int = Field(default=8, env="SCRAPING_MAX_CONCURRENT_BLOCKS")
+    page_cache_ttl_seconds: int = Field(default=7 * 24 * 3600, env="SCRAPING_PAGE_CACHE_TTL_SECONDS")
+    asset_requests_per_second: float = Field(default=8.0, env="SCRAPING_ASSET_REQUESTS_PER_SECOND")
 
     @validator("base_url")
     def validate_base_url(cls, v):
@@ -104,7 +107,8 @@ class ScrapingConfig(BaseSettings):
             raise ValueError("Scraping base URL must start with http:// or https://")
         return v
 
-    @validator("parallel_workers", "retry_attempts", "max_empty_pages")
+    @validator("parallel_workers", "retry_attempts", "max_empty_pages", "max_concurrent_blocks",
+               "page_cache_ttl_seconds", "asset_requests_per_second")
     def validate_positive_numbers(cls, v):
         """Validate positive integer fields."""
         if v <= 0:
@@ -216,7 +220,10 @@ except Exception as e:
             'parallel_workers': 3,
             'retry_attempts': 3,
             'retry_delay_seconds': 1,
-            'asset_download_timeout': 60
+            'asset_download_timeout': 60,
+            'max_concurrent_blocks': 8,
+            'page_cache_ttl_seconds': 7 * 24 * 3600,
+            'asset_requests_per_second': 8.0
         })()
         browser = type('Browser', (), {
             'timeout_seconds': 30,
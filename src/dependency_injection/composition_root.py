@@ -12,6 +12,7 @@ from src.domain.interfaces.external_services.i_asset_downloader import IAssetDow
 from src.domain.interfaces.repositories.i_problem_repository import IProblemRepository
 from src.application.interfaces.factories.i_problem_factory import IProblemFactory
 from src.infrastructure.adapters.external_services.playwright_asset_downloader_adapter import PlaywrightAssetDownloaderAdapter
+from src.infrastructure.adapters.external_services.bounded_asset_downloader_adapter import BoundedAssetDownloaderAdapter
 from src.infrastructure.adapters.browser_pool_service_adapter import BrowserPoolServiceAdapter
 from src.infrastructure.repositories.sqlalchemy_problem_repository import SQLAlchemyProblemRepository, Base
 from src.infrastructure.processors.html.image_script_processor import ImageScriptProcessor
@@ -29,6 +30,8 @@ from src.infrastructure.adapters.html_processing.metadata_extractor_adapter impo
 # Импорты новой архитектуры
 from src.domain.interfaces.services.i_page_scraping_service import IPageScrapingService
 from src.infrastructure.services.page_scraping_adapter import PageScrapingAdapter
+from src.infrastructure.services.page_scraping.components.document_response_cache import DocumentResponseCache
+from src.infrastructure.services.page_scraping.components.page_result_cache import PageResultCache
 
 # Import centralized configuration
 try:
@@ -56,12 +59,30 @@ def create_scraping_components(base_run_folder: Path) -> Tuple[ScrapeSubjectUseC
         asset_download_timeout = getattr(config.scraping, 'asset_download_timeout', 60)
         browser_timeout = getattr(config.browser, 'timeout_seconds', 30)
         pool_size = 2  # Could be configurable in the future
+        max_concurrent_downloads = getattr(config, 'max_concurrent_downloads', 5)
+        max_concurrent_blocks = getattr(config.scraping, 'max_concurrent_blocks', 8)
+        page_cache_ttl_seconds = getattr(config.scraping, 'page_cache_ttl_seconds', 7 * 24 * 3600)
+        retry_attempts = getattr(config.scraping, 'retry_attempts', 3)
+        retry_delay_seconds = getattr(config.scraping, 'retry_delay_seconds', 1)
+        asset_requests_per_second = getattr(config.scraping, 'asset_requests_per_second', 8.0)
     else:
         asset_download_timeout = 60
         browser_timeout = 30
         pool_size = 2
-
-    asset_downloader_impl: IAssetDownloader = PlaywrightAssetDownloaderAdapter(timeout=asset_download_timeout)
+        max_concurrent_downloads = 5
+        max_concurrent_blocks = 8
+        page_cache_ttl_seconds = 7 * 24 * 3600
+        retry_attempts = 3
+        retry_delay_seconds = 1
+        asset_requests_per_second = 8.0
+
+    # Processors download all assets of a block concurrently; cap requests in flight across all blocks
+    # and space them out so image-heavy pages do not get the client throttled by FIPI
+    asset_downloader_impl: IAssetDownloader = BoundedAssetDownloaderAdapter(
+        PlaywrightAssetDownloaderAdapter(timeout=asset_download_timeout),
+        max_concurrent=max_concurrent_downloads,
+        max_requests_per_second=asset_requests_per_second
+    )
 
     browser_service: IBrowserService = BrowserPoolServiceAdapter(pool_size=pool_size)
 
@@ -133,7 +154,10 @@ def create_scraping_components(base_run_folder: Path) -> Tuple[ScrapeSubjectUseC
         ]
     )
 
-    progress_service = ScrapingProgressService(problem_repository=problem_repository)
+    # Interrupted runs leave per-subject checkpoints here; the progress service resumes from them
+    checkpoint_dir = base_run_folder / ".checkpoints"
+
+    progress_service = ScrapingProgressService(problem_repository=problem_repository, checkpoint_dir=checkpoint_dir)
     progress_reporter = ScrapingProgressReporter()
 
     # Use centralized configuration for page scraping service timeout
@@ -143,7 +167,12 @@ def create_scraping_components(base_run_folder: Path) -> Tuple[ScrapeSubjectUseC
         problem_factory=problem_factory,
         html_block_processing_service=html_block_processing_service,
         html_block_parser=html_block_parser,
-        timeout=browser_timeout
+        timeout=browser_timeout,
+        max_concurrent_blocks=max_concurrent_blocks,
+        document_cache=DocumentResponseCache(base_run_folder / ".document_cache"),
+        page_result_cache=PageResultCache(base_run_folder / ".page_cache", ttl_seconds=page_cache_ttl_seconds),
+        retry_attempts=retry_attempts,
+        retry_delay_seconds=retry_delay_seconds
     )
 
     # NEW: Wrap the existing implementation with the domain adapter
@@ -156,7 +185,8 @@ def create_scraping_components(base_run_folder: Path) -> Tuple[ScrapeSubjectUseC
         browser_service=browser_service,
         asset_downloader_impl=asset_downloader_impl,
         progress_service=progress_service,
-        progress_reporter=progress_reporter
+        progress_reporter=progress_reporter,
+        checkpoint_dir=checkpoint_dir
     )
 
     return scrape_use_case, browser_service, asset_downloader_impl
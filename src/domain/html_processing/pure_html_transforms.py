@@ -1,5 +1,6 @@
 from typing import Dict, Iterable, List, Tuple, Union
 from bs4 import BeautifulSoup, Tag
+from bs4.builder import builder_registry
 
 """
 Чистые функции для разбора HTML и подготовки "сырых" данных.
@@ -8,13 +9,31 @@ from bs4 import BeautifulSoup, Tag
 Это — функциональное ядро (Functional Core).
 """
 
+# Парсер для целых страниц выбирается один раз при импорте: lxml в разы быстрее
+# html.parser, но является необязательной зависимостью.
+DOCUMENT_PARSER = "lxml" if builder_registry.lookup("lxml") else "html.parser"
 
-def extract_dom_tree(html: str) -> BeautifulSoup:
+# Фрагменты блоков разбираются html.parser: lxml оборачивает их в <html><body>,
+# и сериализованный обратно HTML фрагмента изменился бы.
+FRAGMENT_PARSER = "html.parser"
+
+
+def decode_html(html: Union[str, bytes, None]) -> str:
+    """
+    Приводит HTML к str. Байты декодируются как UTF-8 (кодировка ФИПИ), чтобы
+    BeautifulSoup не запускал дорогое определение кодировки.
+    """
+    if isinstance(html, bytes):
+        return html.decode("utf-8", errors="replace")
+    return html or ""
+
+
+def extract_dom_tree(html: Union[str, bytes]) -> BeautifulSoup:
     """
     Преобразует HTML-строку в BeautifulSoup DOM. Чистая функция:
     deterministic, не делает I/O.
     """
-    return BeautifulSoup(html or "", "html.parser")
+    return BeautifulSoup(decode_html(html), DOCUMENT_PARSER)
 
 
 def extract_block_pairs(dom_or_html: Union[str, BeautifulSoup]) -> List[Tuple[str, str]]:
@@ -40,6 +59,50 @@ def extract_block_pairs(dom_or_html: Union[str, BeautifulSoup]) -> List[Tuple[st
     return pairs
 
 
+def extract_block_elements(dom_or_html: Union[str, BeautifulSoup]) -> List[List[Tag]]:
+    """
+    То же, что extract_block_pairs, но возвращает сами элементы DOM, а не их HTML:
+    для каждой задачи — [заголовок, первый элемент тела]. Позволяет не сериализовать
+    блоки в строки и не разбирать каждый фрагмент заново.
+    """
+    if isinstance(dom_or_html, str):
+        dom = extract_dom_tree(dom_or_html)
+    else:
+        dom = dom_or_html
+
+    headers = _find_header_elements(dom)
+    if headers:
+        return [
+            [el for el in (header, _find_body_element_for_header(header)) if el is not None]
+            for header in headers
+        ]
+
+    blocks: List[List[Tag]] = []
+    for group in _group_qblocks_by_context(dom.find_all(class_='qblock')):
+        individual_qblocks = group['individual_qblocks']
+        if not individual_qblocks:
+            continue
+
+        if group['common_context'] is not None:
+            # Как и в extract_block_pairs: одна задача на группу, тело начинается с общего контекста
+            first_qblock_id = individual_qblocks[0].get('id', '')[1:]
+            blocks.append([_new_header_element(dom, first_qblock_id), group['common_context']])
+        else:
+            for qblock in individual_qblocks:
+                blocks.append([_new_header_element(dom, qblock.get('id', '')[1:]), qblock])
+
+    return blocks
+
+
+def _new_header_element(dom: BeautifulSoup, qblock_id: str) -> Tag:
+    """
+    Создаёт синтетический заголовок задачи — тот же, что extract_block_pairs формирует строкой.
+    """
+    header = dom.new_tag("div", attrs={"id": f"i{qblock_id}", "class": ["header-container"]})
+    header.string = f"Задание {qblock_id}"
+    return header
+
+
 def _extract_block_pairs_by_header_body_pattern(dom: BeautifulSoup) -> List[Tuple[str, str]]:
     """
     Старая логика: ищет элементы с классами 'problem-header' и 'problem-body'.
@@ -67,10 +130,15 @@ def _find_header_elements(dom: BeautifulSoup) -> List[Tag]:
     headers = dom.find_all(class_="problem-header")
     if not headers:
         # fallback: элементы с тегами h2, h3 и классом, содержащим "task"
-        headers = dom.find_all(lambda el: el.name in ("h3", "h2") and "task" in (el.get("class") or []))
+        headers = dom.find_all(_is_task_heading)
     return headers
 
 
+def _is_task_heading(el: Tag) -> bool:
+    """Фильтр для find_all: заголовок h2/h3 с классом "task"."""
+    return el.name in ("h3", "h2") and "task" in (el.get("class") or [])
+
+
 def _find_next_tag_sibling(tag: Tag) -> Tag | None:
     """Вспомогательная функция: находит ближайший следующий HTML-элемент (Tag), пропуская NavigableString и комментарии."""
     sib = tag.next_sibling
@@ -127,14 +195,14 @@ def _extract_block_pairs_by_qblocks_pattern_with_grouping(dom: BeautifulSoup) ->
             # Если в группе нет индивидуальных qblock-ов, пропускаем её
             continue
 
-        if common_context:
+        if common_context is not None:
             # Если есть общий контекст, объединяем все индивидуальные qblock-и в одну задачу
             # Header: используем ID первого qblock в группе или генерируем общий
             first_qblock_id = individual_qblocks[0].get('id', '')[1:] if individual_qblocks else 'group'
             header_html = f'<div id="i{first_qblock_id}" class="header-container">Задание {first_qblock_id}</div>'
 
             # Body: объединяем общий контекст и все индивидуальные qblock-и
-            body_parts = [common_context] + [str(qb) for qb in individual_qblocks]
+            body_parts = [str(common_context)] + [str(qb) for qb in individual_qblocks]
             body_html = ''.join(body_parts)
 
             pairs.append((header_html, body_html))
@@ -159,7 +227,7 @@ def _group_qblocks_by_context(qblocks: List[Tag]) -> List[Dict]:
 
     Returns:
         Список словарей, где каждый словарь содержит:
-        - 'common_context': HTML-строка общего контекста (или None)
+        - 'common_context': Tag общего контекста (или None)
         - 'individual_qblocks': Список BeautifulSoup Tag объектов индивидуальных qblock-ов
     """
     groups = []
@@ -177,13 +245,13 @@ def _group_qblocks_by_context(qblocks: List[Tag]) -> List[Dict]:
                 current_group = {'common_context': None, 'individual_qblocks': []}
 
             # Устанавливаем общий контекст для новой группы
-            current_group['common_context'] = str(qblock)
+            current_group['common_context'] = qblock
         else:
             # Это индивидуальный qblock
             current_group['individual_qblocks'].append(qblock)
 
     # Добавляем последнюю группу, если она не пуста
-    if current_group['individual_qblocks'] or current_group['common_context']:
+    if current_group['individual_qblocks'] or current_group['common_context'] is not None:
         groups.append(current_group)
 
     return groups
@@ -200,7 +268,7 @@ def transform_blocks_to_raw_data(block_pairs: Iterable[Tuple[str, str]]) -> List
     for header_html, body_html in block_pairs:
         # минимальная постобработка: можно извлечь номер задачи, id, хэши и т.д.
         # Для безопасности парсим header_html как DOM, но не делаем I/O.
-        header_dom = BeautifulSoup(header_html, "html.parser")
+        header_dom = BeautifulSoup(header_html, FRAGMENT_PARSER)
         # Попытаемся извлечь атрибут data-task-id или цифры в заголовке
         task_id = header_dom.find(attrs={"data-task-id": True})
         task_id_val = task_id.get("data-task-id") if task_id else None
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Callable, Optional
 """
 Domain interface for asset downloading operations.
 
@@ -9,6 +9,11 @@ of the specific downloading implementation (e.g., httpx, requests, playwright).
 import abc
 from pathlib import Path
 
+# Callback invoked with the local path of every asset saved while processing a page.
+# Passed to HTML processors via context['on_asset_saved'] so the caller can count
+# assets as they are saved instead of scanning the assets directory afterwards.
+AssetSavedCallback = Callable[[Path], None]
+
 
 class IAssetDownloader(abc.ABC):
     """
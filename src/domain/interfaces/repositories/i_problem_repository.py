@@ -27,6 +27,24 @@ class IProblemRepository:
         """
         raise NotImplementedError
 
+    async def save_many(self, problems: List[Problem], force_update: bool = False) -> int:
+        """
+        Save several Problem entities with the same semantics as save().
+
+        Implementations backed by a database should override this to write the whole
+        batch in one transaction; the default saves the problems one by one.
+
+        Args:
+            problems: The Problem entities to save.
+            force_update: Passed through to save() semantics for every problem.
+
+        Returns:
+            The number of problems saved.
+        """
+        for problem in problems:
+            await self.save(problem, force_update=force_update)
+        return len(problems)
+
     @abstractmethod
     async def get_by_id(self, problem_id: str) -> Optional[Problem]:
         """
@@ -52,3 +70,20 @@ class IProblemRepository:
             A list of Problem entities for the given subject name.
         """
         raise NotImplementedError
+
+    async def get_source_urls_by_subject(self, subject_name: str) -> List[str]:
+        """
+        Retrieve the distinct source URLs of the problems stored for a subject.
+
+        Used to determine scraping progress without loading whole Problem entities.
+        Implementations backed by a database should override this with a query that
+        selects only the URL column.
+
+        Args:
+            subject_name: The name of the subject (e.g., "mathematics").
+
+        Returns:
+            A list of distinct, non-empty source URLs for the given subject name.
+        """
+        problems = await self.get_by_subject(subject_name)
+        return list(dict.fromkeys(p.source_url for p in problems if p.source_url))
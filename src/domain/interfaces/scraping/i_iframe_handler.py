@@ -1,10 +1,16 @@
 from typing import Any
-from typing import Optional, Tuple
+from typing import NamedTuple, Optional
 """Interface for iframe handling operations"""
 from abc import ABC, abstractmethod
 from bs4 import BeautifulSoup
 
 
+class IframeContent(NamedTuple):
+    """Content to parse for a page and the URL it was actually loaded from"""
+    content: str
+    source_url: str
+
+
 class IIframeHandler(ABC):
     """Handles iframe content extraction and processing"""
 
@@ -15,7 +21,7 @@ class IIframeHandler(ABC):
         url: str, 
         timeout: int,
         main_content: str
-    ) -> Tuple[str, str]:
+    ) -> IframeContent:
         """
         Handle iframe content extraction with fallback
 
@@ -26,7 +32,7 @@ class IIframeHandler(ABC):
             main_content: Main page content
 
         Returns:
-            Tuple of (actual_content, source_url)
+            IframeContent(content, source_url); unpacks like the former (content, source_url) tuple
         """
 
     @abstractmethod
@@ -16,8 +16,25 @@ class IPageScrapingService(ABC):
     """
     Domain service interface for page scraping operations.
     Defines the core domain operation of scraping a page into Problem entities.
+
+    Can be used as an async context manager to keep scraping resources (e.g. a
+    browser page) alive across several scrape_page calls. Implementations without
+    such resources may rely on the default no-op start/stop.
     """
 
+    async def start(self) -> None:
+        """Acquire resources to be reused by subsequent scrape_page calls."""
+
+    async def stop(self) -> None:
+        """Release resources acquired by start()."""
+
+    async def __aenter__(self) -> 'IPageScrapingService':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+
     @abstractmethod
     async def scrape_page(
         self,
@@ -26,7 +43,8 @@ class IPageScrapingService(ABC):
         base_url: str,
         timeout: int = 30,
         run_folder_page: Optional[Path] = None,
-        files_location_prefix: str = ""
+        files_location_prefix: str = "",
+        use_cache: bool = True
     ) -> PageScrapingResult:
         """
         Scrape a single page and return PageScrapingResult with domain entities.
@@ -38,6 +56,7 @@ class IPageScrapingService(ABC):
             timeout: Timeout for operations in seconds.
             run_folder_page: Optional path for storing page assets.
             files_location_prefix: Prefix for file paths in problem entities.
+            use_cache: Whether a previously scraped result of an unchanged page may be reused.
 
         Returns:
             PageScrapingResult containing Problem entities and assets count.
@@ -21,10 +21,21 @@ class ScrapingResult:
     start_time: datetime
     end_time: datetime
     metadata: Optional[Dict[str, Any]] = None  # Optional additional data
+    total_assets_downloaded: Optional[int] = None  # Running total kept by the scraping loop
+    elapsed_seconds: Optional[float] = None  # Measured on a monotonic clock, unaffected by wall-clock changes
+
+    @property
+    def assets_downloaded(self) -> int:
+        """Get total number of downloaded assets."""
+        if self.total_assets_downloaded is not None:
+            return self.total_assets_downloaded
+        return sum(page.get('assets_downloaded', 0) for page in self.page_results)
 
     @property
     def duration_seconds(self) -> float:
         """Get duration of scraping in seconds."""
+        if self.elapsed_seconds is not None:
+            return self.elapsed_seconds
         return (self.end_time - self.start_time).total_seconds()
 
     @property
@@ -2,6 +2,10 @@ from dataclasses import dataclass
 import re
 from urllib.parse import quote
 
+# Корень банка заданий ФИПИ; index.php и questions.php строятся от него
+FIPI_BANK_URL = "https://ege.fipi.ru/bank/"
+_PROJ_ID_RE = re.compile(r'^[A-F0-9]+$')
+
 SUBJECT_ALIAS_MAP = {
     "Математика. Базовый уровень": "math",
     "Математика. Профильный уровень": "promath",
@@ -41,6 +45,10 @@ SUBJECT_TO_PROJ_ID_MAP = {
 }
 
 
+# Reverse of SUBJECT_ALIAS_MAP, so from_alias is a dict lookup instead of a scan
+_OFFICIAL_NAME_BY_ALIAS = {alias: official_name for official_name, alias in SUBJECT_ALIAS_MAP.items()}
+
+
 def _get_proj_id_by_alias(alias: str) -> str:
     return SUBJECT_TO_PROJ_ID_MAP.get(alias, "UNKNOWN_PROJ_ID")
 
@@ -68,7 +76,7 @@ class SubjectInfo:
 
     @classmethod
     def from_alias(cls, alias: str) -> 'SubjectInfo':
-        official_name = next((name for name, al in SUBJECT_ALIAS_MAP.items() if al == alias), None)
+        official_name = _OFFICIAL_NAME_BY_ALIAS.get(alias)
         if official_name is None:
             raise ValueError(f"Unknown subject alias: {alias}")
         proj_id = _get_proj_id_by_alias(alias)
@@ -88,17 +96,16 @@ class SubjectInfo:
 
     @property
     def base_url(self) -> str:
-        if not re.match(r'^[A-F0-9]+$', self.proj_id):
-            raise ValueError(f"proj_id '{self.proj_id}' is not a valid hex string for URL construction.")
-        encoded_proj_id = quote(self.proj_id, safe='')
-        return f"https://ege.fipi.ru/bank/index.php?proj={encoded_proj_id}"
+        return self._bank_url("index.php")
 
     @property
     def questions_url(self) -> str:
-        if not re.match(r'^[A-F0-9]+$', self.proj_id):
+        return self._bank_url("questions.php")
+
+    def _bank_url(self, script: str) -> str:
+        if not _PROJ_ID_RE.match(self.proj_id):
             raise ValueError(f"proj_id '{self.proj_id}' is not a valid hex string for URL construction.")
-        encoded_proj_id = quote(self.proj_id, safe='')
-        return f"https://ege.fipi.ru/bank/questions.php?proj={encoded_proj_id}"
+        return f"{FIPI_BANK_URL}{script}?proj={quote(self.proj_id, safe='')}"
 
     @property
     def subject_name(self) -> str:
@@ -0,0 +1,90 @@
+from typing import Optional
+"""
+Infrastructure adapter that caps concurrent asset downloads of another IAssetDownloader.
+
+Processors issue all downloads of a block at once (asyncio.gather); wrapping the shared
+downloader with this adapter keeps the total number of in-flight requests to the FIPI
+host bounded, no matter how many blocks or pages are processed concurrently. Requests can
+also be spaced out to a maximum rate, so bursts of images do not get the client throttled.
+"""
+import asyncio
+import logging
+from pathlib import Path
+from src.domain.interfaces.external_services.i_asset_downloader import IAssetDownloader
+
+logger = logging.getLogger(__name__)
+
+
+class BoundedAssetDownloaderAdapter(IAssetDownloader):
+    """
+    Decorates an IAssetDownloader with a semaphore and a rate limit shared by all download calls.
+    """
+
+    def __init__(
+        self,
+        asset_downloader_impl: IAssetDownloader,
+        max_concurrent: int = 5,
+        max_requests_per_second: Optional[float] = None
+    ):
+        """
+        Initialize the adapter.
+
+        Args:
+            asset_downloader_impl: The downloader that performs the actual requests.
+            max_concurrent: Maximum number of downloads in flight at the same time.
+            max_requests_per_second: Maximum rate at which downloads start; None for no limit.
+        """
+        if max_concurrent <= 0:
+            raise ValueError("max_concurrent must be positive")
+        if max_requests_per_second is not None and max_requests_per_second <= 0:
+            raise ValueError("max_requests_per_second must be positive")
+        self._impl = asset_downloader_impl
+        # Created on first use: the adapter is built before asyncio.run() starts the loop,
+        # and on Python 3.9 a semaphore binds to the loop current at construction
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.max_concurrent = max_concurrent
+        self.max_requests_per_second = max_requests_per_second
+        # Downloads start no closer together than this; the lock orders waiters (created lazily too)
+        self._min_interval = 1.0 / max_requests_per_second if max_requests_per_second else 0.0
+        self._rate_lock: Optional[asyncio.Lock] = None
+        self._next_request_at = 0.0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        return self._semaphore
+
+    async def _wait_for_rate_slot(self) -> None:
+        """Sleep until the next download may start under max_requests_per_second."""
+        if not self._min_interval:
+            return
+        if self._rate_lock is None:
+            self._rate_lock = asyncio.Lock()
+        loop = asyncio.get_running_loop()
+        async with self._rate_lock:
+            now = loop.time()
+            delay = self._next_request_at - now
+            if delay > 0:
+                await asyncio.sleep(delay)
+                now += delay
+            self._next_request_at = now + self._min_interval
+
+    async def initialize(self):
+        """Initialize the wrapped downloader."""
+        await self._impl.initialize()
+
+    async def close(self):
+        """Close the wrapped downloader."""
+        await self._impl.close()
+
+    async def download(self, asset_url: str, destination_path: Path) -> bool:
+        """Download an asset to destination_path once a download slot is free."""
+        async with self._get_semaphore():
+            await self._wait_for_rate_slot()
+            return await self._impl.download(asset_url, destination_path)
+
+    async def download_bytes(self, asset_url: str) -> Optional[bytes]:
+        """Download an asset as bytes once a download slot is free."""
+        async with self._get_semaphore():
+            await self._wait_for_rate_slot()
+            return await self._impl.download_bytes(asset_url)
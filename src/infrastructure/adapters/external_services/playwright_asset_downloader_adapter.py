@@ -35,6 +35,8 @@ class PlaywrightAssetDownloaderAdapter:
         self._browser = None  # Store the browser instance
         self._initialized = False
         self.timeout = timeout  # FIX: Add the timeout attribute
+        # aiohttp session shared by all certificate-fallback downloads (see _get_http_session)
+        self._http_session = None
 
     async def initialize(self):
         """Initialize the Playwright context and API request context."""
@@ -70,6 +72,13 @@ class PlaywrightAssetDownloaderAdapter:
                 logger.error(f"Error closing browser used for request context: {e}")
             self._browser = None
 
+        if self._http_session is not None:
+            try:
+                await self._http_session.close()
+            except Exception as e:
+                logger.error(f"Error closing aiohttp session: {e}")
+            self._http_session = None
+
         if self._playwright_ctx:
             try:
                 await self._playwright_ctx.stop()
@@ -158,23 +167,36 @@ class PlaywrightAssetDownloaderAdapter:
             return None
 
     # --- Alternative implementations using aiohttp for SSL issues ---
+    def _get_http_session(self):
+        """
+        Return the aiohttp session used by the fallback downloads, creating it on first use.
+
+        One session (and connection pool) is reused for all fallback downloads, so only the
+        first request to a host pays for the TCP and TLS handshakes.
+        """
+        import aiohttp
+        if self._http_session is None or self._http_session.closed:
+            # Idle connections are kept for 30s so assets of the next page reuse them
+            connector = aiohttp.TCPConnector(ssl=False, limit=100, limit_per_host=10, keepalive_timeout=30)
+            self._http_session = aiohttp.ClientSession(connector=connector)
+        return self._http_session
+
     async def _download_with_aiohttp(self, asset_url: str, destination_path: Path) -> bool:
         """Alternative download method using aiohttp in case of Playwright SSL issues."""
         try:
             import aiohttp
-            connector = aiohttp.TCPConnector(ssl=False)
-            async with aiohttp.ClientSession(connector=connector) as session:
-                async with session.get(asset_url, timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:  # Используем self.timeout
-                    if response.status == 200:
-                        destination_path.parent.mkdir(parents=True, exist_ok=True)
-                        content = await response.read()
-                        with open(destination_path, 'wb') as f:
-                            f.write(content)
-                        logger.debug(f"Successfully downloaded asset using aiohttp: {asset_url}")
-                        return True
-                    else:
-                        logger.warning(f"aiohttp failed to download asset from {asset_url}. Status: {response.status}")
-                        return False
+            session = self._get_http_session()
+            async with session.get(asset_url, timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:  # Используем self.timeout
+                if response.status == 200:
+                    destination_path.parent.mkdir(parents=True, exist_ok=True)
+                    content = await response.read()
+                    with open(destination_path, 'wb') as f:
+                        f.write(content)
+                    logger.debug(f"Successfully downloaded asset using aiohttp: {asset_url}")
+                    return True
+                else:
+                    logger.warning(f"aiohttp failed to download asset from {asset_url}. Status: {response.status}")
+                    return False
         except ImportError:
             logger.error("aiohttp not installed, cannot use alternative download method.")
             return False
@@ -186,16 +208,15 @@ class PlaywrightAssetDownloaderAdapter:
         """Alternative bytes download method using aiohttp in case of Playwright SSL issues."""
         try:
             import aiohttp
-            connector = aiohttp.TCPConnector(ssl=False)
-            async with aiohttp.ClientSession(connector=connector) as session:
-                async with session.get(asset_url, timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:  # Используем self.timeout
-                    if response.status == 200:
-                        content = await response.read()
-                        logger.debug(f"Successfully downloaded bytes using aiohttp: {asset_url}")
-                        return content
-                    else:
-                        logger.warning(f"aiohttp failed to download bytes from {asset_url}. Status: {response.status}")
-                        return None
+            session = self._get_http_session()
+            async with session.get(asset_url, timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:  # Используем self.timeout
+                if response.status == 200:
+                    content = await response.read()
+                    logger.debug(f"Successfully downloaded bytes using aiohttp: {asset_url}")
+                    return content
+                else:
+                    logger.warning(f"aiohttp failed to download bytes from {asset_url}. Status: {response.status}")
+                    return None
         except ImportError:
             logger.error("aiohttp not installed, cannot use alternative bytes download method.")
             return None
@@ -1,21 +1,25 @@
 """
 Module for managing a single Playwright browser instance.
-Creates a new page for each get_page_content request and closes it afterwards.
-This allows one browser instance to handle multiple requests concurrently.
+Keeps one configured page open and reuses it for consecutive get_page_content requests;
+a request that arrives while that page is busy is served on a temporary page, so one
+browser instance can still handle multiple requests concurrently.
 
 Updated to use centralized configuration for timeouts and browser settings.
 """
+import asyncio
 import logging
-from playwright.async_api import async_playwright, Browser
+from playwright.async_api import async_playwright, Browser, Page
 
 logger = logging.getLogger(__name__)
 
+_WAIT_UNTIL = "networkidle"
+
 
 class BrowserManager:
     """
     Manages a single browser instance.
-    Creates a new page for each get_page_content request and closes it afterwards.
-    This allows one browser instance to handle multiple requests concurrently.
+    Reuses one configured page for consecutive get_page_content requests and falls back
+    to a temporary page when that page is busy, so concurrent requests still work.
     This class is intended to be managed by a pool mechanism (e.g., BrowserPoolServiceAdapter)
     to satisfy the IBrowserService contract.
 
@@ -33,6 +37,7 @@ class BrowserManager:
                 self.default_user_agent = getattr(config.browser, 'user_agent', "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
                 self.default_viewport_width = getattr(config.browser, 'viewport_width', 1920)
                 self.default_viewport_height = getattr(config.browser, 'viewport_height', 1080)
+                self.default_timeout = getattr(config.browser, 'timeout_seconds', 30)
             except ImportError:
                 # Fallback to hardcoded values if config is not available
                 self.base_url = 'https://ege.fipi.ru'
@@ -40,6 +45,7 @@ class BrowserManager:
                 self.default_user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
                 self.default_viewport_width = 1920
                 self.default_viewport_height = 1080
+                self.default_timeout = 30
         else:
             self.base_url = base_url.rstrip("/")
             # Still try to get other settings from config
@@ -49,16 +55,24 @@ class BrowserManager:
                 self.default_user_agent = getattr(config.browser, 'user_agent', "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
                 self.default_viewport_width = getattr(config.browser, 'viewport_width', 1920)
                 self.default_viewport_height = getattr(config.browser, 'viewport_height', 1080)
+                self.default_timeout = getattr(config.browser, 'timeout_seconds', 30)
             except ImportError:
                 self.default_headless = True
                 self.default_user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
                 self.default_viewport_width = 1920
                 self.default_viewport_height = 1080
+                self.default_timeout = 30
 
         self._browser: Browser | None = None
         self._playwright_ctx = None
         self._initialized = False
 
+        # Page reused across get_page_content calls; the lock marks it as busy.
+        # Created on first use: on Python 3.9 asyncio primitives bind to the loop current at
+        # construction, and the manager is built before asyncio.run() starts the real one.
+        self._shared_page: Page | None = None
+        self._shared_page_lock: asyncio.Lock | None = None
+
     async def initialize(self):
         """Initialize the browser context with centralized configuration."""
         if self._initialized:
@@ -73,6 +87,8 @@ class BrowserManager:
     async def close(self):
         """Close the browser and playwright context."""
         logger.info("Closing BrowserManager and its resources.")
+        await self._close_shared_page()
+
         if self._browser:
             try:
                 await self._browser.close()
@@ -105,7 +121,7 @@ class BrowserManager:
 
     async def get_page_content(self, url: str, timeout: int = None) -> str:
         """
-        Navigate to a URL on a *new* page, get the HTML content, and close the page.
+        Navigate to a URL, get the HTML content, and keep the page for the next request.
 
         Args:
             url: The URL to navigate to.
@@ -120,30 +136,54 @@ class BrowserManager:
 
         # Use provided timeout or get from centralized config
         if timeout is None:
-            try:
-                from src.core.config import config
-                timeout = getattr(config.browser, 'timeout_seconds', 30)
-            except ImportError:
-                timeout = 30  # Fallback to hardcoded default
+            timeout = self.default_timeout
 
-        page = None
+        shared_page_lock = self._get_shared_page_lock()
+        if shared_page_lock.locked():
+            # The shared page is busy with another request; serve this one on a temporary page
+            logger.debug(f"BrowserManager shared page busy, creating temporary page for {url}")
+            page = await self._create_page()
+            try:
+                return await self._load_content(page, url, timeout)
+            finally:
+                await self._close_page(page, url)
+
+        async with shared_page_lock:
+            if self._shared_page is None or self._shared_page.is_closed():
+                logger.debug("BrowserManager creating shared page")
+                self._shared_page = await self._create_page()
+            try:
+                return await self._load_content(self._shared_page, url, timeout)
+            except Exception:
+                # The page may be left mid-navigation; start the next request on a fresh one
+                await self._close_shared_page()
+                raise
+
+    def _get_shared_page_lock(self) -> asyncio.Lock:
+        """Lock marking the shared page as busy."""
+        if self._shared_page_lock is None:
+            self._shared_page_lock = asyncio.Lock()
+        return self._shared_page_lock
+
+    async def _create_page(self) -> Page:
+        """Create a new page with viewport and user agent from centralized configuration."""
+        page = await self._browser.new_page()
+        await page.set_viewport_size({
+            "width": self.default_viewport_width,
+            "height": self.default_viewport_height
+        })
+        await page.set_extra_http_headers({
+            "User-Agent": self.default_user_agent
+        })
+        return page
+
+    async def _load_content(self, page: Page, url: str, timeout: int) -> str:
+        """Navigate the page to url and return its HTML content."""
         try:
-            logger.debug(f"BrowserManager creating new page for {url} with timeout {timeout}s")
-            page = await self._browser.new_page()
-
-            # Set viewport and user agent from centralized configuration
-            await page.set_viewport_size({
-                "width": self.default_viewport_width,
-                "height": self.default_viewport_height
-            })
-            await page.set_extra_http_headers({
-                "User-Agent": self.default_user_agent
-            })
-
             page.set_default_timeout(timeout * 1000)  # Convert timeout to milliseconds
 
-            logger.debug(f"BrowserManager navigating page to {url}")
-            await page.goto(url, wait_until="networkidle", timeout=timeout * 1000)
+            logger.debug(f"BrowserManager navigating page to {url} with timeout {timeout}s")
+            await page.goto(url, wait_until=_WAIT_UNTIL, timeout=timeout * 1000)
             content = await page.content()
             logger.debug(f"Successfully fetched content from {url}")
             return content
@@ -151,11 +191,17 @@ class BrowserManager:
             logger.error(f"Error fetching content from {url}: {e}")
             # Re-raise to allow caller (e.g., BrowserPoolServiceAdapter) to handle
             raise
-        finally:
-            # Ensure the page is closed even if an error occurred during navigation/content retrieval
-            if page:
-                try:
-                    await page.close()
-                    logger.debug(f"Page for {url} closed.")
-                except Exception as e:
-                    logger.warning(f"Error closing page for {url}: {e}")
+
+    async def _close_page(self, page: Page, url: str) -> None:
+        """Close a page, logging instead of raising on failure."""
+        try:
+            await page.close()
+            logger.debug(f"Page for {url} closed.")
+        except Exception as e:
+            logger.warning(f"Error closing page for {url}: {e}")
+
+    async def _close_shared_page(self) -> None:
+        """Close the shared page, if one is open."""
+        if self._shared_page is not None:
+            page, self._shared_page = self._shared_page, None
+            await self._close_page(page, "shared page")
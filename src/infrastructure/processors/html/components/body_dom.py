@@ -0,0 +1,29 @@
+from typing import Any, Dict
+"""Shares the parsed body_html of a block between consecutive raw block processors"""
+from bs4 import BeautifulSoup
+from src.domain.html_processing.pure_html_transforms import FRAGMENT_PARSER
+
+_BODY_DOM_KEY = "_body_dom"
+
+
+def parse_body(raw_data: Dict[str, Any]) -> BeautifulSoup:
+    """
+    Return raw_data["body_html"] as a DOM.
+
+    If the previous processor saved its DOM with store_body and body_html has not
+    been replaced since, that DOM is returned instead of parsing the HTML again.
+    """
+    body_html = raw_data.get("body_html", "") or ""
+    cached = raw_data.get(_BODY_DOM_KEY)
+    if cached is not None and cached[0] is body_html:
+        return cached[1]
+    return BeautifulSoup(body_html, FRAGMENT_PARSER)
+
+
+def store_body(raw_data: Dict[str, Any], soup: BeautifulSoup) -> None:
+    """
+    Serialize soup into raw_data["body_html"] and keep the DOM for the next processor.
+    """
+    body_html = str(soup)
+    raw_data["body_html"] = body_html
+    raw_data[_BODY_DOM_KEY] = (body_html, soup)
@@ -1,9 +1,10 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 """FileDownloader implementation"""
 import asyncio
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 from src.domain.interfaces.html_processing.i_file_downloader import IFileDownloader
+from src.domain.interfaces.external_services.i_asset_downloader import AssetSavedCallback
 
 
 class FileDownloader(IFileDownloader):
@@ -16,10 +17,13 @@ class FileDownloader(IFileDownloader):
         download_dir: Path,  # Теперь ожидает Path, а не str
         files_prefix: str,
         max_concurrent: int,
-        asset_downloader
+        asset_downloader,
+        on_asset_saved: Optional[AssetSavedCallback] = None
     ) -> List[str]:
         """
-        Download multiple files concurrently
+        Download multiple files concurrently.
+
+        on_asset_saved, if given, is called with the path of every saved file.
         """
         if not file_links:
             return []
@@ -42,6 +46,8 @@ class FileDownloader(IFileDownloader):
                     relative_path = dest_path.relative_to(download_dir)
                     local_ref = str(relative_path).replace("\\", "/")
                     downloaded_files.append(local_ref)
+                    if on_asset_saved is not None:
+                        on_asset_saved(dest_path)
             except Exception:
                 pass
 
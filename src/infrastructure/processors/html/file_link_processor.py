@@ -2,6 +2,7 @@ from typing import Any, Dict
 """Refactored FileLinkProcessor with separated concerns"""
 import logging
 from pathlib import Path
+from src.infrastructure.processors.html.components.body_dom import parse_body, store_body
 from src.infrastructure.processors.html.components.file_link_extractor import FileLinkExtractor
 from src.infrastructure.processors.html.components.file_downloader import FileDownloader
 
@@ -24,8 +25,6 @@ class FileLinkProcessor:
         """
         Process file links with separated concerns
         """
-        from bs4 import BeautifulSoup
-
         body_html = raw_data.get("body_html", "") or ""
         base_url = context.get("base_url", "https://fipi.ru")
         run_folder = Path(context.get("run_folder_page", Path(".")))
@@ -37,7 +36,7 @@ class FileLinkProcessor:
             return raw_data
 
         # Extract file links
-        soup = BeautifulSoup(body_html, "html.parser")
+        soup = parse_body(raw_data)
         file_links = self.extractor.extract_file_links(soup)
 
         if not file_links:
@@ -51,7 +50,8 @@ class FileLinkProcessor:
             download_dir=run_folder,
             files_prefix=files_prefix,
             max_concurrent=6,
-            asset_downloader=downloader
+            asset_downloader=downloader,
+            on_asset_saved=context.get("on_asset_saved")
         )
 
         # Update HTML and file list
@@ -60,7 +60,7 @@ class FileLinkProcessor:
                 if local_file not in file_links_local:
                     file_links_local.append(local_file)
 
-        raw_data["body_html"] = str(soup)
+        store_body(raw_data, soup)
         raw_data["files"] = file_links_local
 
         return raw_data
@@ -1,11 +1,21 @@
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
+import asyncio
+import logging
 import re
-from bs4 import BeautifulSoup
+from src.infrastructure.processors.html.components.body_dom import parse_body, store_body
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 from src.domain.interfaces.html_processing.i_raw_block_processor import IRawBlockProcessor
 from src.domain.interfaces.external_services.i_asset_downloader import IAssetDownloader
 
+logger = logging.getLogger(__name__)
+
+# Patterns are compiled once at import and reused for every block
+_SHOW_PICTURE_SCRIPT_RE = re.compile(r'ShowPictureQ')
+_SHOW_PICTURE_ARG_RE = re.compile(r"ShowPictureQ\('([^']+)'\)")
+_INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*()]+')
+_REPEATED_UNDERSCORES_RE = re.compile(r'_+')
+
 
 class ImageScriptProcessor(IRawBlockProcessor):
     def __init__(self, asset_downloader: IAssetDownloader):
@@ -21,23 +31,24 @@ class ImageScriptProcessor(IRawBlockProcessor):
         body_html = raw_data.get("body_html", "") or ""
         run_folder: Path = Path(context.get("run_folder_page", Path(".")))
         files_prefix = context.get("files_location_prefix", "")
+        on_asset_saved = context.get("on_asset_saved")
 
         # Get asset_downloader from context as fallback if not injected via constructor
         asset_downloader = context.get("asset_downloader", self._asset_downloader)
 
         if not asset_downloader:
-            print("ERROR: No asset_downloader available in context or constructor for ImageScriptProcessor. Cannot download images.")
+            logger.error("No asset_downloader available in context or constructor for ImageScriptProcessor; cannot download images")
             raw_data["body_html"] = body_html
             raw_data["images"] = []
             return raw_data
 
-        soup = BeautifulSoup(body_html, "html.parser")
+        soup = parse_body(raw_data)
         images_local = raw_data.get("images", [])
 
         # Обрабатываем скрипты ShowPictureQ - создаем теги img
-        scripts = soup.find_all('script', string=re.compile(r'ShowPictureQ'))
+        scripts = soup.find_all('script', string=_SHOW_PICTURE_SCRIPT_RE)
         for script in scripts:
-            matches = re.findall(r"ShowPictureQ\('([^']+)'\)", script.string)
+            matches = _SHOW_PICTURE_ARG_RE.findall(script.string)
             for match in matches:
                 relative_path = match
                 # Создаем тег img для каждого изображения из скрипта
@@ -48,40 +59,40 @@ class ImageScriptProcessor(IRawBlockProcessor):
 
         # Скачиваем ВСЕ изображения (включая созданные из скриптов)
         img_tags = soup.find_all("img")
-        downloaded_files = set()
 
-        async def download_image(img_tag, idx):
+        # Группируем теги по имени файла: каждое изображение скачивается один раз,
+        # а все теги, ссылающиеся на него, получают локальный путь
+        tags_by_filename: Dict[str, List[Any]] = {}
+        url_by_filename: Dict[str, str] = {}
+        for idx, img_tag in enumerate(img_tags):
             src = img_tag.get("src")
             if not src:
-                return
+                continue
 
             # Формируем URL - используем ТОЛЬКО относительные пути как есть
             # Используем qfiles_location="../../" логику из JS
             base_for_resolution = "https://ege.fipi.ru/"
             full_url = urljoin(base_for_resolution, src.lstrip('/'))
 
-            print(f"DEBUG: Attempting to download image from URL (via asset_downloader): {full_url}")
-
             # Получаем имя файла и очищаем его от недопустимых символов
             filename = Path(urlparse(full_url).path).name
             if not filename:
                 filename = f"img_{idx}.png"
 
             # Очищаем имя файла от недопустимых символов для пути
-            clean_filename = re.sub(r'[<>:"/\\|?*()]+', '_', filename)
-            clean_filename = re.sub(r'_+', '_', clean_filename).strip('_')
+            clean_filename = _INVALID_FILENAME_CHARS_RE.sub('_', filename)
+            clean_filename = _REPEATED_UNDERSCORES_RE.sub('_', clean_filename).strip('_')
             if clean_filename.startswith('.'):
                 clean_filename = f"image_{idx}{clean_filename}"
 
-            print(f"DEBUG: Using cleaned filename: {clean_filename}")
+            logger.debug("Image %s will be saved as %s", full_url, clean_filename)
 
-            # Пропускаем если уже скачали
-            if clean_filename in downloaded_files:
-                return
+            tags_by_filename.setdefault(clean_filename, []).append(img_tag)
+            url_by_filename.setdefault(clean_filename, full_url)
 
-            # Скачиваем
-            dest_dir = run_folder / "assets"
-            dest_dir.mkdir(parents=True, exist_ok=True)
+        dest_dir = run_folder / "assets"
+
+        async def download_image(clean_filename: str, full_url: str) -> Optional[str]:
             dest_path = dest_dir / clean_filename
 
             try:
@@ -90,7 +101,7 @@ class ImageScriptProcessor(IRawBlockProcessor):
                 if content_bytes is not None:
                     # NEW: Check if dest_path is a directory before writing
                     if dest_path.is_dir():
-                        print(f"INFO: Removing directory {dest_path} to save file with the same name.")
+                        logger.info("Removing directory %s to save file with the same name", dest_path)
                         import shutil
                         shutil.rmtree(dest_path)
                     # NEW: Add explicit check for parent directory creation
@@ -98,23 +109,30 @@ class ImageScriptProcessor(IRawBlockProcessor):
                     # Write the content to the destination file
                     with open(dest_path, 'wb') as f:
                         f.write(content_bytes)
-                    # Update the img tag src to point to the local file
+                    # Update the img tags src to point to the local file
                     rel = dest_path.relative_to(run_folder)
                     local_ref = str(rel).replace("\\", "/")
-                    img_tag['src'] = f"{files_prefix}{local_ref}"
-                    images_local.append(local_ref)
-                    downloaded_files.add(clean_filename)
-                    print(f"✅ Downloaded (via asset_downloader): {clean_filename}")
-                    print(f"   Saved to: {dest_path}")
+                    for img_tag in tags_by_filename[clean_filename]:
+                        img_tag['src'] = f"{files_prefix}{local_ref}"
+                    if on_asset_saved is not None:
+                        on_asset_saved(dest_path)
+                    logger.debug("Downloaded %s to %s", clean_filename, dest_path)
+                    return local_ref
                 else:
-                    print(f"❌ Failed to download via asset_downloader: {clean_filename}")
+                    logger.warning("Failed to download image %s from %s", clean_filename, full_url)
             except Exception as e:
-                print(f"❌ Error downloading via asset_downloader {clean_filename}: {e}")
+                logger.warning("Error downloading image %s from %s: %s", clean_filename, full_url, e)
+            return None
 
-        # Запускаем загрузку последовательно чтобы избежать дублирования
-        for i, img_tag in enumerate(img_tags):
-            await download_image(img_tag, i)
+        # Скачиваем все изображения блока одним пакетом параллельно; ограничение
+        # одновременных загрузок обеспечивает сам asset_downloader
+        if url_by_filename:
+            dest_dir.mkdir(parents=True, exist_ok=True)
+            local_refs = await asyncio.gather(
+                *(download_image(name, url) for name, url in url_by_filename.items())
+            )
+            images_local.extend(ref for ref in local_refs if ref is not None)
 
-        raw_data["body_html"] = str(soup)
+        store_body(raw_data, soup)
         raw_data["images"] = images_local
         return raw_data
@@ -1,32 +1,39 @@
 from typing import Any, Dict
 import re
 from bs4 import BeautifulSoup
+from src.domain.html_processing.pure_html_transforms import FRAGMENT_PARSER
 from src.domain.interfaces.html_processing.i_raw_block_processor import IRawBlockProcessor
 
+# Patterns are compiled once at import and reused for every block
+_TASK_NUMBER_RE = re.compile(r"(?:Задание|Task)\s+(\d+)", re.IGNORECASE)
+_KES_RE = re.compile(r'(?:КЭС|кодификатор)[:\s]*([0-9.,\s-]+)', re.IGNORECASE)
+_KOS_RE = re.compile(r'(?:КОС|требование)[:\s]*([0-9.,\s-]+)', re.IGNORECASE)
+_CODE_SEPARATOR_RE = re.compile(r'[,\s]+')
+
 
 class TaskInfoProcessor(IRawBlockProcessor):
     async def process(self, raw_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         # Extract textual fields from header_html
         header_html = raw_data.get("header_html", "") or ""
-        soup = BeautifulSoup(header_html, "html.parser")
+        soup = BeautifulSoup(header_html, FRAGMENT_PARSER)
         text = soup.get_text(separator=" ", strip=True)
         # Task number
-        task_match = re.search(r"(?:Задание|Task)\s+(\d+)", text, re.IGNORECASE)
+        task_match = _TASK_NUMBER_RE.search(text)
         if task_match:
             raw_data["task_number"] = int(task_match.group(1))
         # KES codes (simple heuristic)
-        kes_matches = re.findall(r'(?:КЭС|кодификатор)[:\s]*([0-9.,\s-]+)', text, re.IGNORECASE)
+        kes_matches = _KES_RE.findall(text)
         kes_codes = []
         for m in kes_matches:
-            for part in re.split(r'[,\s]+', m.strip()):
+            for part in _CODE_SEPARATOR_RE.split(m.strip()):
                 if part:
                     kes_codes.append(part.strip().strip(","))
         raw_data["kes_codes"] = kes_codes
         # KOS codes
-        kos_matches = re.findall(r'(?:КОС|требование)[:\s]*([0-9.,\s-]+)', text, re.IGNORECASE)
+        kos_matches = _KOS_RE.findall(text)
         kos_codes = []
         for m in kos_matches:
-            for part in re.split(r'[,\s]+', m.strip()):
+            for part in _CODE_SEPARATOR_RE.split(m.strip()):
                 if part:
                     kos_codes.append(part.strip().strip(","))
         raw_data["kos_codes"] = kos_codes
@@ -1,15 +1,14 @@
 from typing import Any, Dict
-from bs4 import BeautifulSoup
+from src.infrastructure.processors.html.components.body_dom import parse_body, store_body
 from src.domain.interfaces.html_processing.i_raw_block_processor import IRawBlockProcessor
 
 
 class UnwantedElementRemover(IRawBlockProcessor):
     async def process(self, raw_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
-        body = raw_data.get("body_html", "") or ""
-        soup = BeautifulSoup(body, "html.parser")
+        soup = parse_body(raw_data)
         # Heuristics: remove scripts, style, ads, share buttons, input[type=button], forms
         for selector in ["script", "style", ".advert", ".ads", ".share", "button", "form", ".cookie-banner"]:
             for el in soup.select(selector):
                 el.decompose()
-        raw_data["body_html"] = str(soup)
+        store_body(raw_data, soup)
         return raw_data
@@ -2,7 +2,7 @@ from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.dialects.sqlite import JSON  # For List[str] fields
 from sqlalchemy import String, Integer, DateTime, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 """
 Implementation of IProblemRepository using SQLAlchemy.
 
@@ -114,36 +114,14 @@ class SQLAlchemyProblemRepository(IProblemRepository):
                 return
 
             # Convert Problem entity to DBProblem ORM model attributes
-            db_problem_attrs = {
-                "problem_id": problem.problem_id,
-                "subject_name": problem.subject_name,
-                "text": problem.text,
-                "source_url": problem.source_url,
-                "difficulty_level": problem.difficulty_level,
-                "task_number": problem.task_number,
-                "exam_part": problem.exam_part,
-                "answer": problem.answer,
-                "images": problem.images,
-                "files": problem.files,
-                "kes_codes": problem.kes_codes,
-                "topics": problem.topics,
-                "kos_codes": problem.kos_codes,
-                "form_id": problem.form_id,
-                "fipi_proj_id": problem.fipi_proj_id,
-                "updated_at": datetime.now()  # Always update the timestamp
-            }
+            db_problem_attrs = self._to_db_attrs(problem)
 
             if existing_db_problem:
-                if force_update:
-                    # Update existing record with new attributes
-                    for key, value in db_problem_attrs.items():
-                        setattr(existing_db_problem, key, value)
-                    logger.debug(f"Updated existing problem in database: {problem.problem_id} (forced update).")
-                else:
-                    # Default upsert: update existing record with new attributes
-                    for key, value in db_problem_attrs.items():
-                        setattr(existing_db_problem, key, value)
-                    logger.debug(f"Updated existing problem in database: {problem.problem_id}.")
+                # Update existing record with new attributes; an unchanged problem is not rewritten
+                if not self._update_if_changed(existing_db_problem, db_problem_attrs):
+                    logger.debug(f"Problem {problem.problem_id} is unchanged. Skipping update.")
+                    return
+                logger.debug(f"Updated existing problem in database: {problem.problem_id} (forced update).")
             else:
                 # Create new record
                 # Add created_at for new records
@@ -155,6 +133,87 @@ class SQLAlchemyProblemRepository(IProblemRepository):
             await session.commit()
             logger.debug(f"Saved problem to database: {problem.problem_id} (force_update={force_update})")
 
+    async def save_many(self, problems: List[Problem], force_update: bool = False) -> int:
+        """
+        Save several Problem entities in one session and one transaction.
+
+        Existing rows are looked up with a single query; otherwise the semantics match
+        save(): existing problems are skipped unless force_update is True, and even then
+        only problems whose content changed are rewritten.
+
+        Args:
+            problems: The Problem entities to save.
+            force_update: If True, existing problems are updated with the new attributes.
+
+        Returns:
+            The number of problems saved (skipped existing problems included, as with save()).
+        """
+        if not problems:
+            return 0
+
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(DBProblem).where(DBProblem.problem_id.in_({p.problem_id for p in problems}))
+            )
+            db_problems = {db_problem.problem_id: db_problem for db_problem in result.scalars()}
+
+            for problem in problems:
+                existing_db_problem = db_problems.get(problem.problem_id)
+                if existing_db_problem is not None:
+                    if force_update:
+                        self._update_if_changed(existing_db_problem, self._to_db_attrs(problem))
+                    continue
+
+                db_problem_attrs = self._to_db_attrs(problem)
+                db_problem_attrs["created_at"] = problem.created_at
+                new_db_problem = DBProblem(**db_problem_attrs)
+                session.add(new_db_problem)
+                # A repeated problem_id later in the batch sees this row as existing
+                db_problems[problem.problem_id] = new_db_problem
+
+            await session.commit()
+            logger.debug(f"Saved {len(problems)} problems to database in one transaction (force_update={force_update})")
+            return len(problems)
+
+    @staticmethod
+    def _update_if_changed(db_problem: DBProblem, db_problem_attrs: Dict[str, Any]) -> bool:
+        """
+        Copy db_problem_attrs onto db_problem if any column other than updated_at differs.
+
+        _to_db_attrs always sets a fresh updated_at, so assigning it unconditionally would
+        UPDATE every row of a forced re-scrape even when the problem is unchanged.
+
+        Returns:
+            True if db_problem was modified.
+        """
+        if all(getattr(db_problem, key) == value for key, value in db_problem_attrs.items() if key != "updated_at"):
+            return False
+        for key, value in db_problem_attrs.items():
+            setattr(db_problem, key, value)
+        return True
+
+    @staticmethod
+    def _to_db_attrs(problem: Problem) -> Dict[str, Any]:
+        """Map Problem entity fields to DBProblem column values."""
+        return {
+            "problem_id": problem.problem_id,
+            "subject_name": problem.subject_name,
+            "text": problem.text,
+            "source_url": problem.source_url,
+            "difficulty_level": problem.difficulty_level,
+            "task_number": problem.task_number,
+            "exam_part": problem.exam_part,
+            "answer": problem.answer,
+            "images": problem.images,
+            "files": problem.files,
+            "kes_codes": problem.kes_codes,
+            "topics": problem.topics,
+            "kos_codes": problem.kos_codes,
+            "form_id": problem.form_id,
+            "fipi_proj_id": problem.fipi_proj_id,
+            "updated_at": datetime.now()  # Always update the timestamp
+        }
+
     async def clear_subject_problems(self, subject_name: str) -> None:
         """
         Clear all problems for a specific subject.
@@ -203,6 +262,27 @@ class SQLAlchemyProblemRepository(IProblemRepository):
             # Convert list of DBProblem ORM models back to list of Problem entities
             return [self._map_db_to_domain(db_prob) for db_prob in db_problems]
 
+    async def get_source_urls_by_subject(self, subject_name: str) -> List[str]:
+        """
+        Retrieve the distinct source URLs of the problems stored for a subject.
+
+        Only the source_url column is selected, so progress checks do not load
+        and map every problem of the subject.
+
+        Args:
+            subject_name: The name of the subject (e.g., "Mathematics").
+
+        Returns:
+            A list of distinct, non-empty source URLs for the given subject name.
+        """
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(DBProblem.source_url)
+                .where(DBProblem.subject_name == subject_name, DBProblem.source_url != "")
+                .distinct()
+            )
+            return list(result.scalars().all())
+
     def _map_db_to_domain(self, db_problem: DBProblem) -> Problem:
         """
         Convert a DBProblem ORM model instance to a Problem domain entity.
@@ -1,10 +1,10 @@
 from typing import List
 """BlockParser implementation for HTML block parsing"""
 import logging
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
 from src.domain.interfaces.html_processing.i_block_parser import IBlockParser
-from src.domain.html_processing.pure_html_transforms import extract_block_pairs
+from src.domain.html_processing.pure_html_transforms import extract_block_elements
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +14,10 @@ class BlockParser(IBlockParser):
 
     def __init__(self, primary_parser=None):
         self.primary_parser = primary_parser
+        # The strategy never changes after construction, so it is chosen once here
+        self._parse_blocks = (
+            self.parse_with_primary_parser if primary_parser else self.parse_with_fallback
+        )
 
     def parse_html_blocks(self, html_content: str) -> List[List[Tag]]:
         """
@@ -29,11 +33,7 @@ class BlockParser(IBlockParser):
             return []
 
         try:
-            # Try primary parser first if available
-            if self.primary_parser:
-                return self.parse_with_primary_parser(html_content)
-            else:
-                return self.parse_with_fallback(html_content)
+            return self._parse_blocks(html_content)
         except Exception as e:
             logger.error(f"BlockParser failed to parse HTML blocks: {e}")
             return []
@@ -60,13 +60,5 @@ class BlockParser(IBlockParser):
         Returns:
             List of grouped block elements
         """
-        block_pairs = extract_block_pairs(html_content)
-        grouped_blocks = []
-
-        for header_html, body_html in block_pairs:
-            header_dom = BeautifulSoup(header_html or "", "html.parser").find()
-            body_dom = BeautifulSoup(body_html or "", "html.parser").find() if body_html else None
-            elements = [el for el in (header_dom, body_dom) if el is not None]
-            grouped_blocks.append(elements)
-
-        return grouped_blocks
+        # Elements come straight from the parsed page; fragments are not re-parsed
+        return extract_block_elements(html_content)
@@ -5,12 +5,18 @@ from src.domain.interfaces.scraping.i_content_fetcher import IContentFetcher
 
 logger = logging.getLogger(__name__)
 
+# Waiting for network idle also lets the questions iframe finish loading,
+# so IframeHandler can read it from the page without a second navigation
+_WAIT_UNTIL = "networkidle"
+
 
 class ContentFetcher(IContentFetcher):
     """Fetches HTML content from URLs with browser management"""
 
-    def __init__(self, browser_service):
+    def __init__(self, browser_service, response_cache=None):
         self.browser_service = browser_service
+        # Optional DocumentResponseCache routed into every page this fetcher creates
+        self.response_cache = response_cache
         self._browser_manager = None
         self._page = None
 
@@ -38,27 +44,14 @@ class ContentFetcher(IContentFetcher):
             raise RuntimeError("Browser manager is not available")
 
         try:
-            # Create new page and configure it
-            self._page = await self._browser_manager._browser.new_page()
-            
-            # Используем значения по умолчанию если атрибуты отсутствуют
-            viewport_width = getattr(self._browser_manager, 'default_viewport_width', 1280)
-            viewport_height = getattr(self._browser_manager, 'default_viewport_height', 720)
-            user_agent = getattr(self._browser_manager, 'default_user_agent', 
-                                 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36')
-            
-            await self._page.set_viewport_size({
-                "width": viewport_width,
-                "height": viewport_height
-            })
-            await self._page.set_extra_http_headers({
-                "User-Agent": user_agent
-            })
+            # Reuse the page kept open from a previous fetch; only a new page needs configuring
+            if self._page is None:
+                self._page = await self._create_page()
             self._page.set_default_timeout(timeout * 1000)
 
             # Navigate to URL and get content
             logger.debug(f"ContentFetcher navigating to {url} with timeout {timeout}s")
-            await self._page.goto(url, wait_until="networkidle", timeout=timeout * 1000)
+            await self._page.goto(url, wait_until=_WAIT_UNTIL, timeout=timeout * 1000)
 
             content = await self._page.content()
             final_url = url
@@ -70,6 +63,27 @@ class ContentFetcher(IContentFetcher):
             await self.cleanup_browser()
             raise
 
+    async def _create_page(self) -> Any:
+        """Create a new browser page configured with viewport and user agent"""
+        page = await self._browser_manager._browser.new_page()
+
+        # Используем значения по умолчанию если атрибуты отсутствуют
+        viewport_width = getattr(self._browser_manager, 'default_viewport_width', 1280)
+        viewport_height = getattr(self._browser_manager, 'default_viewport_height', 720)
+        user_agent = getattr(self._browser_manager, 'default_user_agent', 
+                             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36')
+
+        await page.set_viewport_size({
+            "width": viewport_width,
+            "height": viewport_height
+        })
+        await page.set_extra_http_headers({
+            "User-Agent": user_agent
+        })
+        if self.response_cache is not None:
+            await self.response_cache.install(page)
+        return page
+
     async def cleanup_browser(self):
         """Cleanup browser resources"""
         if self._page:
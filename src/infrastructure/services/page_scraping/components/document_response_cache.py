@@ -0,0 +1,107 @@
+from typing import Any, Dict, Optional, Tuple
+"""On-disk cache of HTML document responses, revalidated with conditional GET"""
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Response headers that are stored with the cached body and replayed on a 304
+_REPLAYED_HEADERS = ('content-type', 'etag', 'last-modified')
+
+
+class DocumentResponseCache:
+    """
+    Stores HTML documents (main pages and the questions iframe) by URL together with
+    their ETag/Last-Modified validators.
+
+    Installed on a Playwright page with install(); document requests for a cached URL
+    are then sent with If-None-Match/If-Modified-Since, and a 304 answer is fulfilled
+    from disk, so unchanged FIPI pages are not transferred again.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+
+    async def install(self, page: Any) -> None:
+        """Route the page's requests through this cache"""
+        await page.route("**/*", self.handle_route)
+
+    async def handle_route(self, route: Any, request: Any) -> None:
+        """Playwright route handler: revalidate cached documents, pass everything else through"""
+        if request.resource_type != "document" or request.method != "GET":
+            await route.continue_()
+            return
+
+        cached = self._load(request.url)
+        headers = dict(request.headers)
+        if cached is not None:
+            _, cached_headers = cached
+            if 'etag' in cached_headers:
+                headers['if-none-match'] = cached_headers['etag']
+            if 'last-modified' in cached_headers:
+                headers['if-modified-since'] = cached_headers['last-modified']
+
+        try:
+            response = await route.fetch(headers=headers)
+        except Exception as e:
+            # Nothing has been fetched yet, so the request can still go out unmodified
+            await self._release(route, request.url, e, fetched=False)
+            return
+
+        try:
+            if response.status == 304 and cached is not None:
+                body, cached_headers = cached
+                logger.debug("Document not modified, serving from cache: %s", request.url)
+                await route.fulfill(status=200, headers=cached_headers, body=body)
+                return
+
+            body = await response.body()
+            if response.status == 200:
+                self._store(request.url, body, response.headers)
+            await route.fulfill(response=response, body=body)
+        except Exception as e:
+            await self._release(route, request.url, e, fetched=True)
+
+    @staticmethod
+    async def _release(route: Any, url: str, error: Exception, fetched: bool) -> None:
+        """
+        Finish a route the cache failed to serve, so navigation fails or proceeds
+        at once instead of hanging until its timeout: before a response was fetched
+        the request is continued unmodified, afterwards it is aborted.
+        """
+        logger.warning("Document cache failed for %s: %s; %s", url, error,
+                       "aborting the request" if fetched else "passing the request through")
+        try:
+            if fetched:
+                await route.abort()
+            else:
+                await route.continue_()
+        except Exception as e:
+            # The page is already closed, nothing is waiting for this route any more
+            logger.debug("Could not finish route for %s: %s", url, e)
+
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.html", self.cache_dir / f"{key}.json"
+
+    def _load(self, url: str) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        body_path, meta_path = self._paths(url)
+        try:
+            return body_path.read_bytes(), json.loads(meta_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, url: str, body: bytes, headers: Dict[str, str]) -> None:
+        replayed = {name: headers[name] for name in _REPLAYED_HEADERS if name in headers}
+        if 'etag' not in replayed and 'last-modified' not in replayed:
+            # Without validators the entry could never be revalidated
+            return
+        body_path, meta_path = self._paths(url)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            body_path.write_bytes(body)
+            meta_path.write_text(json.dumps(replayed), encoding='utf-8')
+        except OSError as e:
+            logger.warning("Could not cache document %s: %s", url, e)
@@ -1,13 +1,21 @@
-from typing import Optional, Tuple
+from typing import Optional
 """IframeHandler implementation for page scraping"""
 import logging
 import urllib.parse
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
-from src.domain.interfaces.scraping.i_iframe_handler import IIframeHandler
+from src.domain.html_processing.pure_html_transforms import DOCUMENT_PARSER, decode_html
+from src.domain.interfaces.scraping.i_iframe_handler import IframeContent, IIframeHandler
 
 logger = logging.getLogger(__name__)
 
+_QUESTIONS_IFRAME_TAG = 'iframe'
+_QUESTIONS_IFRAME_ID = 'questions_container'
+_WAIT_UNTIL = 'networkidle'
+
+# Со страницы нужен только src одного iframe — остальное дерево не строим.
+_QUESTIONS_IFRAME_STRAINER = SoupStrainer(_QUESTIONS_IFRAME_TAG, id=_QUESTIONS_IFRAME_ID)
+
 
 class IframeHandler(IIframeHandler):
     """Handles iframe content extraction and processing"""
@@ -18,7 +26,7 @@ class IframeHandler(IIframeHandler):
         url: str, 
         timeout: int,
         main_content: str
-    ) -> Tuple[str, str]:
+    ) -> IframeContent:
         """
         Handle iframe content extraction with fallback
 
@@ -29,28 +37,35 @@ class IframeHandler(IIframeHandler):
             main_content: Main page content
 
         Returns:
-            Tuple of (actual_content, source_url)
+            IframeContent(content, source_url)
         """
         actual_page_content = main_content
         actual_source_url = url
 
-        page_soup = BeautifulSoup(main_content, "html.parser")
+        page_soup = BeautifulSoup(decode_html(main_content), DOCUMENT_PARSER, parse_only=_QUESTIONS_IFRAME_STRAINER)
         questions_iframe = self.find_questions_iframe(page_soup)
 
         if not questions_iframe:
             logger.debug(f"No questions iframe found on {url}.")
-            return actual_page_content, actual_source_url
+            return IframeContent(actual_page_content, actual_source_url)
 
         iframe_src = questions_iframe.get('src')
         if not iframe_src:
             logger.warning(f"Iframe found on {url} without 'src'; using main page content.")
-            return actual_page_content, actual_source_url
+            return IframeContent(actual_page_content, actual_source_url)
 
         full_iframe_url = urllib.parse.urljoin(url, iframe_src)
         actual_source_url = full_iframe_url
 
+        # The browser has already loaded the iframe together with the main page;
+        # reading it from there saves a second navigation
+        loaded_frame_content = await self._read_loaded_frame(page, full_iframe_url)
+        if loaded_frame_content:
+            logger.debug(f"Read iframe content ({len(loaded_frame_content)} chars) from loaded frame {full_iframe_url}")
+            return IframeContent(loaded_frame_content, actual_source_url)
+
         try:
-            await page.goto(full_iframe_url, wait_until="networkidle", timeout=timeout * 1000)
+            await page.goto(full_iframe_url, wait_until=_WAIT_UNTIL, timeout=timeout * 1000)
             actual_page_content = await page.content()
             logger.debug(f"Fetched iframe content ({len(actual_page_content)} chars) from {full_iframe_url}")
         except Exception as e_iframe:
@@ -61,7 +76,28 @@ class IframeHandler(IIframeHandler):
             actual_page_content = main_content
             actual_source_url = url
 
-        return actual_page_content, actual_source_url
+        return IframeContent(actual_page_content, actual_source_url)
+
+    async def _read_loaded_frame(self, page: any, frame_url: str) -> Optional[str]:
+        """
+        Return the content of a child frame of page already loaded from frame_url
+
+        Args:
+            page: Browser page instance
+            frame_url: Absolute URL of the questions iframe
+
+        Returns:
+            Frame HTML content, or None if no such frame is loaded
+        """
+        for frame in getattr(page, 'frames', None) or []:
+            if frame is getattr(page, 'main_frame', None) or frame.url != frame_url:
+                continue
+            try:
+                return await frame.content()
+            except Exception as e_frame:
+                logger.debug(f"Could not read loaded frame {frame_url}: {e_frame}")
+                return None
+        return None
 
     def find_questions_iframe(self, soup: BeautifulSoup) -> Optional[any]:
         """
@@ -73,4 +109,4 @@ class IframeHandler(IIframeHandler):
         Returns:
             Iframe element if found, None otherwise
         """
-        return soup.find('iframe', id='questions_container')
+        return soup.find(_QUESTIONS_IFRAME_TAG, id=_QUESTIONS_IFRAME_ID)
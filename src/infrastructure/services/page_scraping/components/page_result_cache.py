@@ -0,0 +1,93 @@
+from typing import Any, Dict, List, Optional
+"""On-disk cache of scraped page results, keyed by page URL and content hash"""
+import dataclasses
+import hashlib
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+
+import orjson
+
+from src.domain.models.problem import Problem
+
+logger = logging.getLogger(__name__)
+
+# Problem fields stored as ISO strings in the cache files (orjson writes datetimes as RFC 3339)
+_DATETIME_FIELDS = ('created_at', 'updated_at')
+
+# Version of the page -> problems extraction. Bump it whenever a change to the block parser
+# or the HTML processors changes the problems extracted from the same HTML, so that results
+# cached by the old code are not reused.
+EXTRACTION_VERSION = 1
+
+# Part of every cache key: the extraction version and the Problem fields, so that both
+# extraction changes and changes to the Problem model invalidate existing entries
+_CACHE_KEY_PREFIX = f"v{EXTRACTION_VERSION}:" + ",".join(f.name for f in dataclasses.fields(Problem)) + ":"
+
+
+class PageResultCache:
+    """
+    Remembers the problems extracted from each page together with a hash of the
+    page HTML they were extracted from.
+
+    When a page is fetched again and its HTML hashes the same, the cached problems
+    are returned instead of parsing the page and downloading its assets again.
+    Entries older than ttl_seconds are ignored, so unchanged pages are still
+    re-scraped from time to time. Entries are keyed by EXTRACTION_VERSION and the
+    Problem fields as well as the URL, so results of older extraction code are never
+    returned.
+    """
+
+    def __init__(self, cache_dir: Path, ttl_seconds: Optional[float] = None):
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def content_hash(html: str) -> str:
+        """Hash of the page HTML used to detect unchanged pages"""
+        return hashlib.sha1(html.encode('utf-8', errors='replace')).hexdigest()
+
+    def load(self, url: str, content_hash: str) -> Optional[List[Problem]]:
+        """Cached problems for url if its content is unchanged and the entry is fresh"""
+        try:
+            entry = orjson.loads(self._path(url).read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+        if entry.get('content_hash') != content_hash:
+            return None
+        if self.ttl_seconds is not None and time.time() - entry.get('stored_at', 0) > self.ttl_seconds:
+            return None
+
+        try:
+            return [self._problem_from_dict(data) for data in entry['problems']]
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning("Ignoring unreadable page cache entry for %s: %s", url, e)
+            return None
+
+    def store(self, url: str, content_hash: str, problems: List[Problem]) -> None:
+        """Remember the problems extracted from url's current content"""
+        entry = {
+            'content_hash': content_hash,
+            'stored_at': time.time(),
+            # orjson serializes the Problem dataclasses and their datetimes natively
+            'problems': problems,
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._path(url).write_bytes(orjson.dumps(entry))
+        except (OSError, orjson.JSONEncodeError) as e:
+            logger.warning("Could not cache page result for %s: %s", url, e)
+
+    def _path(self, url: str) -> Path:
+        key = _CACHE_KEY_PREFIX + url
+        return self.cache_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+    @staticmethod
+    def _problem_from_dict(data: Dict[str, Any]) -> Problem:
+        data = dict(data)
+        for name in _DATETIME_FIELDS:
+            if data.get(name) is not None:
+                data[name] = datetime.fromisoformat(data[name])
+        return Problem(**data)
@@ -27,6 +27,14 @@ class PageScrapingAdapter(IPageScrapingService):
     def __init__(self, page_scraping_service: PageScrapingService):
         self._page_scraping_service = page_scraping_service
 
+    async def start(self) -> None:
+        """Keep the underlying service's browser page alive until stop()."""
+        await self._page_scraping_service.start()
+
+    async def stop(self) -> None:
+        """Release the underlying service's browser resources."""
+        await self._page_scraping_service.stop()
+
     async def scrape_page(
         self,
         url: str,
@@ -34,7 +42,8 @@ class PageScrapingAdapter(IPageScrapingService):
         base_url: str,
         timeout: int = 30,
         run_folder_page: Optional[Path] = None,
-        files_location_prefix: str = ""
+        files_location_prefix: str = "",
+        use_cache: bool = True
     ) -> PageScrapingResult:
         """
         Adapt the existing PageScrapingService to return PageScrapingResult.
@@ -49,7 +58,8 @@ class PageScrapingAdapter(IPageScrapingService):
                 base_url=base_url,
                 timeout=timeout,
                 run_folder_page=run_folder_page,
-                files_location_prefix=files_location_prefix
+                files_location_prefix=files_location_prefix,
+                use_cache=use_cache
             )
 
             # Распаковываем кортеж (List[Any], int)
@@ -58,7 +68,7 @@ class PageScrapingAdapter(IPageScrapingService):
 
             problems_list = list(problems_list) if problems_list else []
 
-            logger.debug(f"Adapter: {len(problems_list)} problems, {assets_downloaded} assets (FS count)")
+            logger.debug("Adapter: %d problems, %d assets", len(problems_list), assets_downloaded)
 
             return PageScrapingResult(
                 problems=problems_list,
@@ -66,5 +76,5 @@ class PageScrapingAdapter(IPageScrapingService):
             )
 
         except Exception as e:
-            logger.error(f"Error in page scraping adapter for {url}: {e}", exc_info=True)
+            logger.error("Error in page scraping adapter for %s: %s", url, e, exc_info=True)
             return PageScrapingResult(problems=[], assets_downloaded=0)
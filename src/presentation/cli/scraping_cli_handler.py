@@ -8,6 +8,13 @@ import asyncio
 import logging
 import argparse
 from pathlib import Path
+
+try:
+    # Optional faster event loop; not available on Windows
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from src.application.use_cases.scraping.scrape_subject_use_case import ScrapeSubjectUseCase
 from src.application.value_objects.scraping.scraping_config import ScrapingConfig, ScrapingMode
 from src.domain.value_objects.scraping.subject_info import SubjectInfo
@@ -30,7 +37,7 @@ class ScrapingCLIHandler:
         """
         self.scrape_use_case = scrape_use_case
 
-    async def run_scraping(self, subject_alias: str, mode: str = "full", start_page: int = None, end_page: int = None, force_restart: bool = False, base_run_folder: Path = Path("data")):
+    async def run_scraping(self, subject_alias: str, mode: str = "full", start_page: int = None, end_page: int = None, force_restart: bool = False, base_run_folder: Path = Path("data"), workers: int = 1):
         """
         Run the scraping process for a given subject.
         Args:
@@ -40,6 +47,7 @@ class ScrapingCLIHandler:
             end_page: Ending page number for 'range' mode.
             force_restart: If True, existing problems are updated.
             base_run_folder: Base path for run data and assets.
+            workers: Number of pages scraped concurrently; more than 1 enables parallel mode.
         """
         logger.info(f"CLI Handler: Starting scraping for subject '{subject_alias}' in mode '{mode}'.")
 
@@ -58,6 +66,9 @@ class ScrapingCLIHandler:
                 mode_enum = ScrapingMode.SEQUENTIAL
             elif mode == "full":
                 mode_enum = ScrapingMode.SEQUENTIAL
+            if workers > 1:
+                # Страницы запрашиваются скользящим окном из workers штук
+                mode_enum = ScrapingMode.PARALLEL
 
             # Prepare scraping config
             config = ScrapingConfig(
@@ -66,6 +77,7 @@ class ScrapingCLIHandler:
                 force_restart=force_restart,
                 start_page=start_page,
                 max_pages=end_page,
+                parallel_workers=max(workers, 1),
             )
 
             # Execute use case - it will handle all progress reporting internally
@@ -95,6 +107,7 @@ def main():
     parser.add_argument("--end-page", type=int, help="End page for 'range' mode")
     parser.add_argument("--force-restart", action="store_true", help="Force restart (update existing problems)")
     parser.add_argument("--run-folder", type=Path, default=Path("data"), help="Base folder for run data and assets")
+    parser.add_argument("--workers", type=int, default=1, help="Number of pages scraped concurrently (default: 1, sequential)")
 
     args = parser.parse_args()
 
@@ -103,6 +116,7 @@ def main():
     print(f"Start page: {args.start_page}")
     print(f"End page: {args.end_page}")
     print(f"Force restart: {args.force_restart}")
+    print(f"Workers: {args.workers}")
     print(f"Run folder: {args.run_folder}")
 
     # Create components
@@ -120,7 +134,8 @@ def main():
                 start_page=args.start_page,
                 end_page=args.end_page,
                 force_restart=args.force_restart,
-                base_run_folder=args.run_folder
+                base_run_folder=args.run_folder,
+                workers=args.workers
             )
         except Exception as e:
             logger.error(f"Critical error during scraping: {e}", exc_info=True)
@@ -137,8 +152,12 @@ def main():
             except Exception as e:
                 logger.error(f"Error closing asset downloader: {e}")
 
-    # Run the async function with cleanup
-    asyncio.run(run_with_cleanup())
+    # Run the async function with cleanup; uvloop.run() uses uvloop for this run only,
+    # without replacing the process-wide event loop policy
+    if uvloop is not None:
+        uvloop.run(run_with_cleanup())
+    else:
+        asyncio.run(run_with_cleanup())
 
 
 if __name__ == "__main__":
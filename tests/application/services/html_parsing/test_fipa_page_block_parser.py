@@ -0,0 +1,60 @@
+"""
+Tests for FIPIPageBlockParser - grouping of header/qblock elements into task blocks.
+
+These tests use real HTML fragments and verify the resulting groups by state.
+"""
+from src.application.services.html_parsing.fipa_page_block_parser import FIPIPageBlockParser
+
+
+def test_parse_blocks_pairs_header_and_qblock_in_document_order():
+    """Header (i*) and qblock (q*) divs with the same identifier form one block"""
+    html = """
+    <div id="i111" class="task-header-panel">Header 1</div>
+    <div id="q111" class="qblock">Body 1</div>
+    <div id="i222" class="task-header-panel">Header 2</div>
+    <div id="q222" class="qblock">Body 2</div>
+    """
+
+    blocks = FIPIPageBlockParser().parse_blocks(html)
+
+    assert [[el.get('id') for el in block] for block in blocks] == [
+        ["i111", "q111"],
+        ["i222", "q222"],
+    ]
+
+
+def test_parse_blocks_handles_interleaved_groups():
+    """Pairing is by identifier, not by index, so interleaved pages are grouped correctly"""
+    html = """
+    <div id="i111">Header 1</div>
+    <div id="i222">Header 2</div>
+    <div id="q222" class="qblock">Body 2</div>
+    <div id="q111" class="qblock">Body 1</div>
+    """
+
+    blocks = FIPIPageBlockParser().parse_blocks(html)
+
+    assert [[el.get('id') for el in block] for block in blocks] == [
+        ["i111", "q111"],
+        ["i222", "q222"],
+    ]
+
+
+def test_parse_blocks_prefers_question_forms_over_divs():
+    """When qform* forms are present, divs are not used for grouping"""
+    html = """
+    <div id="i111">Header 1</div>
+    <form name="qform111"><div id="q111">Body 1</div></form>
+    <form name="search"></form>
+    """
+
+    blocks = FIPIPageBlockParser().parse_blocks(html)
+
+    assert len(blocks) == 1
+    assert blocks[0][0].name == "form"
+    assert blocks[0][0].get('name') == "qform111"
+
+
+def test_parse_blocks_returns_empty_list_for_page_without_tasks():
+    """A page without tasks yields no blocks"""
+    assert FIPIPageBlockParser().parse_blocks("<div class='other'>Nothing</div>") == []
@@ -6,7 +6,13 @@ use real data structures instead of mocks.
 """
 import pytest
 from datetime import datetime
-from src.application.services.scraping.progress_logic import determine_next_page, extract_page_number_from_url
+from src.application.services.scraping.progress_logic import (
+    determine_next_page,
+    determine_next_page_from_highest,
+    extract_page_number_from_url,
+    get_highest_page_from_urls,
+    needs_scraping_history,
+)
 from src.application.value_objects.scraping.scraping_config import ScrapingConfig, ScrapingMode
 from src.domain.value_objects.scraping.subject_info import SubjectInfo
 from src.domain.models.problem import Problem
@@ -117,3 +123,30 @@ def test_determine_next_page_uses_config_start_page():
     
     next_page = determine_next_page(existing_problems, config)
     assert next_page == 5
+
+def test_get_highest_page_from_urls_ignores_non_page_urls():
+    """Only FIPI page URLs contribute to the highest scraped page"""
+    source_urls = [
+        "https://ege.fipi.ru/bank/questions.php?proj=E040A72A1A3DABA14C90C97E0B6EE7DC&page=2",
+        "https://ege.fipi.ru/bank/questions.php?proj=E040A72A1A3DABA14C90C97E0B6EE7DC&page=0",
+        "https://example.com/other?page=9",
+        "",
+    ]
+    assert get_highest_page_from_urls(source_urls) == 3
+    assert get_highest_page_from_urls([]) is None
+
+def test_determine_next_page_from_highest_continues_after_highest_page():
+    """The next page follows the highest scraped page unless a restart is forced"""
+    config = ScrapingConfig(mode=ScrapingMode.SEQUENTIAL, start_page=None, max_pages=None, force_restart=False)
+    assert determine_next_page_from_highest(3, config) == 4
+    assert determine_next_page_from_highest(None, config) == 1
+    assert determine_next_page_from_highest(3, config, highest_known_page=3) == 3
+    assert determine_next_page_from_highest(3, ScrapingConfig(force_restart=True)) == 1
+
+
+def test_needs_scraping_history_only_when_continuing_from_stored_progress():
+    """Stored progress is only consulted when neither a restart nor a start page is requested"""
+    assert needs_scraping_history(ScrapingConfig(start_page="init", force_restart=False)) is True
+    assert needs_scraping_history(ScrapingConfig(start_page="invalid", force_restart=False)) is True
+    assert needs_scraping_history(ScrapingConfig(start_page="5", force_restart=False)) is False
+    assert needs_scraping_history(ScrapingConfig(start_page="init", force_restart=True)) is False
@@ -0,0 +1,87 @@
+"""
+Tests for ScrapingProgressReporter output.
+"""
+import io
+from datetime import datetime, timedelta
+from src.application.services.scraping.progress_reporter import ScrapingProgressReporter
+from src.domain.value_objects.scraping.scraping_result import ScrapingResult
+from src.domain.value_objects.scraping.subject_info import SubjectInfo
+
+
+class CountingStream(io.StringIO):
+    """StringIO that counts write() calls"""
+
+    def __init__(self):
+        super().__init__()
+        self.write_calls = 0
+
+    def write(self, text):
+        self.write_calls += 1
+        return super().write(text)
+
+
+def test_report_summary_writes_whole_summary_at_once():
+    """The summary is emitted with a single write and lists at most three errors"""
+    start = datetime(2026, 1, 1, 12, 0, 0)
+    result = ScrapingResult(
+        subject_name="Математика. Базовый уровень",
+        success=False,
+        total_pages=2,
+        total_problems_found=5,
+        total_problems_saved=4,
+        page_results=[{'assets_downloaded': 2}, {'assets_downloaded': 3}],
+        errors=["e1", "e2", "e3", "e4"],
+        start_time=start,
+        end_time=start + timedelta(seconds=3)
+    )
+    output = CountingStream()
+
+    ScrapingProgressReporter(output).report_summary(result)
+
+    lines = output.getvalue().splitlines()
+    assert output.write_calls == 1
+    assert "Total assets downloaded: 5" in lines
+    assert "Total duration: 3.00s" in lines
+    assert lines[-3:] == ["  3. e3", "  ... and 1 more", "=" * 50]
+
+
+def test_report_start_includes_optional_settings():
+    """Start page and page limit are reported only when set"""
+    subject_info = SubjectInfo(
+        alias='math',
+        official_name='Математика. Базовый уровень',
+        proj_id='E040A72A1A3DABA14C90C97E0B6EE7DC',
+        exam_year=2026
+    )
+    output = CountingStream()
+
+    ScrapingProgressReporter(output).report_start(subject_info, "init", None, True)
+
+    assert output.write_calls == 1
+    assert output.getvalue().splitlines() == [
+        "Starting scraping for subject: Математика. Базовый уровень",
+        "Configuration: force_restart=True",
+        "-" * 50,
+    ]
+
+
+def test_report_summary_uses_running_assets_total():
+    """The running total kept by the scraping loop is reported as is"""
+    start = datetime(2026, 1, 1, 12, 0, 0)
+    result = ScrapingResult(
+        subject_name="Математика. Базовый уровень",
+        success=True,
+        total_pages=1,
+        total_problems_found=1,
+        total_problems_saved=1,
+        page_results=[{'assets_downloaded': 2}],
+        errors=[],
+        start_time=start,
+        end_time=start,
+        total_assets_downloaded=7
+    )
+    output = io.StringIO()
+
+    ScrapingProgressReporter(output).report_summary(result)
+
+    assert "Total assets downloaded: 7" in output.getvalue().splitlines()
@@ -8,6 +8,8 @@ from src.application.services.scraping.scraping_progress_service import Scraping
 from src.application.value_objects.scraping.scraping_config import ScrapingConfig, ScrapingMode
 from src.domain.value_objects.scraping.subject_info import SubjectInfo
 from src.domain.models.problem import Problem
+from tests.fakes import FakeProblemRepository
+from src.application.services.scraping.scraping_checkpoint import ScrapingCheckpoint
 
 class MockProblemRepository:
     async def get_by_subject(self, subject_name):
@@ -80,3 +82,61 @@ def test_determine_next_page_returns_1_when_force_restart():
     next_page = 1 if config.force_restart else (max(int(p.source_url.split("page=")[-1]) + 2 for p in existing_problems) if existing_problems else 1)
     
     assert next_page == 1
+
+
+class CountingProblemRepository(FakeProblemRepository):
+    """Fake repository that counts progress queries"""
+
+    def __init__(self):
+        super().__init__()
+        self.source_url_queries = 0
+
+    async def get_source_urls_by_subject(self, subject_name):
+        self.source_url_queries += 1
+        return await super().get_source_urls_by_subject(subject_name)
+
+
+@pytest.mark.asyncio
+async def test_get_next_page_to_scrape_queries_stored_progress_only_when_needed():
+    """Stored source URLs are read when continuing, but not for a restart or explicit start page"""
+    subject_info = SubjectInfo(
+        alias='math',
+        official_name='Математика. Базовый уровень',
+        proj_id='E040A72A1A3DABA14C90C97E0B6EE7DC',
+        exam_year=2026
+    )
+    repository = CountingProblemRepository()
+    await repository.save(create_test_problem(
+        "math_1",
+        source_url="https://ege.fipi.ru/bank/questions.php?proj=E040A72A1A3DABA14C90C97E0B6EE7DC&page=1"
+    ))
+    service = ScrapingProgressService(repository)
+
+    assert await service.get_next_page_to_scrape(subject_info, "init", force_restart=False) == 3
+    assert await service.get_next_page_to_scrape(subject_info, "7", force_restart=False) == 7
+    assert await service.get_next_page_to_scrape(subject_info, "init", force_restart=True) == 1
+    assert repository.source_url_queries == 1
+
+
+@pytest.mark.asyncio
+async def test_get_next_page_to_scrape_resumes_after_checkpoint(tmp_path):
+    """A checkpoint from an interrupted run wins when it is ahead of the stored problems"""
+    subject_info = SubjectInfo(
+        alias='math',
+        official_name='Математика. Базовый уровень',
+        proj_id='E040A72A1A3DABA14C90C97E0B6EE7DC',
+        exam_year=2026
+    )
+    repository = FakeProblemRepository()
+    await repository.save(create_test_problem(
+        "math_1",
+        source_url="https://ege.fipi.ru/bank/questions.php?proj=E040A72A1A3DABA14C90C97E0B6EE7DC&page=1"
+    ))
+    service = ScrapingProgressService(repository, checkpoint_dir=tmp_path)
+
+    assert await service.get_next_page_to_scrape(subject_info, "init", force_restart=False) == 3
+
+    ScrapingCheckpoint.for_subject(tmp_path, subject_info).save(subject_info.official_name, 6, {})
+
+    assert await service.get_next_page_to_scrape(subject_info, "init", force_restart=False) == 7
+    assert await service.get_next_page_to_scrape(subject_info, "init", force_restart=True) == 1
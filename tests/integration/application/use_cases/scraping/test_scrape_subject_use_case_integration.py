@@ -71,7 +71,7 @@ class TestScrapeSubjectUseCaseIntegration:
         
         # Mock repository
         mock_services['problem_repository'].get_by_subject.return_value = []
-        mock_services['problem_repository'].save.return_value = None
+        mock_services['problem_repository'].save_many.side_effect = lambda problems, force_update=False: len(problems)
 
         # Act
         result = await use_case.execute(subject_info, scraping_config)
@@ -86,7 +86,8 @@ class TestScrapeSubjectUseCaseIntegration:
         # Verify service calls
         mock_services['progress_service'].get_next_page_to_scrape.assert_awaited_once()
         assert mock_services['page_scraping_service'].scrape_page.await_count == 3
-        assert mock_services['problem_repository'].save.await_count == 3
+        # One batch per non-empty page
+        assert mock_services['problem_repository'].save_many.await_count == 2
         mock_services['progress_reporter'].report_start.assert_called_once()
         mock_services['progress_reporter'].report_summary.assert_called_once()
 
@@ -127,5 +127,62 @@ async def test_save_and_get_by_subject(repository, sample_problem, db_session):
     assert phys_001 is not None
     assert phys_001.text == "What is gravity?"
 
+@pytest.mark.asyncio
+async def test_get_source_urls_by_subject_returns_distinct_urls(repository):
+    """Test that only distinct source URLs of the requested subject are returned."""
+    page0 = "https://ege.fipi.ru/bank/questions.php?proj=P&page=0"
+    page1 = "https://ege.fipi.ru/bank/questions.php?proj=P&page=1"
+    await repository.save(Problem(problem_id="m1", subject_name="Math", text="1", source_url=page0))
+    await repository.save(Problem(problem_id="m2", subject_name="Math", text="2", source_url=page0))
+    await repository.save(Problem(problem_id="m3", subject_name="Math", text="3", source_url=page1))
+    await repository.save(Problem(problem_id="p1", subject_name="Physics", text="4", source_url="https://fipi.ru/phys"))
+
+    source_urls = await repository.get_source_urls_by_subject("Math")
+
+    assert sorted(source_urls) == [page0, page1]
+
+@pytest.mark.asyncio
+async def test_save_many_inserts_new_and_skips_existing_problems(repository):
+    """Test that save_many writes a batch with save() semantics for existing problems."""
+    await repository.save(Problem(problem_id="m1", subject_name="Math", text="old", source_url="https://fipi.ru/1"))
+
+    saved = await repository.save_many([
+        Problem(problem_id="m1", subject_name="Math", text="new", source_url="https://fipi.ru/1"),
+        Problem(problem_id="m2", subject_name="Math", text="2", source_url="https://fipi.ru/1"),
+        Problem(problem_id="m2", subject_name="Math", text="2 again", source_url="https://fipi.ru/1"),
+    ])
+
+    assert saved == 3
+    assert (await repository.get_by_id("m1")).text == "old"
+    assert (await repository.get_by_id("m2")).text == "2"
+    assert len(await repository.get_by_subject("Math")) == 2
+
+    await repository.save_many(
+        [Problem(problem_id="m1", subject_name="Math", text="forced", source_url="https://fipi.ru/1")],
+        force_update=True
+    )
+    assert (await repository.get_by_id("m1")).text == "forced"
+
+
+@pytest.mark.asyncio
+async def test_forced_save_many_leaves_unchanged_problems_untouched(repository):
+    """Test that a forced save rewrites changed problems only; unchanged rows keep their updated_at."""
+    await repository.save_many([
+        Problem(problem_id="m1", subject_name="Math", text="same", source_url="https://fipi.ru/1"),
+        Problem(problem_id="m2", subject_name="Math", text="old", source_url="https://fipi.ru/1"),
+    ])
+    unchanged_updated_at = (await repository.get_by_id("m1")).updated_at
+    changed_updated_at = (await repository.get_by_id("m2")).updated_at
+
+    await repository.save_many([
+        Problem(problem_id="m1", subject_name="Math", text="same", source_url="https://fipi.ru/1"),
+        Problem(problem_id="m2", subject_name="Math", text="new", source_url="https://fipi.ru/1"),
+    ], force_update=True)
+
+    assert (await repository.get_by_id("m1")).updated_at == unchanged_updated_at
+    m2 = await repository.get_by_id("m2")
+    assert m2.text == "new"
+    assert m2.updated_at >= changed_updated_at
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__, "-k", "async"])
@@ -0,0 +1,319 @@
+"""
+Unit tests for PageScrapingService.
+"""
+import asyncio
+import threading
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.application.services.page_scraping_service import PageScrapingService
+from src.domain.value_objects.scraping.subject_info import SubjectInfo
+from src.domain.models.problem import Problem
+from src.domain.interfaces.scraping.i_iframe_handler import IframeContent
+
+
+@pytest.fixture
+def subject_info():
+    return SubjectInfo(
+        alias='math',
+        official_name='Математика. Базовый уровень',
+        proj_id='E040A72A1A3DABA14C90C97E0B6EE7DC',
+        exam_year=2026
+    )
+
+
+@pytest.fixture
+def html_block_processing_service():
+    return AsyncMock()
+
+
+@pytest.fixture
+def service(html_block_processing_service):
+    """PageScrapingService with browser-facing components replaced by mocks."""
+    service = PageScrapingService(
+        browser_service=AsyncMock(),
+        asset_downloader_impl=AsyncMock(),
+        problem_factory=MagicMock(),
+        html_block_processing_service=html_block_processing_service,
+        timeout=30,
+        retry_delay_seconds=0
+    )
+    service.content_fetcher = AsyncMock()
+    service.content_fetcher.fetch_page_content.return_value = ("<html></html>", "https://fipi.ru/page1")
+    service.iframe_handler = AsyncMock()
+    service.iframe_handler.handle_iframe_content.return_value = IframeContent("<html></html>", "https://fipi.ru/page1")
+    service.block_parser = MagicMock()
+    return service
+
+
+def make_problem(problem_id, subject_info):
+    return Problem(
+        problem_id=problem_id,
+        subject_name=subject_info.official_name,
+        text=f"Problem {problem_id}",
+        source_url="https://fipi.ru/page1"
+    )
+
+
+class TestPageScrapingService:
+
+    @pytest.mark.asyncio
+    async def test_scrape_page_returns_problems_in_block_order(
+        self, service, html_block_processing_service, subject_info, tmp_path
+    ):
+        """Problems are returned in block order; failed blocks are skipped."""
+        service.block_parser.parse_html_blocks.return_value = [["b0"], ["b1"], ["b2"]]
+        problems = {0: make_problem("p0", subject_info), 2: make_problem("p2", subject_info)}
+
+        async def process_block(block_elements, block_index, context):
+            if block_index == 1:
+                raise ValueError("broken block")
+            return problems[block_index]
+
+        html_block_processing_service.process_block.side_effect = process_block
+
+        result, assets_count = await service.scrape_page(
+            "https://fipi.ru/page1", subject_info, run_folder_page=tmp_path
+        )
+
+        assert [p.problem_id for p in result] == ["p0", "p2"]
+        assert assets_count == 0
+        service.content_fetcher.cleanup_browser.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_scrape_page_processes_blocks_concurrently_up_to_limit(
+        self, service, html_block_processing_service, subject_info, tmp_path
+    ):
+        """Blocks overlap up to max_concurrent_blocks; results keep block order."""
+        service.max_concurrent_blocks = 2
+        service.block_parser.parse_html_blocks.return_value = [["b0"], ["b1"], ["b2"], ["b3"]]
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def process_block(block_elements, block_index, context):
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            await asyncio.sleep(0.01 * (4 - block_index))
+            in_flight -= 1
+            return make_problem(f"p{block_index}", subject_info)
+
+        html_block_processing_service.process_block.side_effect = process_block
+
+        result, _ = await service.scrape_page(
+            "https://fipi.ru/page1", subject_info, run_folder_page=tmp_path
+        )
+
+        assert peak_in_flight == 2
+        assert [p.problem_id for p in result] == ["p0", "p1", "p2", "p3"]
+
+    @pytest.mark.asyncio
+    async def test_scrape_page_counts_assets_reported_by_processors(
+        self, service, html_block_processing_service, subject_info, tmp_path
+    ):
+        """Assets are counted from on_asset_saved callbacks; the same path counts once."""
+        service.block_parser.parse_html_blocks.return_value = [["b0"], ["b1"]]
+
+        async def process_block(block_elements, block_index, context):
+            context['on_asset_saved'](tmp_path / "assets" / "shared.png")
+            context['on_asset_saved'](tmp_path / "assets" / f"own_{block_index}.png")
+            return None
+
+        html_block_processing_service.process_block.side_effect = process_block
+
+        _, assets_count = await service.scrape_page(
+            "https://fipi.ru/page1", subject_info, run_folder_page=tmp_path
+        )
+
+        assert assets_count == 3
+
+    @pytest.mark.asyncio
+    async def test_scrape_page_returns_partial_problems_on_timeout(
+        self, service, html_block_processing_service, subject_info, tmp_path
+    ):
+        """A stuck block does not hang the page; problems collected so far are returned."""
+        service.block_parser.parse_html_blocks.return_value = [["b0"], ["b1"]]
+        first_problem = make_problem("p0", subject_info)
+
+        async def process_block(block_elements, block_index, context):
+            if block_index == 0:
+                return first_problem
+            await asyncio.sleep(10)
+
+        html_block_processing_service.process_block.side_effect = process_block
+
+        result, _ = await service.scrape_page(
+            "https://fipi.ru/page1", subject_info, timeout=0.05, run_folder_page=tmp_path
+        )
+
+        assert result == [first_problem]
+
+    @pytest.mark.asyncio
+    async def test_repeated_block_errors_log_traceback_once_per_type(
+        self, service, html_block_processing_service, subject_info, tmp_path, caplog
+    ):
+        """Only the first error of a type carries a traceback; repeats are logged as messages."""
+        service.block_parser.parse_html_blocks.return_value = [["b0"], ["b1"], ["b2"]]
+
+        async def process_block(block_elements, block_index, context):
+            if block_index == 2:
+                raise KeyError("missing")
+            raise ValueError(f"broken block {block_index}")
+
+        html_block_processing_service.process_block.side_effect = process_block
+
+        with caplog.at_level("ERROR"):
+            await service.scrape_page("https://fipi.ru/page1", subject_info, run_folder_page=tmp_path)
+
+        traced = [bool(record.exc_info) for record in caplog.records]
+        assert len(traced) == 3
+        assert traced.count(True) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_pages_serialize_navigation_but_overlap_processing(
+        self, service, html_block_processing_service, subject_info, tmp_path
+    ):
+        """The shared browser page is used by one scrape at a time; block processing overlaps."""
+        service.block_parser.parse_html_blocks.return_value = [["b0"]]
+        navigations_in_flight = 0
+        peak_navigations = 0
+        blocks_in_flight = 0
+        peak_blocks = 0
+
+        async def fetch_page_content(url, timeout):
+            nonlocal navigations_in_flight, peak_navigations
+            navigations_in_flight += 1
+            peak_navigations = max(peak_navigations, navigations_in_flight)
+            await asyncio.sleep(0.01)
+            navigations_in_flight -= 1
+            return "<html></html>", url
+
+        async def process_block(block_elements, block_index, context):
+            nonlocal blocks_in_flight, peak_blocks
+            blocks_in_flight += 1
+            peak_blocks = max(peak_blocks, blocks_in_flight)
+            await asyncio.sleep(0.05)
+            blocks_in_flight -= 1
+            return make_problem(context['source_url'], subject_info)
+
+        service.content_fetcher.fetch_page_content.side_effect = fetch_page_content
+        html_block_processing_service.process_block.side_effect = process_block
+
+        async with service:
+            results = await asyncio.gather(*(
+                service.scrape_page(f"https://fipi.ru/page{i}", subject_info, run_folder_page=tmp_path)
+                for i in range(3)
+            ))
+
+        assert peak_navigations == 1
+        assert peak_blocks == 3
+        assert [problems[0].problem_id for problems, _ in results] == [
+            f"https://fipi.ru/page{i}" for i in range(3)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_scrape_page_parses_blocks_off_the_event_loop_thread(self, service, subject_info, tmp_path):
+        """Block parsing runs on the parse executor, not on the event loop thread."""
+        parse_threads = []
+
+        def parse_html_blocks(html):
+            parse_threads.append(threading.get_ident())
+            return []
+
+        service.block_parser.parse_html_blocks.side_effect = parse_html_blocks
+
+        await service.scrape_page("https://fipi.ru/page1", subject_info, run_folder_page=tmp_path)
+
+        assert len(parse_threads) == 1
+        assert parse_threads[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_page_is_served_from_page_result_cache(
+        self, service, html_block_processing_service, subject_info, tmp_path
+    ):
+        """A fully processed page is cached; the same HTML later skips parsing and processing."""
+        from src.infrastructure.services.page_scraping.components.page_result_cache import PageResultCache
+
+        service.page_result_cache = PageResultCache(tmp_path / "cache")
+        service.block_parser.parse_html_blocks.return_value = [["b0"]]
+        html_block_processing_service.process_block.return_value = make_problem("p0", subject_info)
+
+        first, _ = await service.scrape_page("https://fipi.ru/page1", subject_info, run_folder_page=tmp_path)
+        second, assets_count = await service.scrape_page("https://fipi.ru/page1", subject_info, run_folder_page=tmp_path)
+
+        assert [p.problem_id for p in first] == ["p0"]
+        assert second == first
+        assert assets_count == 0
+        service.block_parser.parse_html_blocks.assert_called_once()
+        html_block_processing_service.process_block.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_forced_rescrape_bypasses_page_result_cache(
+        self, service, html_block_processing_service, subject_info, tmp_path
+    ):
+        """With use_cache=False an unchanged page is parsed and processed again."""
+        from src.infrastructure.services.page_scraping.components.page_result_cache import PageResultCache
+
+        service.page_result_cache = PageResultCache(tmp_path / "cache")
+        service.block_parser.parse_html_blocks.return_value = [["b0"]]
+        html_block_processing_service.process_block.return_value = make_problem("p0", subject_info)
+
+        await service.scrape_page("https://fipi.ru/page1", subject_info, run_folder_page=tmp_path)
+        forced, _ = await service.scrape_page(
+            "https://fipi.ru/page1", subject_info, run_folder_page=tmp_path, use_cache=False
+        )
+
+        assert [p.problem_id for p in forced] == ["p0"]
+        assert service.block_parser.parse_html_blocks.call_count == 2
+        assert html_block_processing_service.process_block.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_scrape_page_retries_transient_fetch_failures(
+        self, service, html_block_processing_service, subject_info, tmp_path
+    ):
+        """A fetch that fails transiently is retried and the page is still scraped."""
+        service.content_fetcher.fetch_page_content.side_effect = [
+            asyncio.TimeoutError(),
+            asyncio.TimeoutError(),
+            ("<html></html>", "https://fipi.ru/page1"),
+        ]
+        service.block_parser.parse_html_blocks.return_value = [["b0"]]
+        html_block_processing_service.process_block.return_value = make_problem("p0", subject_info)
+
+        result, _ = await service.scrape_page("https://fipi.ru/page1", subject_info, run_folder_page=tmp_path)
+
+        assert [p.problem_id for p in result] == ["p0"]
+        assert service.content_fetcher.fetch_page_content.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_scrape_page_returns_empty_result_on_fetch_error(self, service, subject_info, tmp_path):
+        """Permanent fetch failures are not retried and are reported as an empty page."""
+        service.content_fetcher.fetch_page_content.side_effect = RuntimeError("Network error")
+
+        result = await service.scrape_page("https://fipi.ru/page1", subject_info, run_folder_page=tmp_path)
+
+        assert result == ([], 0)
+        assert service.content_fetcher.fetch_page_content.await_count == 1
+        service.content_fetcher.cleanup_browser.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_scrape_page_gives_up_after_retry_attempts(self, service, subject_info, tmp_path):
+        """A page that keeps timing out is tried retry_attempts times in total."""
+        service.content_fetcher.fetch_page_content.side_effect = asyncio.TimeoutError()
+
+        result = await service.scrape_page("https://fipi.ru/page1", subject_info, run_folder_page=tmp_path)
+
+        assert result == ([], 0)
+        assert service.content_fetcher.fetch_page_content.await_count == service.retry_attempts
+        service.content_fetcher.cleanup_browser.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_session_keeps_browser_alive_across_pages(self, service, subject_info, tmp_path):
+        """Inside a session the browser is released once on exit, not after every page."""
+        service.block_parser.parse_html_blocks.return_value = []
+
+        async with service:
+            await service.scrape_page("https://fipi.ru/page1", subject_info, run_folder_page=tmp_path)
+            await service.scrape_page("https://fipi.ru/page2", subject_info, run_folder_page=tmp_path)
+            service.content_fetcher.cleanup_browser.assert_not_awaited()
+
+        service.content_fetcher.cleanup_browser.assert_awaited_once()
@@ -126,3 +126,70 @@ class TestScrapingOrchestrator:
         assert result.success is False
         assert len(result.errors) == 1
         assert "Network error" in result.errors[0]
+
+    @pytest.mark.asyncio
+    async def test_run_parallel_scraping_caps_concurrent_subjects(self, mock_scrape_use_case):
+        """Test orchestrator scrapes at most max_parallel_subjects at once and keeps input order."""
+        orchestrator = ScrapingOrchestrator(scrape_use_case=mock_scrape_use_case, max_parallel_subjects=2)
+        subjects = ["math", "inf", "rus"]
+        config = ScrapingConfig(mode=ScrapingMode.SEQUENTIAL, timeout_seconds=30)
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def mock_execute_side_effect(subject_info, config):
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return ScrapingResult(
+                subject_name=subject_info.official_name,
+                success=True,
+                total_pages=1,
+                total_problems_found=1,
+                total_problems_saved=1,
+                page_results=[],
+                errors=[],
+                start_time=datetime.now(),
+                end_time=datetime.now()
+            )
+
+        mock_scrape_use_case.execute.side_effect = mock_execute_side_effect
+
+        results = await orchestrator.run_parallel_scraping(
+            [{"subject_alias": alias, "config": config} for alias in subjects]
+        )
+
+        assert peak_in_flight == 2
+        assert list(results) == subjects
+        assert all(result.success for result in results.values())
+
+    @pytest.mark.asyncio
+    async def test_run_parallel_scraping_reports_unknown_alias_without_scraping(self, orchestrator, mock_scrape_use_case):
+        """Test an unknown alias becomes an error result and the use case is not called for it."""
+        config = ScrapingConfig(mode=ScrapingMode.SEQUENTIAL, timeout_seconds=30)
+
+        results = await orchestrator.run_parallel_scraping([{"subject_alias": "no_such_subject", "config": config}])
+
+        assert results["no_such_subject"].success is False
+        assert "Unknown subject alias" in results["no_such_subject"].errors[0]
+        mock_scrape_use_case.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_run_parallel_scraping_scrapes_duplicate_aliases_once(self, orchestrator, mock_scrape_use_case, caplog):
+        """Test a subject listed twice is scraped once with its first config and a warning is logged."""
+        first_config = ScrapingConfig(mode=ScrapingMode.SEQUENTIAL, timeout_seconds=30)
+        second_config = ScrapingConfig(mode=ScrapingMode.SEQUENTIAL, timeout_seconds=60)
+        mock_scrape_use_case.execute.return_value = ScrapingResult(
+            subject_name="Математика", success=True, total_pages=1, total_problems_found=1,
+            total_problems_saved=1, page_results=[], errors=[], start_time=datetime.now(), end_time=datetime.now()
+        )
+
+        results = await orchestrator.run_parallel_scraping(
+            [{"subject_alias": "math", "config": first_config}, {"subject_alias": "math", "config": second_config}]
+        )
+
+        assert list(results) == ["math"]
+        mock_scrape_use_case.execute.assert_awaited_once()
+        assert mock_scrape_use_case.execute.await_args.args[1] is first_config
+        assert "scraped once" in caplog.text
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime
@@ -58,7 +59,7 @@ class TestPageProcessor:
         mock_scraping_result = PageScrapingResult(problems=mock_problems, assets_downloaded=3)
         
         test_dependencies['page_scraping_service'].scrape_page.return_value = mock_scraping_result
-        test_dependencies['problem_repository'].save.return_value = None
+        test_dependencies['problem_repository'].save_many.return_value = 2
 
         # Act
         result = await processor.process_page(page_num, subject_info, scraping_config, base_run_folder)
@@ -72,7 +73,8 @@ class TestPageProcessor:
         assert result.page_duration_seconds > 0
         
         test_dependencies['page_scraping_service'].scrape_page.assert_awaited_once()
-        assert test_dependencies['problem_repository'].save.await_count == 2
+        test_dependencies['problem_repository'].save_many.assert_awaited_once_with(mock_problems, force_update=False)
+        test_dependencies['problem_repository'].save.assert_not_awaited()
         test_dependencies['progress_reporter'].report_page_progress.assert_called_once()
 
     @pytest.mark.asyncio
@@ -96,7 +98,7 @@ class TestPageProcessor:
         assert result.error is None
         
         test_dependencies['page_scraping_service'].scrape_page.assert_awaited_once()
-        test_dependencies['problem_repository'].save.assert_not_awaited()
+        test_dependencies['problem_repository'].save_many.assert_not_awaited()
         test_dependencies['progress_reporter'].report_page_progress.assert_not_called()
 
     @pytest.mark.asyncio
@@ -119,3 +121,104 @@ class TestPageProcessor:
         assert "Scraping failed" in result.error
         
         test_dependencies['progress_reporter'].report_page_error.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_fetch_page_saves_nothing_until_save_page(self, test_dependencies, subject_info, scraping_config, base_run_folder):
+        """Test that fetch_page only scrapes; problems are written by save_page."""
+        # Arrange
+        processor = PageProcessor(**test_dependencies)
+        mock_problems = [Problem(problem_id="math_1", subject_name=subject_info.official_name, text="Problem 1", source_url="http://page1")]
+        test_dependencies['page_scraping_service'].scrape_page.return_value = PageScrapingResult(problems=mock_problems, assets_downloaded=1)
+        test_dependencies['problem_repository'].save_many.return_value = 1
+
+        # Act
+        fetched = await processor.fetch_page(1, subject_info, scraping_config, base_run_folder)
+
+        # Assert
+        assert fetched.problems == mock_problems
+        test_dependencies['problem_repository'].save_many.assert_not_awaited()
+
+        # Act
+        result = await processor.save_page(fetched, scraping_config)
+
+        # Assert
+        assert result.problems_saved == 1
+        assert result.assets_downloaded == 1
+        test_dependencies['problem_repository'].save_many.assert_awaited_once_with(mock_problems, force_update=False)
+
+    @pytest.mark.asyncio
+    async def test_process_page_falls_back_to_concurrent_single_saves(self, test_dependencies, subject_info, scraping_config, base_run_folder):
+        """Test that a failed batch is saved one by one, up to save_concurrency at once, skipping failures."""
+        # Arrange
+        processor = PageProcessor(**test_dependencies, save_concurrency=2)
+        mock_problems = [
+            Problem(problem_id=f"math_{i}", subject_name=subject_info.official_name, text=f"Problem {i}", source_url="http://page1")
+            for i in range(5)
+        ]
+        test_dependencies['page_scraping_service'].scrape_page.return_value = PageScrapingResult(problems=mock_problems, assets_downloaded=0)
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def save(problem, force_update=False):
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if problem.problem_id == "math_3":
+                raise RuntimeError("DB error")
+
+        test_dependencies['problem_repository'].save_many.side_effect = RuntimeError("batch failed")
+        test_dependencies['problem_repository'].save.side_effect = save
+
+        # Act
+        result = await processor.process_page(1, subject_info, scraping_config, base_run_folder)
+
+        # Assert
+        assert peak_in_flight == 2
+        assert result.problems_found == 5
+        assert result.problems_saved == 4
+        assert result.error is None
+
+    @pytest.mark.asyncio
+    async def test_process_page_force_restart_updates_existing_problems(self, test_dependencies, subject_info, base_run_folder):
+        """Test that force_restart updates stored problems and bypasses the page result cache."""
+        # Arrange
+        processor = PageProcessor(**test_dependencies)
+        mock_problems = [Problem(problem_id="math_1", subject_name=subject_info.official_name, text="Problem 1", source_url="http://page1")]
+        test_dependencies['page_scraping_service'].scrape_page.return_value = PageScrapingResult(problems=mock_problems, assets_downloaded=0)
+        test_dependencies['problem_repository'].save_many.return_value = 1
+        scraping_config = ScrapingConfig(mode=ScrapingMode.SEQUENTIAL, force_restart=True)
+
+        # Act
+        await processor.process_page(1, subject_info, scraping_config, base_run_folder)
+
+        # Assert
+        test_dependencies['problem_repository'].save_many.assert_awaited_once_with(mock_problems, force_update=True)
+        assert test_dependencies['page_scraping_service'].scrape_page.await_args.kwargs['use_cache'] is False
+
+    @pytest.mark.asyncio
+    async def test_process_page_builds_numbered_page_urls(self, test_dependencies, subject_info, scraping_config, base_run_folder):
+        """Test that page 1 uses the subject base URL and later pages append the page number."""
+        processor = PageProcessor(**test_dependencies)
+        test_dependencies['page_scraping_service'].scrape_page.return_value = PageScrapingResult(problems=[], assets_downloaded=0)
+
+        await processor.process_page(1, subject_info, scraping_config, base_run_folder)
+        await processor.process_page(12, subject_info, scraping_config, base_run_folder)
+
+        urls = [call.kwargs['url'] for call in test_dependencies['page_scraping_service'].scrape_page.await_args_list]
+        assert urls == [subject_info.base_url, f"{subject_info.base_url}?page=12"]
+        assert all(
+            call.kwargs['base_url'] == subject_info.base_url
+            for call in test_dependencies['page_scraping_service'].scrape_page.await_args_list
+        )
+
+    @pytest.mark.asyncio
+    async def test_process_page_uses_configured_timeout(self, test_dependencies, subject_info, base_run_folder):
+        """Test that the page timeout comes from ScrapingConfig.timeout_seconds."""
+        processor = PageProcessor(**test_dependencies)
+        test_dependencies['page_scraping_service'].scrape_page.return_value = PageScrapingResult(problems=[], assets_downloaded=0)
+
+        await processor.process_page(1, subject_info, ScrapingConfig(timeout_seconds=75), base_run_folder)
+
+        assert test_dependencies['page_scraping_service'].scrape_page.await_args.kwargs['timeout'] == 75
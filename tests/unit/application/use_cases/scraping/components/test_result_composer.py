@@ -120,3 +120,21 @@ class TestResultComposer:
         assert len(result.page_results) == 0
         assert len(result.errors) == 0
         assert result.duration_seconds == 1.0
+
+    def test_compose_error_result(self, subject_info):
+        """Test composing the result of a run that failed before any page was processed."""
+        # Arrange
+        composer = ResultComposer()
+        start_time = datetime.now()
+        end_time = start_time + timedelta(seconds=2)
+
+        # Act
+        result = composer.compose_error_result(subject_info, "Critical error: boom", start_time, end_time, elapsed_seconds=1.5)
+
+        # Assert
+        assert result.subject_name == subject_info.official_name
+        assert result.success is False
+        assert result.total_pages == 0
+        assert result.page_results == []
+        assert result.errors == ["Critical error: boom"]
+        assert result.duration_seconds == 1.5
@@ -7,15 +7,34 @@ from src.application.use_cases.scraping.components.page_processor import PagePro
 from src.domain.value_objects.scraping.subject_info import SubjectInfo
 from src.application.value_objects.scraping.scraping_config import ScrapingConfig, ScrapingMode
 from src.application.use_cases.scraping.components.data_structures import PageResult
+from src.application.services.scraping.scraping_checkpoint import ScrapingCheckpoint
 from dataclasses import replace
+import asyncio
 
 
 # --- FAKE Implementation for PageProcessor ---
-class FakePageProcessor:
+class InOrderPageProcessor:
+    """
+    Base for fake page processors: fetch_page delegates to process_page, save_page
+    records which pages the controller saved and returns the page result unchanged.
+    """
+    def __init__(self):
+        self.saved_pages = []
+
+    async def fetch_page(self, page_number, subject_info, scraping_config, base_run_folder):
+        return await self.process_page(page_number, subject_info, scraping_config, base_run_folder)
+
+    async def save_page(self, fetched, scraping_config):
+        self.saved_pages.append(fetched.page_number)
+        return fetched
+
+
+class FakePageProcessor(InOrderPageProcessor):
     """
     Fake implementation of PageProcessor for robust testing of the controller loop logic.
     """
     def __init__(self, page_results_iterator, call_recorder):
+        super().__init__()
         self._iterator = iter(page_results_iterator)
         self.call_recorder = call_recorder
 
@@ -166,3 +185,117 @@ class TestScrapingLoopController:
         assert result.last_processed_page == 3 
         assert len(call_recorder) == 3
         assert call_recorder == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_run_loop_parallel_mode_overlaps_pages_and_stops_in_order(self, subject_info, scraping_config, base_run_folder):
+        """Test PARALLEL mode keeps parallel_workers pages in flight and drops pages past the stop point."""
+        # Arrange
+        controller = ScrapingLoopController(max_empty_pages=2)
+        scraping_config = replace(scraping_config, mode=ScrapingMode.PARALLEL, parallel_workers=3, max_pages=None)
+        problems_by_page = {1: 2, 2: 0, 3: 0}
+        in_flight = 0
+        peak_in_flight = 0
+
+        class SlowPageProcessor(InOrderPageProcessor):
+            async def process_page(self, page_number, subject_info, scraping_config, base_run_folder):
+                nonlocal in_flight, peak_in_flight
+                in_flight += 1
+                peak_in_flight = max(peak_in_flight, in_flight)
+                # Later pages finish first; results must still be consumed in page order
+                await asyncio.sleep(0.01 * (5 - min(page_number, 4)))
+                in_flight -= 1
+                found = problems_by_page.get(page_number, 0)
+                return PageResult(page_number=page_number, problems_found=found, problems_saved=found, assets_downloaded=0, page_duration_seconds=0.1)
+
+        # Act
+        result = await controller.run_loop(1, subject_info, scraping_config, base_run_folder, SlowPageProcessor())
+
+        # Assert
+        assert peak_in_flight == 3
+        assert [r.page_number for r in result.page_results] == [1, 2, 3]
+        assert result.total_problems_found == 2
+        assert result.last_processed_page == 3
+
+    @pytest.mark.asyncio
+    async def test_run_loop_parallel_mode_refills_slots_freed_by_later_pages(self, subject_info, scraping_config, base_run_folder):
+        """Test a slow earliest page does not hold back the window: finished later pages free their slots."""
+        # Arrange
+        controller = ScrapingLoopController(max_empty_pages=1)
+        scraping_config = replace(scraping_config, mode=ScrapingMode.PARALLEL, parallel_workers=2, max_pages=4)
+        started = []
+        page_one_finished = asyncio.Event()
+
+        class SlowFirstPageProcessor(InOrderPageProcessor):
+            async def process_page(self, page_number, subject_info, scraping_config, base_run_folder):
+                started.append((page_number, page_one_finished.is_set()))
+                await asyncio.sleep(0.05 if page_number == 1 else 0.01)
+                if page_number == 1:
+                    page_one_finished.set()
+                return PageResult(page_number=page_number, problems_found=1, problems_saved=1, assets_downloaded=0, page_duration_seconds=0.1)
+
+        # Act
+        result = await controller.run_loop(1, subject_info, scraping_config, base_run_folder, SlowFirstPageProcessor())
+
+        # Assert
+        assert (3, False) in started
+        assert [r.page_number for r in result.page_results] == [1, 2, 3, 4]
+        assert result.last_processed_page == 4
+
+    @pytest.mark.asyncio
+    async def test_run_loop_parallel_mode_saves_nothing_past_an_error(self, subject_info, scraping_config, base_run_folder):
+        """Test pages fetched ahead of a failed page are not saved, so a resumed run retries the failed page."""
+        # Arrange
+        controller = ScrapingLoopController()
+        scraping_config = replace(scraping_config, mode=ScrapingMode.PARALLEL, parallel_workers=3, max_pages=None)
+
+        class FailingSecondPageProcessor(InOrderPageProcessor):
+            async def process_page(self, page_number, subject_info, scraping_config, base_run_folder):
+                # Page 2 finishes last, after the pages fetched ahead of it
+                await asyncio.sleep(0.03 if page_number == 2 else 0.0)
+                return PageResult(page_number=page_number, problems_found=1, problems_saved=1, assets_downloaded=0,
+                                  page_duration_seconds=0.1, error="Page 2 error" if page_number == 2 else None)
+
+        processor = FailingSecondPageProcessor()
+
+        # Act
+        result = await controller.run_loop(1, subject_info, scraping_config, base_run_folder, processor)
+
+        # Assert
+        assert processor.saved_pages == [1, 2]
+        assert [r.page_number for r in result.page_results] == [1, 2]
+        assert result.total_problems_saved == 2
+        assert result.last_processed_page == 1
+
+    @pytest.mark.asyncio
+    async def test_run_loop_checkpoints_progress_and_clears_on_completion(self, subject_info, scraping_config, base_run_folder, tmp_path):
+        """Test the checkpoint keeps the last good page after an error or max_pages stop and is removed at the subject's end."""
+        # Arrange
+        checkpoint = ScrapingCheckpoint(tmp_path / "math.json")
+        controller = ScrapingLoopController(checkpoint=checkpoint)
+        failing_results = [
+            PageResult(page_number=4, problems_found=2, problems_saved=2, assets_downloaded=0, page_duration_seconds=1.0),
+            PageResult(page_number=5, problems_found=0, problems_saved=0, assets_downloaded=0, page_duration_seconds=1.0, error="Page 5 error"),
+        ]
+
+        # Act
+        await controller.run_loop(4, subject_info, scraping_config, base_run_folder, FakePageProcessor(failing_results, []))
+
+        # Assert
+        assert checkpoint.load_last_processed_page() == 4
+
+        # Act: a run stopped by max_pages keeps the resume point
+        limited_results = [
+            PageResult(page_number=5, problems_found=2, problems_saved=2, assets_downloaded=0, page_duration_seconds=1.0),
+        ]
+        await controller.run_loop(5, subject_info, scraping_config, base_run_folder, FakePageProcessor(limited_results, []))
+
+        # Assert
+        assert checkpoint.load_last_processed_page() == 5
+
+        # Act: a run that reaches max_empty_pages empty pages completes the subject
+        unlimited_config = replace(scraping_config, max_pages=None)
+        await controller.run_loop(6, subject_info, unlimited_config, base_run_folder, FakePageProcessor([], []))
+
+        # Assert
+        assert checkpoint.load_last_processed_page() is None
+        assert not checkpoint.path.exists()
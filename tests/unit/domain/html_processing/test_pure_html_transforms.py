@@ -1,8 +1,10 @@
 import pytest
 from pathlib import Path
 from src.domain.html_processing.pure_html_transforms import (
+    decode_html,
     extract_dom_tree,
     extract_block_pairs,
+    extract_block_elements,
     transform_blocks_to_raw_data,
 )
 
@@ -23,6 +25,11 @@ def test_extract_dom_tree_returns_bs_object():
     assert dom is not None
     assert dom.find("body").get_text(strip=True) == "ok"
 
+def test_decode_html_decodes_bytes_as_utf8():
+    assert decode_html("<p>Задача</p>".encode("utf-8")) == "<p>Задача</p>"
+    assert decode_html("<p>ok</p>") == "<p>ok</p>"
+    assert decode_html(None) == ""
+
 def test_extract_block_pairs_finds_header_body_pairs():
     pairs = extract_block_pairs(SIMPLE_HTML)
     assert isinstance(pairs, list)
@@ -39,3 +46,29 @@ def test_transform_blocks_to_raw_data_extracts_task_id_and_title():
     assert len(raw) == 2
     assert raw[0]["task_id"] == "t1"
     assert "Задача 1" in raw[0]["title"]
+
+
+def test_extract_block_elements_returns_nodes_of_the_parsed_page():
+    dom = extract_dom_tree(SIMPLE_HTML)
+    blocks = extract_block_elements(dom)
+    assert len(blocks) == 2
+    header0, body0 = blocks[0]
+    assert header0 is dom.find(attrs={"data-task-id": "t1"})
+    assert body0.get_text(strip=True) == "Текст задачи 1"
+
+def test_extract_block_elements_matches_block_pairs_for_qblocks():
+    html = '''
+    <div class="qblock"><p>Общий текст</p></div>
+    <div class="qblock" id="q001"><p>Задание 1</p></div>
+    <div class="qblock" id="q002"><p>Задание 2</p></div>
+    <div class="qblock" id="q003"><p>Задание 3</p></div>
+    '''
+    dom = extract_dom_tree(html)
+    blocks = extract_block_elements(dom)
+    pairs = extract_block_pairs(dom)
+    assert len(blocks) == len(pairs) == 1
+    header, body = blocks[0]
+    assert header.get("id") == "i001"
+    assert header.get("class") == ["header-container"]
+    assert header.get_text() == "Задание 001"
+    assert body.get_text(strip=True) == "Общий текст"
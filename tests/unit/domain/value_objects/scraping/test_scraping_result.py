@@ -57,6 +57,23 @@ class TestScrapingResult:
 
         assert result.duration_seconds == 90.0  # 1 min 30 sec = 90 sec
 
+    def test_duration_seconds_prefers_measured_elapsed_time(self):
+        """Test that a monotonic elapsed time wins over the wall-clock difference."""
+        result = ScrapingResult(
+            subject_name="Math",
+            success=True,
+            total_pages=1,
+            total_problems_found=1,
+            total_problems_saved=1,
+            page_results=[],
+            errors=[],
+            start_time=datetime(2023, 1, 1, 12, 0, 0),
+            end_time=datetime(2023, 1, 1, 11, 0, 0),  # wall clock moved backwards
+            elapsed_seconds=12.5
+        )
+
+        assert result.duration_seconds == 12.5
+
     def test_success_rate(self):
         """Test the success_rate property."""
         # Case 1: Some problems saved
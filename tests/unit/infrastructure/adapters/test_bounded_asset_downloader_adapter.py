@@ -0,0 +1,73 @@
+"""Tests for BoundedAssetDownloaderAdapter"""
+import asyncio
+import time
+import pytest
+from pathlib import Path
+from src.infrastructure.adapters.external_services.bounded_asset_downloader_adapter import BoundedAssetDownloaderAdapter
+
+
+class SlowAssetDownloader:
+    """Fake downloader that records the peak number of concurrent requests"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def _request(self):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+    async def download(self, asset_url: str, destination_path: Path) -> bool:
+        await self._request()
+        return True
+
+    async def download_bytes(self, asset_url: str) -> bytes:
+        await self._request()
+        return asset_url.encode()
+
+
+class TestBoundedAssetDownloaderAdapter:
+    """Test suite for BoundedAssetDownloaderAdapter"""
+
+    @pytest.mark.asyncio
+    async def test_caps_concurrent_downloads(self):
+        """Test that no more than max_concurrent requests run at once"""
+        impl = SlowAssetDownloader()
+        adapter = BoundedAssetDownloaderAdapter(impl, max_concurrent=2)
+
+        results = await asyncio.gather(
+            *(adapter.download_bytes(f"https://fipi.ru/{i}.png") for i in range(6)),
+            adapter.download("https://fipi.ru/file.pdf", Path("/tmp/file.pdf"))
+        )
+
+        assert impl.peak_in_flight == 2
+        assert results[0] == b"https://fipi.ru/0.png"
+        assert results[-1] is True
+
+    @pytest.mark.asyncio
+    async def test_spaces_downloads_to_max_requests_per_second(self):
+        """Test that downloads start no faster than max_requests_per_second"""
+        adapter = BoundedAssetDownloaderAdapter(SlowAssetDownloader(), max_concurrent=5, max_requests_per_second=50)
+        start_times = []
+        original_request = adapter._impl._request
+
+        async def timed_request():
+            start_times.append(time.monotonic())
+            await original_request()
+
+        adapter._impl._request = timed_request
+
+        await asyncio.gather(*(adapter.download_bytes(f"https://fipi.ru/{i}.png") for i in range(5)))
+
+        gaps = [later - earlier for earlier, later in zip(start_times, start_times[1:])]
+        assert len(gaps) == 4
+        assert min(gaps) >= 0.015
+
+    def test_rejects_non_positive_limit(self):
+        """Test that the concurrency and rate limits must be positive"""
+        with pytest.raises(ValueError):
+            BoundedAssetDownloaderAdapter(SlowAssetDownloader(), max_concurrent=0)
+        with pytest.raises(ValueError):
+            BoundedAssetDownloaderAdapter(SlowAssetDownloader(), max_requests_per_second=0)
@@ -0,0 +1,19 @@
+"""Tests for PlaywrightAssetDownloaderAdapter's aiohttp fallback session"""
+import pytest
+from src.infrastructure.adapters.external_services.playwright_asset_downloader_adapter import PlaywrightAssetDownloaderAdapter
+
+
+class TestPlaywrightAssetDownloaderAdapter:
+    """Test suite for PlaywrightAssetDownloaderAdapter"""
+
+    @pytest.mark.asyncio
+    async def test_fallback_downloads_share_one_http_session(self):
+        """Test that the aiohttp session is created once and closed with the adapter"""
+        adapter = PlaywrightAssetDownloaderAdapter(timeout=5)
+
+        session = adapter._get_http_session()
+
+        assert adapter._get_http_session() is session
+        await adapter.close()
+        assert session.closed
+        assert adapter._http_session is None
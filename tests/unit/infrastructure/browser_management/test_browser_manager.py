@@ -0,0 +1,69 @@
+"""Unit tests for BrowserManager page reuse, using a fake Playwright browser"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.infrastructure.browser_management.browser_manager import BrowserManager
+
+
+def make_fake_page(goto_delay: float = 0.0):
+    page = MagicMock()
+    page.is_closed.return_value = False
+    page.set_viewport_size = AsyncMock()
+    page.set_extra_http_headers = AsyncMock()
+    page.close = AsyncMock()
+
+    async def goto(url, **kwargs):
+        await asyncio.sleep(goto_delay)
+        page.current_url = url
+
+    page.goto = AsyncMock(side_effect=goto)
+    page.content = AsyncMock(side_effect=lambda: f"<html>{page.current_url}</html>")
+    return page
+
+
+@pytest.fixture
+def manager():
+    bm = BrowserManager(base_url="https://ege.fipi.ru")
+    bm._browser = MagicMock()
+    bm._browser.new_page = AsyncMock(side_effect=lambda: make_fake_page(goto_delay=0.01))
+    bm._initialized = True
+    return bm
+
+
+class TestBrowserManagerPageReuse:
+
+    @pytest.mark.asyncio
+    async def test_consecutive_requests_reuse_one_page(self, manager):
+        """Sequential requests are served by the same page, configured once"""
+        first = await manager.get_page_content("https://ege.fipi.ru/a", timeout=5)
+        second = await manager.get_page_content("https://ege.fipi.ru/b", timeout=5)
+
+        assert first == "<html>https://ege.fipi.ru/a</html>"
+        assert second == "<html>https://ege.fipi.ru/b</html>"
+        assert manager._browser.new_page.await_count == 1
+        manager._shared_page.close.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_request_uses_temporary_page(self, manager):
+        """A request arriving while the shared page is busy gets its own page, closed afterwards"""
+        results = await asyncio.gather(
+            manager.get_page_content("https://ege.fipi.ru/a", timeout=5),
+            manager.get_page_content("https://ege.fipi.ru/b", timeout=5)
+        )
+
+        assert results == ["<html>https://ege.fipi.ru/a</html>", "<html>https://ege.fipi.ru/b</html>"]
+        assert manager._browser.new_page.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_navigation_discards_shared_page(self, manager):
+        """After a navigation error the next request starts on a fresh page"""
+        await manager.get_page_content("https://ege.fipi.ru/a", timeout=5)
+        broken_page = manager._shared_page
+        broken_page.goto.side_effect = RuntimeError("net::ERR_TIMED_OUT")
+
+        with pytest.raises(RuntimeError):
+            await manager.get_page_content("https://ege.fipi.ru/b", timeout=5)
+
+        broken_page.close.assert_awaited_once()
+        assert manager._shared_page is None
+        assert await manager.get_page_content("https://ege.fipi.ru/c", timeout=5) == "<html>https://ege.fipi.ru/c</html>"
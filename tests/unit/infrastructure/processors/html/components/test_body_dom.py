@@ -0,0 +1,39 @@
+"""Tests for sharing the parsed block body between processors"""
+import pytest
+from src.infrastructure.processors.html.components.body_dom import parse_body, store_body
+from src.infrastructure.processors.html.input_field_remover import InputFieldRemover
+from src.infrastructure.processors.html.mathml_remover import MathMLRemover
+
+
+class TestBodyDom:
+    """Test suite for parse_body/store_body"""
+
+    def test_stored_dom_is_reused_while_body_html_is_unchanged(self):
+        """Test that the next processor gets the stored DOM instead of a new parse"""
+        raw_data = {"body_html": "<p>Text<math><mi>x</mi></math></p>"}
+        soup = parse_body(raw_data)
+        soup.find("math").decompose()
+
+        store_body(raw_data, soup)
+
+        assert raw_data["body_html"] == "<p>Text</p>"
+        assert parse_body(raw_data) is soup
+
+    def test_replaced_body_html_is_parsed_again(self):
+        """Test that a body_html replaced by someone else is not served from the stored DOM"""
+        raw_data = {"body_html": "<p>Old</p>"}
+        store_body(raw_data, parse_body(raw_data))
+
+        raw_data["body_html"] = "<p>New</p>"
+
+        assert parse_body(raw_data).get_text() == "New"
+
+    @pytest.mark.asyncio
+    async def test_processor_chain_produces_same_html(self):
+        """Test that chained processors give the same result as separate parses"""
+        raw_data = {"body_html": '<p>Q<math><mi>x</mi></math></p><input name="answer"/>'}
+
+        raw_data = await InputFieldRemover().process(raw_data, {})
+        raw_data = await MathMLRemover().process(raw_data, {})
+
+        assert raw_data["body_html"] == "<p>Q</p>"
@@ -47,3 +47,23 @@ class TestFileDownloader:
         
         assert len(result) == 1
         mock_downloader.download.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_download_reports_saved_files(self, downloader, tmp_path):
+        """Test on_asset_saved is called for every successfully saved file"""
+        mock_downloader = AsyncMock()
+        mock_downloader.download.side_effect = [True, False]
+        file_links = [("<a>link</a>", "file.pdf"), ("<a>link</a>", "missing.pdf")]
+        saved = []
+
+        await downloader.download_files(
+            file_links=file_links,
+            base_url="https://example.com",
+            download_dir=tmp_path,
+            files_prefix="assets/",
+            max_concurrent=3,
+            asset_downloader=mock_downloader,
+            on_asset_saved=saved.append
+        )
+
+        assert saved == [tmp_path / "assets" / "file.pdf"]
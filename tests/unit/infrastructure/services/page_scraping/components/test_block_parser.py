@@ -0,0 +1,33 @@
+"""Tests for BlockParser strategy selection"""
+from unittest.mock import MagicMock
+
+from src.infrastructure.services.page_scraping.components.block_parser import BlockParser
+
+
+class TestBlockParser:
+    """Test suite for BlockParser"""
+
+    def test_uses_primary_parser_when_configured(self):
+        """Test that a configured primary parser handles every page"""
+        primary_parser = MagicMock()
+        primary_parser.parse_blocks.return_value = [["block"]]
+
+        result = BlockParser(primary_parser).parse_html_blocks("<div></div>")
+
+        assert result == [["block"]]
+        primary_parser.parse_blocks.assert_called_once_with("<div></div>")
+
+    def test_falls_back_to_pure_transforms_without_primary_parser(self):
+        """Test that header/qblock pairs are extracted when no primary parser is set"""
+        html = '<div class="header-container" id="i111"></div><div class="qblock" id="q111"></div>'
+
+        blocks = BlockParser().parse_html_blocks(html)
+
+        assert [[el.get('id') for el in block] for block in blocks] == [["i111", "q111"]]
+
+    def test_returns_empty_list_when_parser_fails(self):
+        """Test that parser errors are logged and reported as no blocks"""
+        primary_parser = MagicMock()
+        primary_parser.parse_blocks.side_effect = ValueError("broken page")
+
+        assert BlockParser(primary_parser).parse_html_blocks("<div></div>") == []
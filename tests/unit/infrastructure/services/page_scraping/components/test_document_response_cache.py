@@ -0,0 +1,84 @@
+"""Tests for DocumentResponseCache using fake Playwright route objects"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.infrastructure.services.page_scraping.components.document_response_cache import DocumentResponseCache
+
+URL = "https://ege.fipi.ru/bank/questions.php?proj=P&page=0"
+
+
+def make_request(resource_type="document"):
+    return MagicMock(url=URL, method="GET", resource_type=resource_type, headers={"user-agent": "test"})
+
+
+def make_route(status, body=b"", headers=None):
+    response = MagicMock(status=status, headers=headers or {})
+    response.body = AsyncMock(return_value=body)
+    route = MagicMock()
+    route.fetch = AsyncMock(return_value=response)
+    route.fulfill = AsyncMock()
+    route.continue_ = AsyncMock()
+    route.abort = AsyncMock()
+    return route
+
+
+class TestDocumentResponseCache:
+    """Test suite for DocumentResponseCache"""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_document_is_served_from_cache(self, tmp_path):
+        """Test that a cached document is revalidated and a 304 is fulfilled from disk"""
+        cache = DocumentResponseCache(tmp_path)
+        headers = {"content-type": "text/html", "etag": '"v1"', "server": "nginx"}
+        await cache.handle_route(make_route(200, b"<html>v1</html>", headers), make_request())
+
+        route = make_route(304)
+        await cache.handle_route(route, make_request())
+
+        sent_headers = route.fetch.await_args.kwargs["headers"]
+        assert sent_headers["if-none-match"] == '"v1"'
+        route.fulfill.assert_awaited_once_with(
+            status=200, headers={"content-type": "text/html", "etag": '"v1"'}, body=b"<html>v1</html>"
+        )
+
+    @pytest.mark.asyncio
+    async def test_document_without_validators_is_not_cached(self, tmp_path):
+        """Test that responses without ETag/Last-Modified are passed through and not stored"""
+        cache = DocumentResponseCache(tmp_path)
+        route = make_route(200, b"<html></html>", {"content-type": "text/html"})
+
+        await cache.handle_route(route, make_request())
+
+        route.fulfill.assert_awaited_once()
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_non_document_requests_pass_through(self, tmp_path):
+        """Test that images and scripts are not intercepted"""
+        route = make_route(200)
+
+        await DocumentResponseCache(tmp_path).handle_route(route, make_request(resource_type="image"))
+
+        route.continue_.assert_awaited_once()
+        route.fetch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_passes_request_through(self, tmp_path):
+        """Test that a failed revalidation request falls back to continuing the original request"""
+        route = make_route(200)
+        route.fetch.side_effect = RuntimeError("net::ERR_CONNECTION_RESET")
+
+        await DocumentResponseCache(tmp_path).handle_route(route, make_request())
+
+        route.continue_.assert_awaited_once()
+        route.abort.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failure_after_fetch_aborts_request(self, tmp_path):
+        """Test that a failure while reading the fetched response aborts the route instead of leaving it pending"""
+        route = make_route(200)
+        route.fetch.return_value.body.side_effect = RuntimeError("Target page has been closed")
+
+        await DocumentResponseCache(tmp_path).handle_route(route, make_request())
+
+        route.abort.assert_awaited_once()
+        route.fulfill.assert_not_awaited()
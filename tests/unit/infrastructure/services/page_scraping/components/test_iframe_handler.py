@@ -1,7 +1,9 @@
 """Refactored tests for IframeHandler using fakes instead of mocks"""
 import pytest
+from unittest.mock import AsyncMock, MagicMock
 from bs4 import BeautifulSoup
 
+from src.domain.interfaces.scraping.i_iframe_handler import IframeContent
 from src.infrastructure.services.page_scraping.components.iframe_handler import IframeHandler
 from tests.fakes import FakeBrowserPage
 
@@ -87,6 +89,27 @@ class TestIframeHandlerRefactored:
         assert goto_calls[0]['url'] == "https://fipi.ru/iframe/content"
         assert goto_calls[0]['timeout'] == 30000
 
+    @pytest.mark.asyncio
+    async def test_handle_iframe_reads_already_loaded_frame(self, handler, fake_page, main_content_with_iframe, iframe_content):
+        """Test that an iframe loaded with the main page is read without navigating again"""
+        # Arrange
+        url = "https://fipi.ru/page1"
+        loaded_frame = MagicMock(url="https://fipi.ru/iframe/content")
+        loaded_frame.content = AsyncMock(return_value=iframe_content)
+        fake_page.main_frame = MagicMock(url=url)
+        fake_page.frames = [fake_page.main_frame, loaded_frame]
+        await fake_page.set_current_url(url)
+
+        # Act
+        actual_content, source_url = await handler.handle_iframe_content(
+            fake_page, url, 30, main_content_with_iframe
+        )
+
+        # Assert
+        assert actual_content == iframe_content
+        assert source_url == "https://fipi.ru/iframe/content"
+        assert len(fake_page.get_goto_calls()) == 0
+
     @pytest.mark.asyncio
     async def test_handle_iframe_without_src(self, handler, fake_page, main_content_with_iframe_no_src):
         """Test handling iframe without src attribute using fake"""
@@ -96,13 +119,14 @@ class TestIframeHandlerRefactored:
         await fake_page.set_current_url(url)
         
         # Act
-        actual_content, source_url = await handler.handle_iframe_content(
+        result = await handler.handle_iframe_content(
             fake_page, url, timeout, main_content_with_iframe_no_src
         )
         
         # Assert
-        assert actual_content == main_content_with_iframe_no_src
-        assert source_url == url
+        assert result == IframeContent(main_content_with_iframe_no_src, url)
+        assert result.content == main_content_with_iframe_no_src
+        assert result.source_url == url
         assert len(fake_page.get_goto_calls()) == 0
 
     @pytest.mark.asyncio
@@ -208,6 +232,22 @@ class TestIframeHandlerRefactored:
         # Assert
         assert iframe is None
 
+    @pytest.mark.asyncio
+    async def test_handle_iframe_ignores_other_iframes(self, handler, fake_page):
+        """Test that only the questions_container iframe triggers navigation"""
+        # Arrange
+        main_content = '<html><iframe id="banner" src="/ads"></iframe><div>Main content</div></html>'
+        url = "https://fipi.ru/page1"
+        await fake_page.set_current_url(url)
+
+        # Act
+        actual_content, source_url = await handler.handle_iframe_content(fake_page, url, 30, main_content)
+
+        # Assert
+        assert actual_content == main_content
+        assert source_url == url
+        assert len(fake_page.get_goto_calls()) == 0
+
     @pytest.mark.asyncio
     async def test_handle_iframe_preserves_original_content_on_error(self, handler, fake_page, main_content_with_iframe):
         """Test that original content is preserved when iframe handling fails using fake"""
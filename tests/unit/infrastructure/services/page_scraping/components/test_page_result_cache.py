@@ -0,0 +1,61 @@
+"""Tests for PageResultCache"""
+from datetime import datetime
+from src.domain.models.problem import Problem
+from src.infrastructure.services.page_scraping.components import page_result_cache
+from src.infrastructure.services.page_scraping.components.page_result_cache import PageResultCache
+
+URL = "https://ege.fipi.ru/bank/questions.php?proj=P&page=1"
+
+
+def make_problem():
+    return Problem(
+        problem_id="p1",
+        subject_name="Математика",
+        text="Найдите x",
+        source_url=URL,
+        task_number=5,
+        images=["assets/p1.png"],
+        created_at=datetime(2026, 1, 2, 3, 4, 5)
+    )
+
+
+class TestPageResultCache:
+    """Test suite for PageResultCache"""
+
+    def test_unchanged_content_returns_cached_problems(self, tmp_path):
+        """Test that problems round-trip for the same URL and content hash"""
+        cache = PageResultCache(tmp_path)
+        content_hash = cache.content_hash("<html>page</html>")
+        cache.store(URL, content_hash, [make_problem()])
+
+        problems = cache.load(URL, content_hash)
+
+        assert problems == [make_problem()]
+        assert problems[0].images == ["assets/p1.png"]
+        assert problems[0].created_at == datetime(2026, 1, 2, 3, 4, 5)
+
+    def test_changed_content_or_unknown_url_misses(self, tmp_path):
+        """Test that a different content hash or URL is not served from the cache"""
+        cache = PageResultCache(tmp_path)
+        cache.store(URL, cache.content_hash("<html>old</html>"), [make_problem()])
+
+        assert cache.load(URL, cache.content_hash("<html>new</html>")) is None
+        assert cache.load(URL + "0", cache.content_hash("<html>old</html>")) is None
+
+    def test_entry_from_older_extraction_version_misses(self, tmp_path, monkeypatch):
+        """Test that bumping the extraction version invalidates existing entries"""
+        cache = PageResultCache(tmp_path)
+        content_hash = cache.content_hash("<html>page</html>")
+        cache.store(URL, content_hash, [make_problem()])
+
+        monkeypatch.setattr(page_result_cache, "_CACHE_KEY_PREFIX", "v999:")
+
+        assert cache.load(URL, content_hash) is None
+
+    def test_expired_entry_misses(self, tmp_path):
+        """Test that entries older than ttl_seconds are ignored"""
+        cache = PageResultCache(tmp_path, ttl_seconds=-1)
+        content_hash = cache.content_hash("<html>page</html>")
+        cache.store(URL, content_hash, [make_problem()])
+
+        assert cache.load(URL, content_hash) is None